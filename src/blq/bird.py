@@ -16,7 +16,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import duckdb
 
@@ -26,8 +26,38 @@ BIRD_SCHEMA_VERSION = "2.0.0"
 # Storage thresholds
 DEFAULT_INLINE_THRESHOLD = 4096  # 4KB - outputs smaller than this are stored inline
 
+# Content hash digest size in bytes (64 hex chars)
+CONTENT_HASH_DIGEST_SIZE = 32
 
-@dataclass
+# Read size when streaming output from a file object into blob storage
+BLOB_CHUNK_SIZE = 64 * 1024
+
+
+def _new_content_hasher() -> hashlib.blake2b:
+    """Create the incremental hasher behind content-addressed blobs.
+
+    BLAKE2b is used because it is faster than SHA-256 on CPUs without SHA
+    extensions and ships with hashlib. The hash only identifies content, so
+    it is flagged as not used for security.
+    """
+    return hashlib.blake2b(digest_size=CONTENT_HASH_DIGEST_SIZE, usedforsecurity=False)
+
+
+def compute_content_hash(content: bytes | memoryview) -> str:
+    """Compute the content-address hash used for output dedup.
+
+    Args:
+        content: Raw bytes (or a byte memoryview) to hash
+
+    Returns:
+        Hex digest (64 chars)
+    """
+    hasher = _new_content_hasher()
+    hasher.update(content)
+    return hasher.hexdigest()
+
+
+@dataclass(slots=True)
 class SessionRecord:
     """A BIRD session (invoker context)."""
 
@@ -41,7 +71,7 @@ class SessionRecord:
     date: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d"))
 
 
-@dataclass
+@dataclass(slots=True)
 class InvocationRecord:
     """A BIRD invocation (command execution)."""
 
@@ -88,14 +118,14 @@ class InvocationRecord:
         return str(uuid.uuid4())
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputRecord:
     """A BIRD output (captured stdout/stderr)."""
 
     id: str  # UUID
     invocation_id: str
     stream: str  # 'stdout', 'stderr', 'combined'
-    content_hash: str  # BLAKE3 hash
+    content_hash: str  # BLAKE2b hash
     byte_length: int
     storage_type: str  # 'inline' or 'blob'
     storage_ref: str  # data: URI or file: path
@@ -103,7 +133,7 @@ class OutputRecord:
     date: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d"))
 
 
-@dataclass
+@dataclass(slots=True)
 class EventRecord:
     """A BIRD event (parsed diagnostic)."""
 
@@ -141,6 +171,50 @@ class EventRecord:
     date: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d"))
 
 
+# Per-event columns staged in a DataFrame by BirdStore.write_events(), with
+# the pandas dtype each is staged as. Explicit dtypes stop DuckDB inferring a
+# column's type from a sample of rows (e.g. a code that is numeric early on).
+_EVENT_BATCH_VIEW = "_blq_event_batch"
+_EVENT_BATCH_COLUMNS = {
+    "event_index": "Int64",
+    "event_type": "string",
+    "severity": "string",
+    "file_path": "string",
+    "line_number": "Int64",
+    "column_number": "Int64",
+    "message": "string",
+    "code": "string",
+    "rule": "string",
+    "tool_name": "string",
+    "category": "string",
+    "fingerprint": "string",
+    "log_line_start": "Int64",
+    "log_line_end": "Int64",
+    "context": "string",
+    "metadata": "string",
+}
+
+_INSERT_EVENTS_SQL = f"""
+    INSERT INTO events (
+        id, invocation_id, event_index, client_id, hostname,
+        event_type, severity, file_path, line_number, column_number,
+        message, code, rule, tool_name, category, fingerprint,
+        log_line_start, log_line_end, context, metadata,
+        format_used, date
+    )
+    SELECT
+        uuid(), $1, event_index::INTEGER, $2, $3,
+        event_type::VARCHAR, severity::VARCHAR, file_path::VARCHAR,
+        line_number::INTEGER, column_number::INTEGER,
+        message::VARCHAR, code::VARCHAR, rule::VARCHAR, tool_name::VARCHAR,
+        category::VARCHAR, fingerprint::VARCHAR,
+        log_line_start::INTEGER, log_line_end::INTEGER,
+        context::VARCHAR, metadata::JSON,
+        $4, $5
+    FROM {_EVENT_BATCH_VIEW}
+"""
+
+
 class BirdStore:
     """BIRD storage backend using DuckDB tables.
 
@@ -160,7 +234,11 @@ class BirdStore:
         store.write_events(inv_id, events)
     """
 
-    def __init__(self, lq_dir: Path, conn: duckdb.DuckDBPyConnection):
+    def __init__(
+        self,
+        lq_dir: Path,
+        conn: duckdb.DuckDBPyConnection,
+    ):
         """Initialize BirdStore.
 
         Args:
@@ -173,23 +251,39 @@ class BirdStore:
         self._inline_threshold = DEFAULT_INLINE_THRESHOLD
 
     @classmethod
-    def open(cls, lq_dir: Path | str) -> BirdStore:
+    def open(
+        cls,
+        lq_dir: Path | str,
+        config: dict[str, Any] | None = None,
+        read_only: bool = False,
+    ) -> BirdStore:
         """Open or create a BirdStore.
 
         Args:
             lq_dir: Path to .lq directory
+            config: Optional DuckDB settings passed to duckdb.connect(), e.g.
+                {"threads": 1, "checkpoint_threshold": "1TB"} for short-lived
+                databases that don't benefit from parallelism or checkpoints
+            read_only: Open an existing database for queries only. The schema
+                is not created or upgraded, so the database must already
+                have been initialized by a read-write open.
 
         Returns:
             BirdStore instance
         """
         lq_dir = Path(lq_dir)
         db_path = lq_dir / "blq.duckdb"
-
-        # Open database
-        conn = duckdb.connect(str(db_path))
+        # DuckDB shares one database instance between connections to the
+        # same file in a process, so concurrent stores see each other's writes
+        conn = duckdb.connect(str(db_path), read_only=read_only, config=config or {})
 
         # Initialize schema if needed
-        cls._ensure_schema(conn, lq_dir)
+        if not read_only:
+            try:
+                cls._ensure_schema(conn, lq_dir)
+            except BaseException:
+                conn.close()
+                raise
 
         return cls(lq_dir, conn)
 
@@ -227,6 +321,30 @@ class BirdStore:
 
     @staticmethod
     def _split_sql_statements(sql: str) -> list[str]:
+        """Split SQL into individual statements using DuckDB's parser.
+
+        duckdb.extract_statements() tokenizes the whole script in C++ and
+        understands comments, quoted strings, and nested semicolons. If the
+        script doesn't parse (e.g., it targets a newer DuckDB), fall back to
+        the comment-aware Python splitter so each statement can still be
+        attempted individually.
+
+        Returns list of non-empty statements.
+        """
+        try:
+            parsed = duckdb.extract_statements(sql)
+        except duckdb.Error:
+            return BirdStore._split_sql_statements_fallback(sql)
+
+        statements = []
+        for statement in parsed:
+            stmt = statement.query.strip().rstrip(";").strip()
+            if stmt:
+                statements.append(stmt)
+        return statements
+
+    @staticmethod
+    def _split_sql_statements_fallback(sql: str) -> list[str]:
         """Split SQL into individual statements, handling comments and semicolons.
 
         Simple parser that handles:
@@ -394,9 +512,7 @@ class BirdStore:
         Returns:
             Next sequential run number
         """
-        result = self._conn.execute(
-            "SELECT COUNT(*) FROM invocations"
-        ).fetchone()
+        result = self._conn.execute("SELECT COUNT(*) FROM invocations").fetchone()
         return (result[0] if result else 0) + 1
 
     # =========================================================================
@@ -407,7 +523,7 @@ class BirdStore:
         self,
         invocation_id: str,
         stream: str,
-        content: bytes,
+        content: bytes | memoryview | BinaryIO,
         content_type: str | None = None,
     ) -> OutputRecord:
         """Write output content, choosing inline or blob storage.
@@ -415,29 +531,47 @@ class BirdStore:
         Args:
             invocation_id: ID of the invocation
             stream: Stream name ('stdout', 'stderr', 'combined')
-            content: Raw output bytes
+            content: Raw output bytes, a buffer over them, or a binary file
+                object. File objects are hashed and copied to blob storage in
+                BLOB_CHUNK_SIZE pieces without being read into memory whole.
             content_type: Optional MIME type
 
         Returns:
             OutputRecord with storage details
         """
-        # Compute hash
-        content_hash = hashlib.blake2b(content, digest_size=32).hexdigest()
-        byte_length = len(content)
-
-        # Determine storage type
-        if byte_length < self._inline_threshold:
-            # Inline storage as data: URI
-            import base64
-
-            b64 = base64.b64encode(content).decode("ascii")
-            storage_type = "inline"
-            storage_ref = f"data:application/octet-stream;base64,{b64}"
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            data: memoryview | None = memoryview(content).cast("B")
         else:
-            # Blob storage
-            storage_path = self._write_blob(content_hash, content)
+            # Read just enough to tell whether the output fits inline
+            head = content.read(self._inline_threshold)
+            data = memoryview(head) if len(head) < self._inline_threshold else None
+
+        if data is None:
+            # Large stream: hash while copying into blob storage
+            content_hash, byte_length, storage_path = self._write_blob_stream(
+                head,
+                content,  # type: ignore[arg-type]
+            )
             storage_type = "blob"
             storage_ref = f"file:{storage_path}"
+        else:
+            # Compute hash
+            content_hash = compute_content_hash(data)
+            byte_length = data.nbytes
+
+            # Determine storage type
+            if byte_length < self._inline_threshold:
+                # Inline storage as data: URI
+                import base64
+
+                b64 = base64.b64encode(data).decode("ascii")
+                storage_type = "inline"
+                storage_ref = f"data:application/octet-stream;base64,{b64}"
+            else:
+                # Blob storage
+                storage_path = self._write_blob(content_hash, data)
+                storage_type = "blob"
+                storage_ref = f"file:{storage_path}"
 
         # Create record
         record = OutputRecord(
@@ -475,7 +609,16 @@ class BirdStore:
 
         return record
 
-    def _write_blob(self, content_hash: str, content: bytes) -> str:
+    def _blob_location(self, content_hash: str) -> tuple[Path, str]:
+        """Return (absolute path, path relative to the blob dir) for a hash."""
+        # Subdirectory based on first 2 chars of hash
+        subdir = content_hash[:2]
+        return (
+            self._blob_dir / subdir / f"{content_hash}.bin",
+            f"{subdir}/{content_hash}.bin",
+        )
+
+    def _write_blob(self, content_hash: str, content: bytes | memoryview) -> str:
         """Write content to blob storage.
 
         Args:
@@ -485,32 +628,75 @@ class BirdStore:
         Returns:
             Relative path to blob file
         """
-        # Create subdirectory based on first 2 chars of hash
-        subdir = content_hash[:2]
-        blob_subdir = self._blob_dir / subdir
-        blob_subdir.mkdir(parents=True, exist_ok=True)
-
-        # Write blob file
-        blob_path = blob_subdir / f"{content_hash}.bin"
-        relative_path = f"{subdir}/{content_hash}.bin"
+        blob_path, relative_path = self._blob_location(content_hash)
 
-        # Atomic write with temp file
-        temp_path = blob_subdir / f".tmp.{content_hash}.bin"
+        # Content-addressed: an existing blob already holds these bytes, so the
+        # dedup hit costs a single stat instead of mkdir + write + rename
         try:
-            temp_path.write_bytes(content)
-            temp_path.rename(blob_path)
-        except FileExistsError:
-            # Another process wrote the same blob - that's fine
-            temp_path.unlink(missing_ok=True)
+            os.stat(blob_path)
+        except FileNotFoundError:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Atomic write with temp file (per-process name avoids clobbering
+            # a concurrent writer's temp file)
+            temp_path = blob_path.parent / f".tmp.{os.getpid()}.{content_hash}.bin"
+            try:
+                temp_path.write_bytes(content)
+                temp_path.rename(blob_path)
+            except FileExistsError:
+                # Another process wrote the same blob - that's fine
+                temp_path.unlink(missing_ok=True)
 
         # Update blob registry
         self._register_blob(content_hash, len(content), relative_path)
 
         return relative_path
 
-    def _register_blob(
-        self, content_hash: str, byte_length: int, storage_path: str
-    ) -> None:
+    def _write_blob_stream(self, head: bytes, stream: BinaryIO) -> tuple[str, int, str]:
+        """Copy a stream into blob storage, hashing it on the way.
+
+        The hash isn't known until the end, so the content goes to a temp
+        file first and is renamed into place (or dropped, if the blob
+        already exists).
+
+        Args:
+            head: Bytes already read from the stream
+            stream: Binary file object positioned after head
+
+        Returns:
+            Tuple of (content_hash, byte_length, relative blob path)
+        """
+        hasher = _new_content_hasher()
+        byte_length = 0
+
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = self._blob_dir / f".tmp.{os.getpid()}.{uuid.uuid4().hex}.bin"
+        try:
+            with open(temp_path, "wb") as out:
+                chunk = head
+                while chunk:
+                    hasher.update(chunk)
+                    out.write(chunk)
+                    byte_length += len(chunk)
+                    chunk = stream.read(BLOB_CHUNK_SIZE)
+
+            content_hash = hasher.hexdigest()
+            blob_path, relative_path = self._blob_location(content_hash)
+            if blob_path.exists():
+                temp_path.unlink()
+            else:
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path.replace(blob_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        # Update blob registry
+        self._register_blob(content_hash, byte_length, relative_path)
+
+        return content_hash, byte_length, relative_path
+
+    def _register_blob(self, content_hash: str, byte_length: int, storage_path: str) -> None:
         """Register or update blob in registry."""
         try:
             # Try insert
@@ -561,45 +747,47 @@ class BirdStore:
 
         date = datetime.now().strftime("%Y-%m-%d")
 
-        for idx, event in enumerate(events):
-            event_id = str(uuid.uuid4())
-
+        rows = [
+            (
+                event.get("event_id", idx),  # Use event_id if provided
+                event.get("event_type"),
+                event.get("severity"),
+                event.get("file_path"),
+                event.get("line_number"),
+                event.get("column_number"),
+                event.get("message"),
+                event.get("error_code") or event.get("code"),
+                event.get("rule"),
+                event.get("tool_name"),
+                event.get("category"),
+                event.get("fingerprint"),
+                event.get("log_line_start"),
+                event.get("log_line_end"),
+                event.get("context"),
+                json.dumps(event.get("metadata")) if event.get("metadata") else None,
+            )
+            for idx, event in enumerate(events)
+        ]
+        import pandas as pd  # type: ignore[import-untyped]
+
+        df = pd.DataFrame(rows, columns=list(_EVENT_BATCH_COLUMNS), dtype=object)
+        for column, dtype in _EVENT_BATCH_COLUMNS.items():
+            values = df[column]
+            if dtype == "Int64":
+                # Accept numeric strings as before; None stays NULL (pd.NA)
+                values = pd.to_numeric(values)
+            df[column] = values.astype(dtype)
+
+        # Insert the whole batch with one statement; DuckDB scans the
+        # DataFrame directly instead of binding one INSERT per event
+        self._conn.register(_EVENT_BATCH_VIEW, df)
+        try:
             self._conn.execute(
-                """
-                INSERT INTO events (
-                    id, invocation_id, event_index, client_id, hostname,
-                    event_type, severity, file_path, line_number, column_number,
-                    message, code, rule, tool_name, category, fingerprint,
-                    log_line_start, log_line_end, context, metadata,
-                    format_used, date
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    event_id,
-                    invocation_id,
-                    event.get("event_id", idx),  # Use event_id if provided
-                    client_id,
-                    hostname,
-                    event.get("event_type"),
-                    event.get("severity"),
-                    event.get("file_path"),
-                    event.get("line_number"),
-                    event.get("column_number"),
-                    event.get("message"),
-                    event.get("error_code") or event.get("code"),
-                    event.get("rule"),
-                    event.get("tool_name"),
-                    event.get("category"),
-                    event.get("fingerprint"),
-                    event.get("log_line_start"),
-                    event.get("log_line_end"),
-                    event.get("context"),
-                    json.dumps(event.get("metadata")) if event.get("metadata") else None,
-                    format_used,
-                    date,
-                ],
+                _INSERT_EVENTS_SQL,
+                [invocation_id, client_id, hostname, format_used, date],
             )
+        finally:
+            self._conn.unregister(_EVENT_BATCH_VIEW)
 
         return len(events)
 
@@ -638,8 +826,14 @@ class BirdStore:
         ).fetchall()
 
         columns = [
-            "id", "session_id", "timestamp", "duration_ms", "cmd", "exit_code",
-            "source_name", "source_type"
+            "id",
+            "session_id",
+            "timestamp",
+            "duration_ms",
+            "cmd",
+            "exit_code",
+            "source_name",
+            "source_type",
         ]
         return [dict(zip(columns, row)) for row in result]
 
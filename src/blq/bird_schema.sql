@@ -110,7 +110,7 @@ CREATE TABLE IF NOT EXISTS outputs (
     stream            VARCHAR NOT NULL,                 -- 'stdout', 'stderr', 'combined'
 
     -- Content identification
-    content_hash      VARCHAR NOT NULL,                 -- BLAKE3 hash (hex, 64 chars)
+    content_hash      VARCHAR NOT NULL,                 -- BLAKE2b hash (hex, 64 chars)
     byte_length       BIGINT NOT NULL,
 
     -- Storage location (polymorphic)
@@ -167,7 +167,7 @@ CREATE TABLE IF NOT EXISTS events (
 
 -- Blob registry: tracks content-addressed blobs for deduplication
 CREATE TABLE IF NOT EXISTS blob_registry (
-    content_hash      VARCHAR PRIMARY KEY,              -- BLAKE3 hash (hex)
+    content_hash      VARCHAR PRIMARY KEY,              -- BLAKE2b hash (hex)
     byte_length       BIGINT NOT NULL,
     compression       VARCHAR DEFAULT 'none',           -- 'none', 'gzip', 'zstd'
     ref_count         INTEGER DEFAULT 1,
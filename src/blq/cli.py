@@ -327,8 +327,8 @@ def main() -> None:
 
     # import
     p_import = subparsers.add_parser("import", help="Import existing log file")
-    p_import.add_argument("file", help="Log file to import")
-    p_import.add_argument("--name", "-n", help="Source name (default: filename)")
+    p_import.add_argument("file", nargs="+", help="Log file(s) to import")
+    p_import.add_argument("--name", "-n", help="Source name (default: filename; single file only)")
     p_import.add_argument("--format", "-f", default="auto", help="Parse format hint")
     p_import.set_defaults(func=cmd_import)
 
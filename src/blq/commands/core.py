@@ -7,22 +7,29 @@ that are shared across multiple commands.
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import duckdb
-import pandas as pd  # type: ignore[import-untyped]
-import yaml  # type: ignore[import-untyped]
+
+try:
+    import orjson
+except ImportError:  # optional: pip install blq-cli[fast]
+    orjson = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from blq.query import LogStore
 
 # ============================================================================
@@ -40,12 +47,64 @@ GLOBAL_LQ_DIR = Path.home() / ".lq"
 PROJECTS_DIR = "projects"
 GLOBAL_PROJECTS_PATH = GLOBAL_LQ_DIR / PROJECTS_DIR
 
+# ============================================================================
+# JSON Output
+# ============================================================================
+
+
+_ORJSON_OPTIONS = (
+    (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+    if orjson is not None
+    else 0
+)
+
+
+def dumps_json(data: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize data as indented JSON for command output.
+
+    Uses orjson when installed, falling back to the stdlib encoder. Both
+    produce two-space indented output; datetimes go through ``default``
+    in either case so the rendering doesn't depend on which is used.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=default, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+    return json.dumps(data, indent=2, default=default)
+
+
+def dumps_json_bytes(data: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Like dumps_json, but UTF-8 bytes ready for ``sys.stdout.buffer``.
+
+    orjson produces bytes natively, so this skips its decode and the
+    re-encode on write.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=default).encode()
+
+
+def _dataclass_to_dict(obj: Any) -> dict[str, Any]:
+    """``default`` hook for dumps_json when data holds dataclass instances.
+
+    orjson serializes dataclasses natively without calling this; the stdlib
+    fallback converts them with asdict, giving the same output.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 # ============================================================================
 # Result Types
 # ============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EventRef:
     """Reference to a specific event within a run."""
 
@@ -58,13 +117,19 @@ class EventRef:
     @classmethod
     def parse(cls, ref: str) -> EventRef:
         """Parse a reference string like '5:3' into an EventRef."""
-        parts = ref.split(":")
-        if len(parts) != 2:
-            raise ValueError(f"Invalid event reference: {ref}. Expected format: run_id:event_id")
-        return cls(run_id=int(parts[0]), event_id=int(parts[1]))
+        return _parse_event_ref(ref)
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _parse_event_ref(ref: str) -> EventRef:
+    """Memoized parse for EventRef.parse() (instances are immutable)."""
+    if ref.count(":") != 1:
+        raise ValueError(f"Invalid event reference: {ref}. Expected format: run_id:event_id")
+    run_id, event_id = ref.split(":")
+    return EventRef(run_id=int(run_id), event_id=int(event_id))
+
+
+@dataclass(slots=True)
 class EventSummary:
     """Summary of a parsed event for structured output."""
 
@@ -86,15 +151,14 @@ class EventSummary:
         """Format as file:line:col string."""
         if not self.file_path:
             return "?"
-        loc = self.file_path
-        if self.line_number is not None:
-            loc += f":{self.line_number}"
-            if self.column_number and self.column_number > 0:
-                loc += f":{self.column_number}"
-        return loc
+        if self.line_number is None:
+            return self.file_path
+        if self.column_number and self.column_number > 0:
+            return f"{self.file_path}:{self.line_number}:{self.column_number}"
+        return f"{self.file_path}:{self.line_number}"
 
 
-@dataclass
+@dataclass(slots=True)
 class RunResult:
     """Structured result from running a command."""
 
@@ -113,7 +177,15 @@ class RunResult:
 
     def to_json(self, include_warnings: bool = False) -> str:
         """Convert to JSON string."""
-        data = {
+        return dumps_json(self._json_data(include_warnings), default=_dataclass_to_dict)
+
+    def to_json_bytes(self, include_warnings: bool = False) -> bytes:
+        """Convert to UTF-8 encoded JSON, for writing straight to a binary stream."""
+        return dumps_json_bytes(self._json_data(include_warnings), default=_dataclass_to_dict)
+
+    def _json_data(self, include_warnings: bool) -> dict[str, Any]:
+        """Fields included in the JSON output."""
+        data: dict[str, Any] = {
             "run_id": self.run_id,
             "command": self.command,
             "status": self.status,
@@ -122,13 +194,13 @@ class RunResult:
             "completed_at": self.completed_at,
             "duration_sec": round(self.duration_sec, 3),
             "summary": self.summary,
-            "errors": [asdict(e) for e in self.errors],
+            "errors": self.errors,
         }
         if include_warnings:
-            data["warnings"] = [asdict(w) for w in self.warnings]
+            data["warnings"] = self.warnings
         if self.output_stats:
             data["output_stats"] = self.output_stats
-        return json.dumps(data, indent=2)
+        return data
 
     def to_markdown(self, include_warnings: bool = False) -> str:
         """Convert to markdown summary."""
@@ -256,7 +328,7 @@ def _extract_provider_from_host(host: str) -> str:
         return host.replace(".", "_").replace(":", "_")
 
 
-def detect_project_info() -> ProjectInfo:
+def detect_project_info(cwd: Path | None = None) -> ProjectInfo:
     """Detect project namespace and name from git remote or filesystem path.
 
     Detection order:
@@ -275,9 +347,15 @@ def detect_project_info() -> ProjectInfo:
     Filesystem fallback:
     - /home/teague/Projects/myapp → namespace=local__home__teague__Projects, project=myapp
 
+    Args:
+        cwd: Project directory to inspect (default: current directory)
+
     Returns:
         ProjectInfo with namespace and project.
     """
+    if cwd is None:
+        cwd = Path.cwd()
+
     # Try git remote first
     try:
         result = subprocess.run(
@@ -285,6 +363,7 @@ def detect_project_info() -> ProjectInfo:
             capture_output=True,
             text=True,
             timeout=5,
+            cwd=cwd,
         )
         if result.returncode == 0:
             url = result.stdout.strip()
@@ -325,7 +404,6 @@ def detect_project_info() -> ProjectInfo:
         pass
 
     # Fallback to filesystem path
-    cwd = Path.cwd()
     project = cwd.name
     # Tokenize parent path: /home/teague/Projects → local__home__teague__Projects
     parent = str(cwd.parent).lstrip("/")
@@ -365,6 +443,84 @@ class WatchConfig:
 # ============================================================================
 
 
+def yaml_load(stream: Any) -> Any:
+    """Parse YAML, using libyaml's parser when PyYAML was built with it.
+
+    yaml is imported on first use rather than at module level, so paths
+    that never read a YAML file (e.g. ``blq --help``) skip its import.
+    """
+    import yaml  # type: ignore[import-untyped]
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def yaml_dump(data: Any) -> str:
+    """Serialize to block-style YAML, using libyaml's emitter when available."""
+    import yaml  # type: ignore[import-untyped]
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False, sort_keys=False)
+
+
+# Parsed YAML files keyed by absolute path: (st_mtime_ns, st_size, data).
+# config.yaml and commands.yaml are read many times per process but rarely
+# change, so a reload only re-parses when the file's stat changes.
+_YAML_CACHE: dict[str, tuple[int, int, Any]] = {}
+
+
+def _read_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous parse if the file is unchanged.
+
+    Args:
+        path: YAML file to read
+
+    Returns:
+        Parsed data ({} for an empty file), or None if the file doesn't exist.
+        Callers get their own copy and may modify it.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    key = os.path.abspath(path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+
+    with open(path) as f:
+        data = yaml_load(f) or {}
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+
+def _write_yaml(path: Path, data: Any) -> None:
+    """Write data to a YAML file and drop any cached parse of it.
+
+    Unchanged content is not rewritten. Otherwise the file is replaced
+    atomically, so readers never see a partial write.
+    """
+    text = yaml_dump(data)
+    new_bytes = text.encode()
+    try:
+        with open(path, "rb") as f:
+            if f.read() == new_bytes:
+                return
+    except FileNotFoundError:
+        pass
+
+    _YAML_CACHE.pop(os.path.abspath(path), None)
+    # Per-process temp name beside the target; created with the usual umask
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(new_bytes)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 @dataclass
 class BlqConfig:
     """Unified configuration for blq.
@@ -470,9 +626,8 @@ class BlqConfig:
         """
         if self._hooks_config is None:
             # Load from config.yaml
-            if self.config_path.exists():
-                with open(self.config_path) as f:
-                    data = yaml.safe_load(f) or {}
+            data = _read_yaml_cached(self.config_path)
+            if data is not None:
                 self._hooks_config = data.get("hooks", {})
             else:
                 self._hooks_config = {}
@@ -487,9 +642,8 @@ class BlqConfig:
         """
         if self._watch_config is None:
             # Load from config.yaml
-            if self.config_path.exists():
-                with open(self.config_path) as f:
-                    data = yaml.safe_load(f) or {}
+            data = _read_yaml_cached(self.config_path)
+            if data is not None:
                 watch_data = data.get("watch", {})
                 self._watch_config = WatchConfig(
                     debounce_ms=watch_data.get("debounce_ms", 500),
@@ -523,16 +677,8 @@ class BlqConfig:
         Returns:
             BlqConfig if found, None otherwise.
         """
-        if start_dir is None:
-            start_dir = Path.cwd()
-
-        # Search current directory and parents
-        for p in [start_dir, *list(start_dir.parents)]:
-            lq_path = p / LQ_DIR
-            if lq_path.exists() and lq_path.is_dir():
-                return cls.load(lq_path)
-
-        return None
+        lq_path = _find_lq_dir(start_dir if start_dir is not None else Path.cwd())
+        return cls.load(lq_path) if lq_path is not None else None
 
     @classmethod
     def load(cls, lq_dir: Path) -> BlqConfig:
@@ -553,10 +699,8 @@ class BlqConfig:
         storage_mode = "parquet"  # Default to v1 mode for backward compatibility
 
         # Load from config.yaml if it exists
-        if config_path.exists():
-            with open(config_path) as f:
-                data = yaml.safe_load(f) or {}
-
+        data = _read_yaml_cached(config_path)
+        if data is not None:
             # Load capture_env
             loaded_env = data.get("capture_env")
             if isinstance(loaded_env, list):
@@ -621,8 +765,7 @@ class BlqConfig:
         if self._hooks_config:
             data["hooks"] = self._hooks_config
 
-        with open(self.config_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        _write_yaml(self.config_path, data)
 
     def save_commands(self) -> None:
         """Save commands to commands.yaml."""
@@ -747,8 +890,13 @@ class RegisteredCommand:
             d["capture_env"] = self.capture_env
         return d
 
+    @cached_property
+    def placeholders(self) -> list[CommandPlaceholder]:
+        """Placeholders in the command template, parsed on first access."""
+        return parse_placeholders(self.cmd)
 
-@dataclass
+
+@dataclass(frozen=True)
 class CommandPlaceholder:
     """A placeholder in a command template.
 
@@ -778,6 +926,12 @@ def parse_placeholders(template: str) -> list[CommandPlaceholder]:
     Returns:
         List of CommandPlaceholder in template order
     """
+    return list(_parse_placeholders_cached(template))
+
+
+@lru_cache(maxsize=256)
+def _parse_placeholders_cached(template: str) -> tuple[CommandPlaceholder, ...]:
+    """Memoized parse for parse_placeholders() (templates repeat often)."""
     placeholders = []
     for match in _PLACEHOLDER_PATTERN.finditer(template):
         name = match.group(1)
@@ -798,11 +952,11 @@ def parse_placeholders(template: str) -> list[CommandPlaceholder]:
             default = match.group(4) if match.group(4) is not None else ""
             placeholders.append(CommandPlaceholder(name=name, default=default, positional=False))
 
-    return placeholders
+    return tuple(placeholders)
 
 
 def expand_command(
-    template: str,
+    template: str | RegisteredCommand,
     named_args: dict[str, str],
     positional_args: list[str],
     extra_args: list[str] | None = None,
@@ -810,7 +964,8 @@ def expand_command(
     """Expand a command template with provided arguments.
 
     Args:
-        template: Command template with placeholders
+        template: Command template with placeholders, or a registered
+            command (whose parsed placeholders are reused)
         named_args: Arguments provided as key=value
         positional_args: Arguments provided positionally
         extra_args: Extra arguments to append (passthrough)
@@ -821,15 +976,19 @@ def expand_command(
     Raises:
         ValueError: If required argument is missing
     """
-    placeholders = parse_placeholders(template)
+    if isinstance(template, RegisteredCommand):
+        placeholders = template.placeholders
+        template = template.cmd
+    else:
+        placeholders = parse_placeholders(template)
 
     # Build map of placeholder values
     values: dict[str, str] = {}
 
     # First, fill from named args
+    placeholder_names = {p.name for p in placeholders}
     for name, value in named_args.items():
         # Check if this is a valid placeholder name
-        placeholder_names = {p.name for p in placeholders}
         if name not in placeholder_names:
             valid_args = ", ".join(sorted(placeholder_names))
             raise ValueError(f"Unknown argument '{name}'. Valid arguments: {valid_args}")
@@ -857,11 +1016,8 @@ def expand_command(
             else:
                 raise ValueError(f"Missing required argument '{placeholder.name}'")
 
-    # Substitute placeholders in template
-    result = template
-    for match in _PLACEHOLDER_PATTERN.finditer(template):
-        name = match.group(1)
-        result = result.replace(match.group(0), values[name], 1)
+    # Substitute placeholders in template (single pass over the template)
+    result = _PLACEHOLDER_PATTERN.sub(lambda match: values[match.group(1)], template)
 
     # Append extra args
     all_extra = remaining_positional + (extra_args or [])
@@ -880,7 +1036,7 @@ def format_command_help(cmd: RegisteredCommand) -> str:
     Returns:
         Formatted help string
     """
-    placeholders = parse_placeholders(cmd.cmd)
+    placeholders = cmd.placeholders
     lines = [f"{cmd.name}: {cmd.cmd}"]
 
     if cmd.description:
@@ -901,13 +1057,10 @@ def format_command_help(cmd: RegisteredCommand) -> str:
 
 def _load_commands_impl(lq_dir: Path) -> dict[str, RegisteredCommand]:
     """Internal implementation of load_commands."""
-    commands_path = lq_dir / COMMANDS_FILE
-    if not commands_path.exists():
+    data = _read_yaml_cached(lq_dir / COMMANDS_FILE)
+    if data is None:
         return {}
 
-    with open(commands_path) as f:
-        data = yaml.safe_load(f) or {}
-
     commands = {}
     for name, config in data.get("commands", {}).items():
         if isinstance(config, str):
@@ -934,8 +1087,7 @@ def _save_commands_impl(lq_dir: Path, commands: dict[str, RegisteredCommand]) ->
     """Internal implementation of save_commands."""
     commands_path = lq_dir / COMMANDS_FILE
     data = {"commands": {name: cmd.to_dict() for name, cmd in commands.items()}}
-    with open(commands_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    _write_yaml(commands_path, data)
 
 
 # ============================================================================
@@ -943,19 +1095,38 @@ def _save_commands_impl(lq_dir: Path, commands: dict[str, RegisteredCommand]) ->
 # ============================================================================
 
 
-def get_lq_dir() -> Path | None:
-    """Find .lq directory in current or parent directories.
+def _find_lq_dir(start_dir: Path) -> Path | None:
+    """Find the nearest .lq directory in start_dir or its parents.
 
-    Returns None if no .lq directory is found.
+    Each level costs a single stat() (os.path.isdir is False for missing
+    paths, so no separate existence check is needed).
     """
-    cwd = Path.cwd()
-    for p in [cwd, *list(cwd.parents)]:
+    for p in (start_dir, *start_dir.parents):
         lq_path = p / LQ_DIR
-        if lq_path.exists():
+        if os.path.isdir(lq_path):
             return lq_path
     return None
 
 
+def get_lq_dir(start_dir: Path | None = None) -> Path | None:
+    """Find .lq directory in current or parent directories.
+
+    Args:
+        start_dir: Directory to start searching from (default: cwd). Callers
+            that already know the working directory can pass it to skip
+            another getcwd().
+
+    Returns None if no .lq directory is found.
+    """
+    return _find_lq_dir(start_dir if start_dir is not None else Path.cwd())
+
+
+# Matches the schema.sql statement defining blq_base_path()
+_BASE_PATH_MACRO_PATTERN = re.compile(
+    r"CREATE\s+(?:OR\s+REPLACE\s+)?MACRO\s+blq_base_path\s*\(", re.IGNORECASE
+)
+
+
 class ConnectionFactory:
     """Factory for creating properly initialized DuckDB connections.
 
@@ -969,19 +1140,35 @@ class ConnectionFactory:
 
     @classmethod
     def check_duck_hunt(cls, conn: duckdb.DuckDBPyConnection) -> bool:
-        """Check if duck_hunt is available (cached)."""
-        if cls._duck_hunt_available is None:
-            try:
-                conn.execute("LOAD duck_hunt")
-                cls._duck_hunt_available = True
-            except duckdb.Error:
-                cls._duck_hunt_available = False
-        return cls._duck_hunt_available
+        """Check if duck_hunt is available (cached once loaded)."""
+        if cls._duck_hunt_available:
+            return True
+        return cls._load_duck_hunt(conn)
+
+    @classmethod
+    def _load_duck_hunt(cls, conn: duckdb.DuckDBPyConnection) -> bool:
+        """Load duck_hunt into conn, recording a successful load for the process.
+
+        A failed LOAD is not remembered, so an extension installed later (e.g.
+        by ``blq init`` in another process) is picked up by the next
+        connection. Only a failed install_duck_hunt() marks it missing.
+        """
+        if cls._duck_hunt_available is False:
+            return False
+        try:
+            conn.execute("LOAD duck_hunt")
+        except duckdb.Error:
+            return False
+        cls._duck_hunt_available = True
+        return True
 
     @classmethod
     def install_duck_hunt(cls, conn: duckdb.DuckDBPyConnection) -> bool:
         """Install duck_hunt extension from community repo.
 
+        This is the only place the extension is marked missing, and a later
+        successful install clears that again.
+
         Returns True if successful, False otherwise.
         """
         try:
@@ -1024,10 +1211,7 @@ class ConnectionFactory:
                 logs_path = (lq_dir / LOGS_DIR).resolve()
                 conn.execute(f"CREATE OR REPLACE MACRO blq_base_path() AS '{logs_path}'")
                 # Handle duck_hunt loading
-                try:
-                    conn.execute("LOAD duck_hunt")
-                    cls._duck_hunt_available = True
-                except duckdb.Error:
+                if not cls._load_duck_hunt(conn):
                     if install_duck_hunt:
                         cls.install_duck_hunt(conn)
                     elif require_duck_hunt:
@@ -1041,12 +1225,8 @@ class ConnectionFactory:
         conn = duckdb.connect(":memory:")
 
         # Handle duck_hunt loading
-        duck_hunt_loaded = False
-        try:
-            conn.execute("LOAD duck_hunt")
-            duck_hunt_loaded = True
-            cls._duck_hunt_available = True
-        except duckdb.Error:
+        duck_hunt_loaded = cls._load_duck_hunt(conn)
+        if not duck_hunt_loaded:
             if install_duck_hunt:
                 duck_hunt_loaded = cls.install_duck_hunt(conn)
 
@@ -1079,11 +1259,8 @@ class ConnectionFactory:
                 if not stmt:
                     continue
                 # Skip the blq_base_path definition since we already set it with absolute path
-                if (
-                    "blq_base_path()" in stmt
-                    and "CREATE" in stmt.upper()
-                    and "MACRO" in stmt.upper()
-                ):
+                # (only that macro: others merely call blq_base_path())
+                if _BASE_PATH_MACRO_PATTERN.search(stmt):
                     continue
                 # Skip pure comment blocks
                 lines = [
@@ -1100,6 +1277,13 @@ class ConnectionFactory:
                     pass
 
 
+# Low-cardinality event fields (a few severities, a handful of files per run)
+_INTERNED_EVENT_FIELDS = frozenset({"severity", "file_path"})
+
+# In-memory connection with duck_hunt loaded, shared by parse_log_content()
+_PARSE_CONN: duckdb.DuckDBPyConnection | None = None
+
+
 def get_connection(lq_dir: Path | None = None) -> duckdb.DuckDBPyConnection:
     """Get a DuckDB connection with schema loaded.
 
@@ -1163,19 +1347,27 @@ def get_store_for_args(args) -> LogStore:
         return LogStore(config.lq_dir)
 
 
+# Run ID prefix of a parquet file name, e.g. "007_build_143022.parquet"
+_RUN_FILE_PATTERN = re.compile(r"(\d+)(?:_[^/]*)?\.parquet")
+
+
 def get_next_run_id(lq_dir: Path) -> int:
     """Get next run ID by scanning existing files."""
-    logs_dir = lq_dir / LOGS_DIR
-    if not logs_dir.exists():
-        return 1
-
     max_id = 0
-    for f in logs_dir.rglob("*.parquet"):
+    stack = [os.fspath(lq_dir / LOGS_DIR)]
+    while stack:
         try:
-            run_id = int(f.stem.split("_")[0])
-            max_id = max(max_id, run_id)
-        except (ValueError, IndexError):
-            pass
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                match = _RUN_FILE_PATTERN.fullmatch(entry.name)
+                if match:
+                    max_id = max(max_id, int(match.group(1)))
     return max_id + 1
 
 
@@ -1234,75 +1426,75 @@ PARQUET_SCHEMA = [
 PARQUET_SCHEMA_COLUMNS = [col for col, _ in PARQUET_SCHEMA]
 
 
-def write_run_parquet(
-    events: list[dict[str, Any]],
-    run_meta: dict[str, Any],
-    lq_dir: Path,
-) -> Path:
-    """Write events to a Hive-partitioned parquet file.
+# Columns that should be stored as MAP(VARCHAR, VARCHAR)
+_PARQUET_MAP_COLUMNS = {"environment", "ci"}
 
-    Always writes all schema columns for consistency, even if values are None.
+
+# Projection casting every column to its PARQUET_SCHEMA type, so the file
+# schema is pinned even when values are NULL (MAP columns are parsed from
+# their JSON text)
+_PARQUET_PROJECTION = ", ".join(
+    f"{col}::JSON::{sql_type} AS {col}"
+    if col in _PARQUET_MAP_COLUMNS
+    else f"{col}::{sql_type} AS {col}"
+    for col, sql_type in PARQUET_SCHEMA
+)
+
+
+def _parquet_columns(
+    events: list[dict[str, Any]], run_meta: dict[str, Any]
+) -> dict[str, list[Any]]:
+    """Build column-oriented data for every PARQUET_SCHEMA column.
+
+    Each event is merged over run_meta (event keys win). A run without
+    events still gets a single row carrying its metadata.
     """
-    # Determine partition path
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    time_str = datetime.now().strftime("%H%M%S")
-    source_type = run_meta.get("source_type", "run")
-    run_id = run_meta["run_id"]
-    name = run_meta.get("source_name", "unknown")
-    # Sanitize name for filename
-    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)[:50]
 
-    partition_dir = lq_dir / LOGS_DIR / f"date={date_str}" / f"source={source_type}"
-    partition_dir.mkdir(parents=True, exist_ok=True)
+    map_json: dict[int, str] = {}
+
+    def dict_to_map_json(d: dict) -> str:
+        """Encode a dict as a JSON object of strings, once per distinct dict."""
+        encoded = map_json.get(id(d))
+        if encoded is None:
+            encoded = json.dumps({str(k): str(v) for k, v in d.items()})
+            map_json[id(d)] = encoded
+        return encoded
+
+    events = events or [{}]
+    columns: dict[str, list[Any]] = {}
+    for col in PARQUET_SCHEMA_COLUMNS:
+        default = run_meta.get(col)
+        if not any(col in event for event in events):
+            # Run-level (or absent) column: same value on every row
+            values = [default] * len(events)
+        else:
+            values = [event.get(col, default) for event in events]
+        # Convert dict columns to JSON text for MAP
+        if col in _PARQUET_MAP_COLUMNS:
+            values = [dict_to_map_json(v) if isinstance(v, dict) else v for v in values]
+        columns[col] = values
+    return columns
 
-    filename = f"{run_id:03d}_{safe_name}_{time_str}.parquet"
-    filepath = partition_dir / filename
 
-    # Columns that should be stored as MAP(VARCHAR, VARCHAR)
-    map_columns = {"environment", "ci"}
-
-    def dict_to_map_entries(d: dict | None) -> list | None:
-        """Convert dict to list of {key, value} structs for DuckDB MAP creation."""
-        if d is None:
-            return None
-        return [{"key": str(k), "value": str(v)} for k, v in d.items()]
-
-    # Build enriched events with all schema columns
-    enriched_events = []
-    for event in events or [{}]:
-        # Merge run metadata and event data (run_meta first, then event overrides)
-        merged = {**run_meta, **event}
-        # Build row with all columns in canonical order (None for missing)
-        enriched = {}
-        for col in PARQUET_SCHEMA_COLUMNS:
-            val = merged.get(col)
-            # Convert dict columns to list format for MAP
-            if col in map_columns and isinstance(val, dict):
-                val = dict_to_map_entries(val)
-            enriched[col] = val
-        enriched_events.append(enriched)
+def _write_parquet_columns(columns: dict[str, list[Any]], filepath: Path) -> None:
+    """Write schema columns to a single parquet file with explicit column types."""
+    import pandas as pd  # type: ignore[import-untyped]
 
     # Write using DuckDB relation API with explicit type casting
     conn = duckdb.connect(":memory:")
-    df = pd.DataFrame(enriched_events, columns=PARQUET_SCHEMA_COLUMNS)
+    # Object columns keep the Python values as given (nullable ints don't
+    # round-trip through float64); the projection below casts each column to
+    # its PARQUET_SCHEMA type, coercing e.g. 3.5 -> 4 or "true" -> TRUE
+    df = pd.DataFrame(
+        {col: pd.Series(columns[col], dtype=object) for col in PARQUET_SCHEMA_COLUMNS}
+    )
 
     # Create relation from dataframe
     rel = conn.from_df(df)
 
-    # Build projection expressions with explicit type casts
-    # This ensures consistent schema even when values are NULL
-    projections = []
-    for col, sql_type in PARQUET_SCHEMA:
-        if col in map_columns:
-            # MAP columns need map_from_entries conversion
-            projections.append(f"map_from_entries({col})::MAP(VARCHAR, VARCHAR) AS {col}")
-        else:
-            # Cast all other columns to their explicit types
-            projections.append(f"{col}::{sql_type} AS {col}")
-
     # Apply projection and write to parquet with zstd compression
     # zstd level 3 provides ~15% better compression than snappy with minimal overhead
-    typed_rel = rel.project(", ".join(projections))
+    typed_rel = rel.project(_PARQUET_PROJECTION)
     conn.register("_write_temp", typed_rel)
     conn.execute(f"""
         COPY _write_temp TO '{filepath}'
@@ -1310,9 +1502,137 @@ def write_run_parquet(
     """)
     conn.close()
 
+
+def _parquet_partition_dir(lq_dir: Path, source_type: str, date_str: str) -> Path:
+    """Return (and create) the Hive partition directory for a date and source type."""
+    partition_dir = lq_dir / LOGS_DIR / f"date={date_str}" / f"source={source_type}"
+    partition_dir.mkdir(parents=True, exist_ok=True)
+    return partition_dir
+
+
+def _safe_source_name(name: str) -> str:
+    """Sanitize a source name for use in a parquet filename."""
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)[:50]
+
+
+def write_run_parquet(
+    events: list[dict[str, Any]],
+    run_meta: dict[str, Any],
+    lq_dir: Path,
+) -> Path:
+    """Write events to a Hive-partitioned parquet file.
+
+    Always writes all schema columns for consistency, even if values are None.
+    """
+    # Determine partition path; date and time come from one clock reading
+    now = datetime.now()
+    date_str = now.strftime("%Y-%m-%d")
+    time_str = now.strftime("%H%M%S")
+    source_type = run_meta.get("source_type", "run")
+    run_id = run_meta["run_id"]
+    safe_name = _safe_source_name(run_meta.get("source_name", "unknown"))
+
+    partition_dir = _parquet_partition_dir(lq_dir, source_type, date_str)
+
+    filename = f"{run_id:03d}_{safe_name}_{time_str}.parquet"
+    filepath = partition_dir / filename
+
+    _write_parquet_columns(_parquet_columns(events, run_meta), filepath)
+
     return filepath
 
 
+def write_runs_parquet(
+    runs: list[tuple[list[dict[str, Any]], dict[str, Any]]],
+    lq_dir: Path,
+) -> list[Path]:
+    """Write several runs with one parquet file per source partition.
+
+    Useful for imports and fixtures that produce many runs at once: each
+    parquet file has a fixed creation cost, so runs sharing a partition are
+    written together. Rows keep their own run_id, so readers still see
+    separate runs.
+
+    Args:
+        runs: (events, run_meta) pairs, as passed to write_run_parquet()
+        lq_dir: Path to .lq directory
+
+    Returns:
+        Paths of the files written
+    """
+    by_source: dict[str, list[tuple[list[dict[str, Any]], dict[str, Any]]]] = {}
+    for events, run_meta in runs:
+        by_source.setdefault(run_meta.get("source_type", "run"), []).append((events, run_meta))
+
+    # Format the partition date and file time once for the whole batch
+    now = datetime.now()
+    date_str = now.strftime("%Y-%m-%d")
+    time_str = now.strftime("%H%M%S")
+    paths = []
+    for source_type, source_runs in by_source.items():
+        columns: dict[str, list[Any]] = {col: [] for col in PARQUET_SCHEMA_COLUMNS}
+        for events, run_meta in source_runs:
+            for col, values in _parquet_columns(events, run_meta).items():
+                columns[col].extend(values)
+
+        # Prefix with the highest run_id so get_next_run_id() stays correct,
+        # and keep the source name(s) in the name as write_run_parquet() does
+        max_run_id = max(run_meta["run_id"] for _, run_meta in source_runs)
+        names = dict.fromkeys(
+            _safe_source_name(run_meta.get("source_name", "unknown")) for _, run_meta in source_runs
+        )
+        safe_name = "+".join(names)[:50]
+        filename = f"{max_run_id:03d}_{safe_name}_{time_str}.parquet"
+        filepath = _parquet_partition_dir(lq_dir, source_type, date_str) / filename
+
+        _write_parquet_columns(columns, filepath)
+        paths.append(filepath)
+
+    return paths
+
+
+class RunWriter:
+    """Collect runs and write them with as few parquet files as possible.
+
+    Use as a context manager: runs added inside the block are written when
+    it exits cleanly, one file per source partition. A single run is
+    written exactly as write_run_parquet() would.
+
+    Example:
+        with RunWriter(lq_dir) as writer:
+            for events, run_meta in runs:
+                writer.add(events, run_meta)
+        print(writer.paths)
+    """
+
+    def __init__(self, lq_dir: Path):
+        self.lq_dir = lq_dir
+        self.paths: list[Path] = []
+        self._runs: list[tuple[list[dict[str, Any]], dict[str, Any]]] = []
+
+    def __enter__(self) -> RunWriter:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def add(self, events: list[dict[str, Any]], run_meta: dict[str, Any]) -> None:
+        """Queue a run for writing."""
+        self._runs.append((events, run_meta))
+
+    def flush(self) -> list[Path]:
+        """Write all queued runs and return the new file paths."""
+        if len(self._runs) == 1:
+            events, run_meta = self._runs[0]
+            written = [write_run_parquet(events, run_meta, self.lq_dir)]
+        else:
+            written = write_runs_parquet(self._runs, self.lq_dir) if self._runs else []
+        self._runs = []
+        self.paths.extend(written)
+        return written
+
+
 # ============================================================================
 # Log Parsing
 # ============================================================================
@@ -1332,15 +1652,41 @@ def parse_log_content(content: str, format_hint: str = "auto") -> list[dict[str,
     Returns:
         List of parsed events, or empty list if parsing unavailable
     """
-    conn = duckdb.connect(":memory:")
+    global _PARSE_CONN
+
+    # duck_hunt failed to install in this process: skip the connection
+    if ConnectionFactory._duck_hunt_available is False:
+        return []
+    # Nothing to parse (e.g. a silent command); isspace() stops at the
+    # first visible character, so this is cheap on real logs
+    if not content or content.isspace():
+        return []
+
+    if _PARSE_CONN is None:
+        base = duckdb.connect(":memory:")
+        if not ConnectionFactory._load_duck_hunt(base):
+            base.close()
+            return []
+        _PARSE_CONN = base
+
+    # The extension stays loaded on the shared connection; each call gets
+    # its own cursor so concurrent callers don't share result state
+    conn = _PARSE_CONN.cursor()
 
     try:
-        conn.execute("LOAD duck_hunt")
         result = conn.execute(
             "SELECT * FROM parse_duck_hunt_log($1, $2)", [content, format_hint]
         ).fetchall()
         columns = [desc[0] for desc in conn.description]
         events = [dict(zip(columns, row)) for row in result]
+        # Each row carries its own copy of these strings; interning shares
+        # one object per distinct value across thousands of events
+        interned = [c for c in columns if c in _INTERNED_EVENT_FIELDS]
+        for event in events:
+            for key in interned:
+                value = event[key]
+                if isinstance(value, str):
+                    event[key] = sys.intern(value)
         return events
     except duckdb.Error:
         # duck_hunt not available or parsing failed - return empty list
@@ -1405,9 +1751,12 @@ class GitInfo:
     dirty: bool | None = None
 
 
-def capture_git_info() -> GitInfo:
+def capture_git_info(cwd: Path | str | None = None) -> GitInfo:
     """Capture current git repository state.
 
+    Args:
+        cwd: Directory to inspect (default: current directory)
+
     Returns:
         GitInfo with commit hash, branch name, and dirty status.
         Fields are None if not in a git repo or git not available.
@@ -1421,6 +1770,7 @@ def capture_git_info() -> GitInfo:
             capture_output=True,
             text=True,
             timeout=5,
+            cwd=cwd,
         )
         if result.returncode == 0:
             info.commit = result.stdout.strip()
@@ -1431,6 +1781,7 @@ def capture_git_info() -> GitInfo:
             capture_output=True,
             text=True,
             timeout=5,
+            cwd=cwd,
         )
         if result.returncode == 0:
             info.branch = result.stdout.strip()
@@ -1441,6 +1792,7 @@ def capture_git_info() -> GitInfo:
             capture_output=True,
             text=True,
             timeout=5,
+            cwd=cwd,
         )
         if result.returncode == 0:
             info.dirty = len(result.stdout.strip()) > 0
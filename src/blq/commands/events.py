@@ -7,7 +7,6 @@ Handles viewing event details and context.
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 
 import duckdb
@@ -15,6 +14,7 @@ import duckdb
 from blq.commands.core import (
     BlqConfig,
     EventRef,
+    dumps_json,
 )
 from blq.query import LogStore
 
@@ -38,7 +38,7 @@ def cmd_event(args: argparse.Namespace) -> None:
             sys.exit(1)
 
         if args.json:
-            print(json.dumps(event, indent=2, default=str))
+            print(dumps_json(event, default=str))
         else:
             # Pretty print event details
             print(f"Event: {args.ref}")
@@ -15,12 +15,14 @@ import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
 
 from blq.commands.core import (
     RAW_DIR,
     BlqConfig,
     EventSummary,
     RunResult,
+    RunWriter,
     capture_ci_info,
     capture_environment,
     capture_git_info,
@@ -54,6 +56,74 @@ def _make_event_summary(run_id: int, e: dict) -> EventSummary:
     )
 
 
+# Read size for streaming child output from the pipe
+_READ_CHUNK_SIZE = 1 << 16
+
+
+def _stream_output(
+    process: subprocess.Popen,
+    quiet: bool = False,
+    capture: bool = True,
+    raw_file: BinaryIO | None = None,
+) -> bytes:
+    """Stream a child's combined output to stdout and return the raw bytes.
+
+    Reads the pipe in large chunks with ``os.read`` instead of iterating
+    lines, so large build logs are copied without per-line decoding. Each
+    chunk is echoed, appended to the raw log and captured in the same pass.
+
+    Args:
+        process: Process started with ``stdout=PIPE`` in binary mode
+        quiet: If True, don't echo output to stdout
+        capture: If False, discard output after echoing it
+        raw_file: Optional binary file receiving the output as it arrives
+
+    Returns:
+        Everything the process wrote, undecoded (empty if not capturing)
+    """
+    assert process.stdout is not None  # stdout=PIPE ensures this
+    fd = process.stdout.fileno()
+    out = getattr(sys.stdout, "buffer", None)
+    if not quiet:
+        sys.stdout.flush()
+
+    buf = bytearray()
+    while chunk := os.read(fd, _READ_CHUNK_SIZE):
+        if capture:
+            buf += chunk
+        if raw_file is not None:
+            raw_file.write(chunk)
+        if quiet:
+            continue
+        if out is not None:
+            out.write(chunk)
+            out.flush()
+        else:
+            sys.stdout.write(chunk.decode("utf-8", errors="replace"))
+            sys.stdout.flush()
+    process.stdout.close()
+    return bytes(buf)
+
+
+def _print_json(result: RunResult, include_warnings: bool = False) -> None:
+    """Print a run result as JSON, writing encoded bytes when stdout allows."""
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        print(result.to_json(include_warnings=include_warnings))
+        return
+    sys.stdout.flush()  # keep ordering with text already written
+    out.write(result.to_json_bytes(include_warnings=include_warnings) + b"\n")
+    out.flush()
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured output, normalizing newlines like text-mode pipes."""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def _execute_command(
     command: str,
     source_name: str,
@@ -65,6 +135,7 @@ def _execute_command(
     error_limit: int = 50,
     session_id: str | None = None,
     capture_env_vars: list[str] | None = None,
+    cwd: Path | str | None = None,
 ) -> RunResult:
     """Execute a command and capture its output.
 
@@ -83,6 +154,7 @@ def _execute_command(
         error_limit: Maximum number of errors to include in result
         session_id: Optional session ID for grouping related runs (watch mode)
         capture_env_vars: Environment variables to capture (default: config.capture_env)
+        cwd: Directory to run the command in (default: current directory)
 
     Returns:
         RunResult with execution details and parsed events
@@ -96,46 +168,44 @@ def _execute_command(
     started_at = datetime.now()
 
     # Capture execution context
-    cwd = os.getcwd()
+    cwd = os.fspath(cwd) if cwd is not None else os.getcwd()
     executable_path = find_executable(command)
     environment = capture_environment(capture_env_vars)
     hostname = socket.gethostname()
     platform_name = platform.system()
     arch = platform.machine()
-    git_info = capture_git_info()
+    git_info = capture_git_info(cwd)
     ci_info = capture_ci_info()
 
     logger.debug(f"Running: {command}")
     logger.debug(f"Run ID: {run_id}")
 
-    # Run command, capturing output
-    process = subprocess.Popen(
-        command,
-        shell=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
+    # Save raw output if requested, written as it streams in
+    raw_file: BinaryIO | None = None
+    if keep_raw:
+        raw_path = lq_dir / RAW_DIR / f"{run_id:03d}.log"
+        raw_path.parent.mkdir(parents=True, exist_ok=True)
+        raw_file = open(raw_path, "wb", buffering=0)
 
-    output_lines = []
-    assert process.stdout is not None  # stdout=PIPE ensures this
-    for line in process.stdout:
-        if not quiet:
-            sys.stdout.write(line)
-            sys.stdout.flush()
-        output_lines.append(line)
+    # Run command, capturing output
+    try:
+        process = subprocess.Popen(
+            command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=cwd,
+        )
+        raw_output = _stream_output(process, quiet, raw_file=raw_file)
+    finally:
+        if raw_file is not None:
+            raw_file.close()
 
     exit_code = process.wait()
     completed_at = datetime.now()
-    output = "".join(output_lines)
+    output = _decode_output(raw_output)
     duration_sec = (completed_at - started_at).total_seconds()
 
-    # Save raw output if requested
-    if keep_raw:
-        raw_file = lq_dir / RAW_DIR / f"{run_id:03d}.log"
-        raw_file.parent.mkdir(parents=True, exist_ok=True)
-        raw_file.write_text(output)
-
     # Parse output
     events = parse_log_content(output, format_hint)
 
@@ -164,7 +234,7 @@ def _execute_command(
     # Write using appropriate storage backend
     if config.use_bird:
         # BIRD storage mode - write to DuckDB tables
-        output_bytes = output.encode("utf-8") if keep_raw else None
+        output_bytes = raw_output if keep_raw else None
         inv_id, filepath = write_bird_invocation(events, run_meta, lq_dir, output_bytes)
         # For BIRD mode, we use a sequential run number for display
         # but the actual ID is a UUID stored in inv_id
@@ -188,10 +258,11 @@ def _execute_command(
 
     # Build output stats for visibility when no events are parsed
     tail_lines = 5
+    body = output[:-1] if output.endswith("\n") else output
     output_stats: dict[str, int | list[str]] = {
-        "lines": len(output_lines),
+        "lines": body.count("\n") + 1 if output else 0,
         "bytes": len(output),
-        "tail": [ln.rstrip("\n\r") for ln in output_lines[-tail_lines:]],
+        "tail": body.rsplit("\n", tail_lines)[-tail_lines:] if output else [],
     }
 
     return RunResult(
@@ -284,9 +355,10 @@ def _parse_command_args(
 
     # Parse main args into named and positional
     for arg in main_args:
-        if "=" in arg and not arg.startswith("-"):
+        # One scan finds the first "=" and splits on it
+        key, sep, value = arg.partition("=")
+        if sep and arg[:1] != "-":
             # Named argument: key=value
-            key, value = arg.split("=", 1)
             named_args[key] = value
         else:
             # Positional argument
@@ -300,12 +372,13 @@ def _parse_command_args(
     return named_args, positional_args, extra_args
 
 
-def _run_no_capture(command: str, quiet: bool = False) -> int:
+def _run_no_capture(command: str, quiet: bool = False, cwd: Path | str | None = None) -> int:
     """Run a command without capturing output to parquet.
 
     Args:
         command: Shell command to run
         quiet: If True, don't stream output
+        cwd: Directory to run the command in (default: current directory)
 
     Returns:
         Exit code from the command
@@ -317,15 +390,10 @@ def _run_no_capture(command: str, quiet: bool = False) -> int:
         shell=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
+        cwd=cwd,
     )
 
-    assert process.stdout is not None  # stdout=PIPE ensures this
-    for line in process.stdout:
-        if not quiet:
-            sys.stdout.write(line)
-            sys.stdout.flush()
-
+    _stream_output(process, quiet, capture=False)
     exit_code = process.wait()
     duration_sec = (datetime.now() - started_at).total_seconds()
     logger.debug(f"Completed in {duration_sec:.1f}s (exit code {exit_code})")
@@ -377,7 +445,7 @@ def cmd_run(args: argparse.Namespace) -> None:
 
         # Expand command template with arguments
         try:
-            command = expand_command(reg_cmd.cmd, named_args, positional_args, extra_args)
+            command = expand_command(reg_cmd, named_args, positional_args, extra_args)
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
             print("", file=sys.stderr)
@@ -452,7 +520,7 @@ def cmd_run(args: argparse.Namespace) -> None:
 
     # Output based on format
     if args.json:
-        print(result.to_json(include_warnings=args.include_warnings))
+        _print_json(result, include_warnings=args.include_warnings)
     elif args.markdown:
         print(result.to_markdown(include_warnings=args.include_warnings))
     else:
@@ -471,10 +539,13 @@ def cmd_exec(args: argparse.Namespace) -> None:
     """Execute an ad-hoc command and capture its output.
 
     Unlike cmd_run, this always treats the command as a shell command
-    and never looks up the command registry.
+    and never looks up the command registry. The command runs in
+    ``args.cwd`` when set, otherwise the current directory.
     """
+    cwd = getattr(args, "cwd", None)
+
     # Get unified config (finds .lq, loads settings)
-    config = BlqConfig.ensure()
+    config = BlqConfig.ensure(Path(cwd) if cwd else None)
 
     # Build command from args - always treat as literal shell command
     command = " ".join(args.command)
@@ -499,7 +570,7 @@ def cmd_exec(args: argparse.Namespace) -> None:
 
     # No-capture mode: just run and exit with the command's exit code
     if not should_capture:
-        exit_code = _run_no_capture(command, quiet)
+        exit_code = _run_no_capture(command, quiet, cwd=cwd)
         sys.exit(exit_code)
 
     # Execute command with capture
@@ -512,11 +583,12 @@ def cmd_exec(args: argparse.Namespace) -> None:
         quiet=quiet,
         keep_raw=args.keep_raw or structured_output,
         error_limit=args.error_limit,
+        cwd=cwd,
     )
 
     # Output based on format
     if args.json:
-        print(result.to_json(include_warnings=args.include_warnings))
+        _print_json(result, include_warnings=args.include_warnings)
     elif args.markdown:
         print(result.to_markdown(include_warnings=args.include_warnings))
     else:
@@ -532,38 +604,55 @@ def cmd_exec(args: argparse.Namespace) -> None:
 
 
 def cmd_import(args: argparse.Namespace) -> None:
-    """Import an existing log file."""
+    """Import existing log files.
+
+    Each file becomes its own run; runs imported together are written
+    with one parquet file per partition.
+    """
     config = BlqConfig.ensure()
     lq_dir = config.lq_dir
 
-    filepath = Path(args.file)
-    if not filepath.exists():
-        print(f"Error: File not found: {filepath}", file=sys.stderr)
+    files = [args.file] if isinstance(args.file, str) else list(args.file)
+    if args.name and len(files) > 1:
+        print("Error: --name can only be used when importing a single file", file=sys.stderr)
         sys.exit(1)
+    filepaths = [Path(f) for f in files]
+    for filepath in filepaths:
+        if not filepath.exists():
+            print(f"Error: File not found: {filepath}", file=sys.stderr)
+            sys.exit(1)
 
-    source_name = args.name or filepath.stem
     run_id = get_next_run_id(lq_dir)
     now = datetime.now().isoformat()
 
-    content = filepath.read_text()
-    events = parse_log_content(content, args.format)
-
-    run_meta = {
-        "run_id": run_id,
-        "source_name": source_name,
-        "source_type": "import",
-        "command": f"import {filepath}",
-        "started_at": now,
-        "completed_at": now,
-        "exit_code": 0,
-    }
-
-    outpath = write_run_parquet(events, run_meta, lq_dir)
-
-    errors = sum(1 for e in events if e.get("severity") == "error")
-    warnings = sum(1 for e in events if e.get("severity") == "warning")
-    print(f"Imported {len(events)} events ({errors} errors, {warnings} warnings)")
-    print(f"Saved to {outpath}")
+    summaries = []
+    with RunWriter(lq_dir) as writer:
+        for filepath in filepaths:
+            source_name = args.name or filepath.stem
+            content = filepath.read_text()
+            events = parse_log_content(content, args.format)
+
+            run_meta = {
+                "run_id": run_id,
+                "source_name": source_name,
+                "source_type": "import",
+                "command": f"import {filepath}",
+                "started_at": now,
+                "completed_at": now,
+                "exit_code": 0,
+            }
+            writer.add(events, run_meta)
+            run_id += 1
+
+            errors = sum(1 for e in events if e.get("severity") == "error")
+            warnings = sum(1 for e in events if e.get("severity") == "warning")
+            summaries.append((len(events), errors, warnings))
+
+    # Report only once the runs are on disk
+    for count, errors, warnings in summaries:
+        print(f"Imported {count} events ({errors} errors, {warnings} warnings)")
+    for outpath in writer.paths:
+        print(f"Saved to {outpath}")
 
 
 def cmd_capture(args: argparse.Namespace) -> None:
@@ -13,8 +13,7 @@ import sys
 from importlib import resources
 from pathlib import Path
 
-import yaml  # type: ignore[import-untyped]
-
+from blq.bird import BirdStore
 from blq.commands.core import (
     COMMANDS_FILE,
     DB_FILE,
@@ -27,8 +26,8 @@ from blq.commands.core import (
     ConnectionFactory,
     RegisteredCommand,
     detect_project_info,
+    yaml_load,
 )
-from blq.bird import BirdStore
 
 # Detection mode constants
 DETECT_NONE = "none"
@@ -285,7 +284,7 @@ def _parse_github_workflows(cwd: Path) -> list[tuple[str, str, str, str]]:
                 print(f"  Note: Skipping {workflow_file.name} (uses lq)")
                 continue
 
-            data = yaml.safe_load(content)
+            data = yaml_load(content)
             if not data or "jobs" not in data:
                 continue
 
@@ -456,9 +455,18 @@ def _detect_commands_inspect(cwd: Path) -> list[tuple[str, str, str]]:
     return detected
 
 
-def _write_mcp_config(path: Path) -> None:
-    """Write MCP configuration file."""
-    path.write_text(MCP_CONFIG_TEMPLATE)
+def _write_mcp_config(path: Path, overwrite: bool = True) -> None:
+    """Write MCP configuration file.
+
+    Args:
+        path: Destination file
+        overwrite: If False, leave an existing file untouched
+    """
+    try:
+        with open(path, "w" if overwrite else "x") as f:
+            f.write(MCP_CONFIG_TEMPLATE)
+    except FileExistsError:
+        return
     print(f"  {path.name}   - MCP server configuration")
 
 
@@ -469,12 +477,9 @@ def _install_extensions() -> None:
     conn = duckdb.connect(":memory:")
 
     # Check if duck_hunt is already available
-    try:
-        conn.execute("LOAD duck_hunt")
+    if ConnectionFactory._load_duck_hunt(conn):
         print("  duck_hunt  - Already installed")
         return
-    except duckdb.Error:
-        pass
 
     # Try to install duck_hunt
     print("  duck_hunt  - Installing from community repo...")
@@ -485,15 +490,19 @@ def _install_extensions() -> None:
         print("             Run manually: INSTALL duck_hunt FROM community", file=sys.stderr)
 
 
-def _detect_commands(mode: str = DETECT_AUTO) -> list[tuple[str, str, str]]:
+def _detect_commands(
+    mode: str = DETECT_AUTO, cwd: Path | None = None
+) -> list[tuple[str, str, str]]:
     """Detect available build/test commands based on project files.
 
     Args:
         mode: Detection mode (none, simple, inspect, auto)
+        cwd: Project directory to scan (default: current directory)
 
     Returns list of (name, command, description) tuples.
     """
-    cwd = Path.cwd()
+    if cwd is None:
+        cwd = Path.cwd()
 
     if mode == DETECT_NONE:
         return []
@@ -539,7 +548,7 @@ def _detect_and_register_commands(lq_dir: Path, auto_yes: bool, mode: str = DETE
     if mode == DETECT_NONE:
         return
 
-    detected = _detect_commands(mode)
+    detected = _detect_commands(mode, lq_dir.parent)
 
     if not detected:
         print("\n  No build systems detected.")
@@ -590,70 +599,18 @@ def _detect_and_register_commands(lq_dir: Path, auto_yes: bool, mode: str = DETE
 def _ensure_commands_file(lq_dir: Path, verbose: bool = False) -> None:
     """Ensure commands.yaml exists, creating empty one if needed."""
     commands_path = lq_dir / COMMANDS_FILE
-    if not commands_path.exists():
-        commands_path.write_text("# blq registered commands\ncommands: {}\n")
-        if verbose:
-            print(f"  Created {COMMANDS_FILE}")
+    try:
+        with open(commands_path, "x") as f:
+            f.write("# blq registered commands\ncommands: {}\n")
+    except FileExistsError:
+        return
+    if verbose:
+        print(f"  Created {COMMANDS_FILE}")
 
 
 def _split_sql_statements(sql: str) -> list[str]:
-    """Split SQL into individual statements, handling comments and semicolons.
-
-    Simple parser that handles:
-    - Line comments (--)
-    - Block comments (/* */)
-    - Semicolons inside comments
-
-    Returns list of non-empty statements.
-    """
-    statements = []
-    current = []
-    in_line_comment = False
-    in_block_comment = False
-    i = 0
-
-    while i < len(sql):
-        c = sql[i]
-
-        # Check for comment start
-        if not in_line_comment and not in_block_comment:
-            if c == "-" and i + 1 < len(sql) and sql[i + 1] == "-":
-                in_line_comment = True
-                current.append(c)
-                i += 1
-                current.append(sql[i])
-            elif c == "/" and i + 1 < len(sql) and sql[i + 1] == "*":
-                in_block_comment = True
-                current.append(c)
-                i += 1
-                current.append(sql[i])
-            elif c == ";":
-                # End of statement
-                stmt = "".join(current).strip()
-                if stmt:
-                    statements.append(stmt)
-                current = []
-            else:
-                current.append(c)
-        elif in_line_comment:
-            current.append(c)
-            if c == "\n":
-                in_line_comment = False
-        elif in_block_comment:
-            current.append(c)
-            if c == "*" and i + 1 < len(sql) and sql[i + 1] == "/":
-                i += 1
-                current.append(sql[i])
-                in_block_comment = False
-
-        i += 1
-
-    # Add final statement if any
-    stmt = "".join(current).strip()
-    if stmt:
-        statements.append(stmt)
-
-    return statements
+    """Split SQL into individual statements (see BirdStore._split_sql_statements)."""
+    return BirdStore._split_sql_statements(sql)
 
 
 def _create_placeholder_parquet(lq_dir: Path) -> None:
@@ -714,8 +671,10 @@ def _create_database(lq_dir: Path, use_bird: bool = False) -> bool:
         # Split into individual statements
         statements = _split_sql_statements(schema_content)
 
-        # Create/update database with schema
-        conn = duckdb.connect(str(db_path))
+        # Create/update database with schema. The schema's relative
+        # '.lq/logs' paths resolve against the project dir, not the process cwd
+        search_path = str(lq_dir.parent.resolve())
+        conn = duckdb.connect(str(db_path), config={"file_search_path": search_path})
         for stmt in statements:
             conn.execute(stmt)
         conn.close()
@@ -744,7 +703,7 @@ def _reinit_config_files(lq_dir: Path, args: argparse.Namespace) -> None:
         print(f"  Updated {DB_FILE}")
 
     # Update config with project info
-    project_info = detect_project_info()
+    project_info = detect_project_info(lq_dir.parent)
     namespace = getattr(args, "namespace", None) or project_info.namespace
     project = getattr(args, "project", None) or project_info.project
 
@@ -757,9 +716,14 @@ def _reinit_config_files(lq_dir: Path, args: argparse.Namespace) -> None:
 
 
 def cmd_init(args: argparse.Namespace) -> None:
-    """Initialize .lq directory and install required extensions."""
-    lq_dir = Path.cwd() / LQ_DIR
-    mcp_config_path = Path.cwd() / MCP_CONFIG_FILE
+    """Initialize .lq directory and install required extensions.
+
+    The project directory is ``args.cwd`` when set, otherwise the current
+    working directory. Passing it explicitly avoids a process-wide chdir.
+    """
+    cwd = Path(getattr(args, "cwd", None) or Path.cwd())
+    lq_dir = cwd / LQ_DIR
+    mcp_config_path = cwd / MCP_CONFIG_FILE
     create_mcp = getattr(args, "mcp", False)
     detect_commands = getattr(args, "detect", False)
     detect_mode = getattr(args, "detect_mode", DETECT_AUTO)
@@ -782,8 +746,8 @@ def cmd_init(args: argparse.Namespace) -> None:
         _install_extensions()
 
         # Check if user wants to add MCP config
-        if create_mcp and not mcp_config_path.exists():
-            _write_mcp_config(mcp_config_path)
+        if create_mcp:
+            _write_mcp_config(mcp_config_path, overwrite=False)
 
         # Still allow command detection on existing projects
         if detect_commands:
@@ -822,7 +786,7 @@ def cmd_init(args: argparse.Namespace) -> None:
     _create_database(lq_dir, use_bird=use_bird)
 
     # Detect project info from git remote (can be overridden)
-    project_info = detect_project_info()
+    project_info = detect_project_info(cwd)
 
     # Apply overrides from command line
     namespace = getattr(args, "namespace", None) or project_info.namespace
@@ -852,9 +816,9 @@ def cmd_init(args: argparse.Namespace) -> None:
     if namespace and project:
         print(f"  project       - {namespace}/{project}")
     if use_bird:
-        print(f"  storage       - BIRD (DuckDB tables)")
+        print("  storage       - BIRD (DuckDB tables)")
     else:
-        print(f"  storage       - Parquet (legacy)")
+        print("  storage       - Parquet (legacy)")
 
     # Install required extensions
     _install_extensions()
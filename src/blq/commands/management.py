@@ -225,9 +225,46 @@ def cmd_completions(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def _bash_completion() -> str:
-    """Generate bash completion script."""
-    return """# blq bash completion
+# ============================================================================
+# Shell Completions
+# ============================================================================
+
+# Top-level subcommands offered by every completion script: (name, description).
+# Aliases are listed as their own entries so shells complete them too.
+_COMPLETION_SUBCOMMANDS: tuple[tuple[str, str], ...] = (
+    ("init", "Initialize .lq directory"),
+    ("run", "Run registered command (alias: r)"),
+    ("r", "Run registered command"),
+    ("exec", "Execute ad-hoc command (alias: e)"),
+    ("e", "Execute ad-hoc command"),
+    ("import", "Import existing log file"),
+    ("capture", "Capture from stdin"),
+    ("status", "Show status of all sources"),
+    ("errors", "Show recent errors"),
+    ("warnings", "Show recent warnings"),
+    ("summary", "Aggregate summary"),
+    ("history", "Show run history"),
+    ("sql", "Run arbitrary SQL"),
+    ("shell", "Interactive SQL shell"),
+    ("prune", "Remove old logs"),
+    ("formats", "List available log formats"),
+    ("event", "Show event details by reference"),
+    ("context", "Show context lines around event"),
+    ("commands", "List registered commands"),
+    ("register", "Register a command"),
+    ("unregister", "Remove a registered command"),
+    ("sync", "Sync logs to central location"),
+    ("query", "Query log files or stored events (alias: q)"),
+    ("q", "Query log files or stored events"),
+    ("filter", "Filter with simple syntax (alias: f)"),
+    ("f", "Filter with simple syntax"),
+    ("serve", "Start MCP server"),
+    ("completions", "Generate shell completions"),
+)
+
+# The scripts are static, so they are assembled once at import: a fixed
+# header and footer per shell around the generated subcommand list.
+_BASH_HEADER = """# blq bash completion
 # Add to ~/.bashrc or ~/.bash_completion:
 #   eval "$(blq completions bash)"
 # Or save to a file:
@@ -240,11 +277,9 @@ _blq_completions() {
     prev="${COMP_WORDS[COMP_CWORD-1]}"
 
     # Main commands
-    commands="init run r exec e import capture status errors warnings"
-    commands="$commands summary history sql shell prune formats event"
-    commands="$commands context commands register unregister sync"
-    commands="$commands query q filter f serve completions"
+"""
 
+_BASH_FOOTER = """
     # Complete commands
     if [[ ${COMP_CWORD} -eq 1 ]]; then
         COMPREPLY=( $(compgen -W "${commands}" -- "${cur}") )
@@ -313,10 +348,7 @@ _blq_completions() {
 complete -F _blq_completions blq
 """
 
-
-def _zsh_completion() -> str:
-    """Generate zsh completion script."""
-    return """#compdef blq
+_ZSH_HEADER = """#compdef blq
 # blq zsh completion
 # Add to ~/.zshrc:
 #   eval "$(blq completions zsh)"
@@ -326,35 +358,9 @@ def _zsh_completion() -> str:
 _blq() {
     local -a commands
     commands=(
-        'init:Initialize .lq directory'
-        'run:Run registered command (alias: r)'
-        'r:Run registered command'
-        'exec:Execute ad-hoc command (alias: e)'
-        'e:Execute ad-hoc command'
-        'import:Import existing log file'
-        'capture:Capture from stdin'
-        'status:Show status of all sources'
-        'errors:Show recent errors'
-        'warnings:Show recent warnings'
-        'summary:Aggregate summary'
-        'history:Show run history'
-        'sql:Run arbitrary SQL'
-        'shell:Interactive SQL shell'
-        'prune:Remove old logs'
-        'formats:List available log formats'
-        'event:Show event details by reference'
-        'context:Show context lines around event'
-        'commands:List registered commands'
-        'register:Register a command'
-        'unregister:Remove a registered command'
-        'sync:Sync logs to central location'
-        'query:Query log files or stored events (alias: q)'
-        'q:Query log files or stored events'
-        'filter:Filter with simple syntax (alias: f)'
-        'f:Filter with simple syntax'
-        'serve:Start MCP server'
-        'completions:Generate shell completions'
-    )
+"""
+
+_ZSH_FOOTER = """    )
 
     _arguments -C \\
         '-V[Show version]' \\
@@ -456,10 +462,7 @@ _blq() {
 _blq "$@"
 """
 
-
-def _fish_completion() -> str:
-    """Generate fish completion script."""
-    return """# blq fish completion
+_FISH_HEADER = """# blq fish completion
 # Save to ~/.config/fish/completions/blq.fish:
 #   blq completions fish > ~/.config/fish/completions/blq.fish
 
@@ -467,35 +470,9 @@ def _fish_completion() -> str:
 complete -c blq -f
 
 # Commands
-complete -c blq -n "__fish_use_subcommand" -a init -d "Initialize .lq directory"
-complete -c blq -n "__fish_use_subcommand" -a run -d "Run registered command"
-complete -c blq -n "__fish_use_subcommand" -a r -d "Run registered command (alias)"
-complete -c blq -n "__fish_use_subcommand" -a exec -d "Execute ad-hoc command"
-complete -c blq -n "__fish_use_subcommand" -a e -d "Execute ad-hoc command (alias)"
-complete -c blq -n "__fish_use_subcommand" -a import -d "Import existing log file"
-complete -c blq -n "__fish_use_subcommand" -a capture -d "Capture from stdin"
-complete -c blq -n "__fish_use_subcommand" -a status -d "Show status of all sources"
-complete -c blq -n "__fish_use_subcommand" -a errors -d "Show recent errors"
-complete -c blq -n "__fish_use_subcommand" -a warnings -d "Show recent warnings"
-complete -c blq -n "__fish_use_subcommand" -a summary -d "Aggregate summary"
-complete -c blq -n "__fish_use_subcommand" -a history -d "Show run history"
-complete -c blq -n "__fish_use_subcommand" -a sql -d "Run arbitrary SQL"
-complete -c blq -n "__fish_use_subcommand" -a shell -d "Interactive SQL shell"
-complete -c blq -n "__fish_use_subcommand" -a prune -d "Remove old logs"
-complete -c blq -n "__fish_use_subcommand" -a formats -d "List available log formats"
-complete -c blq -n "__fish_use_subcommand" -a event -d "Show event details"
-complete -c blq -n "__fish_use_subcommand" -a context -d "Show context around event"
-complete -c blq -n "__fish_use_subcommand" -a commands -d "List registered commands"
-complete -c blq -n "__fish_use_subcommand" -a register -d "Register a command"
-complete -c blq -n "__fish_use_subcommand" -a unregister -d "Remove a registered command"
-complete -c blq -n "__fish_use_subcommand" -a sync -d "Sync logs to central location"
-complete -c blq -n "__fish_use_subcommand" -a query -d "Query log files"
-complete -c blq -n "__fish_use_subcommand" -a q -d "Query log files (alias)"
-complete -c blq -n "__fish_use_subcommand" -a filter -d "Filter with simple syntax"
-complete -c blq -n "__fish_use_subcommand" -a f -d "Filter with simple syntax (alias)"
-complete -c blq -n "__fish_use_subcommand" -a serve -d "Start MCP server"
-complete -c blq -n "__fish_use_subcommand" -a completions -d "Generate shell completions"
+"""
 
+_FISH_FOOTER = """
 # Global options
 complete -c blq -s V -l version -d "Show version"
 complete -c blq -s F -l log-format -d "Log format for parsing"
@@ -528,3 +505,41 @@ complete -c blq -n "__fish_seen_subcommand_from import" -F -d "Log file"
 # query/filter - complete files
 complete -c blq -n "__fish_seen_subcommand_from query q filter f" -F -d "Log file"
 """
+
+_BASH_COMPLETION = (
+    _BASH_HEADER
+    + '    commands="'
+    + " ".join(name for name, _ in _COMPLETION_SUBCOMMANDS)
+    + '"\n'
+    + _BASH_FOOTER
+)
+
+_ZSH_COMPLETION = (
+    _ZSH_HEADER
+    + "".join(f"        '{name}:{desc}'\n" for name, desc in _COMPLETION_SUBCOMMANDS)
+    + _ZSH_FOOTER
+)
+
+_FISH_COMPLETION = (
+    _FISH_HEADER
+    + "".join(
+        f'complete -c blq -n "__fish_use_subcommand" -a {name} -d "{desc}"\n'
+        for name, desc in _COMPLETION_SUBCOMMANDS
+    )
+    + _FISH_FOOTER
+)
+
+
+def _bash_completion() -> str:
+    """Generate bash completion script."""
+    return _BASH_COMPLETION
+
+
+def _zsh_completion() -> str:
+    """Generate zsh completion script."""
+    return _ZSH_COMPLETION
+
+
+def _fish_completion() -> str:
+    """Generate fish completion script."""
+    return _FISH_COMPLETION
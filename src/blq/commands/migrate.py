@@ -7,25 +7,153 @@ Handles migration from parquet (v1) storage to BIRD (v2) storage.
 from __future__ import annotations
 
 import argparse
+import os
 import sys
-import uuid
-from datetime import datetime
 from pathlib import Path
 
 import duckdb
 
-from blq.bird import BirdStore, InvocationRecord
-from blq.commands.core import BlqConfig, LOGS_DIR
+from blq.bird import BirdStore
+from blq.commands.core import LOGS_DIR, PARQUET_SCHEMA, BlqConfig
+
+# Staging tables used while migrating (temporary, per-connection)
+_SOURCE_TABLE = "_migrate_source"
+_RUNS_TABLE = "_migrate_runs"
+
+# One row per run: the first row (lowest event_id) carries the run metadata.
+# session_id/client_id follow the same rules as write_bird_invocation().
+# Rows without a run_id can't be attributed to a run and are not migrated.
+_CREATE_RUNS_SQL = f"""
+    CREATE OR REPLACE TEMP TABLE {_RUNS_TABLE} AS
+    SELECT
+        uuid() AS id,
+        run_id,
+        COALESCE(source_name, 'unknown') AS source_name,
+        COALESCE(source_type, 'run') AS source_type,
+        CASE WHEN COALESCE(source_type, 'run') = 'run'
+             THEN COALESCE(source_name, 'unknown')
+             ELSE COALESCE(source_type, 'run') || '-migrated'
+        END AS session_id,
+        'blq-' || COALESCE(source_type, 'run') AS client_id,
+        command,
+        cwd,
+        executable_path,
+        TRY_CAST(started_at AS TIMESTAMP) AS started_ts,
+        TRY_CAST(completed_at AS TIMESTAMP) AS completed_ts,
+        exit_code,
+        hostname,
+        platform,
+        arch,
+        git_commit,
+        git_branch,
+        git_dirty,
+        environment,
+        ci
+    FROM {_SOURCE_TABLE}
+    WHERE run_id IS NOT NULL
+    QUALIFY row_number() OVER (PARTITION BY run_id ORDER BY event_id NULLS LAST) = 1
+"""
 
+_INSERT_SESSIONS_SQL = f"""
+    INSERT INTO sessions (session_id, client_id, invoker, invoker_pid,
+                          invoker_type, registered_at, cwd, date)
+    SELECT
+        session_id,
+        arg_min(client_id, run_id),
+        'blq-migrate',
+        ?,
+        'import',
+        current_localtimestamp(),
+        arg_min(cwd, run_id),
+        current_date
+    FROM {_RUNS_TABLE}
+    WHERE session_id NOT IN (SELECT session_id FROM sessions)
+    GROUP BY session_id
+"""
 
-def _parse_timestamp(ts_str: str | None) -> datetime:
-    """Parse an ISO timestamp string, returning now() if invalid."""
-    if not ts_str:
-        return datetime.now()
-    try:
-        return datetime.fromisoformat(ts_str)
-    except (ValueError, TypeError):
-        return datetime.now()
+_INSERT_INVOCATIONS_SQL = f"""
+    INSERT INTO invocations (
+        id, session_id, timestamp, duration_ms, cwd, cmd, executable,
+        exit_code, format_hint, client_id, hostname, username,
+        source_name, source_type, environment, platform, arch,
+        git_commit, git_branch, git_dirty, ci, date
+    )
+    SELECT
+        id,
+        session_id,
+        COALESCE(started_ts, current_localtimestamp()),
+        date_diff('millisecond', started_ts, completed_ts),
+        COALESCE(cwd, ''),
+        COALESCE(command, ''),
+        executable_path,
+        COALESCE(exit_code, 0),
+        NULL,  -- format_hint: not stored in v1
+        client_id,
+        hostname,
+        NULL,  -- username: not stored in v1
+        source_name,
+        source_type,
+        CASE WHEN cardinality(environment) > 0 THEN to_json(environment) END,
+        platform,
+        arch,
+        git_commit,
+        git_branch,
+        git_dirty,
+        CASE WHEN cardinality(ci) > 0 THEN to_json(ci) END,
+        current_date
+    FROM {_RUNS_TABLE}
+    ORDER BY run_id
+"""
+
+_INSERT_EVENTS_SQL = f"""
+    INSERT INTO events (
+        id, invocation_id, event_index, client_id, hostname,
+        severity, file_path, line_number, column_number,
+        message, code, tool_name, category, fingerprint,
+        log_line_start, log_line_end, date
+    )
+    SELECT
+        uuid(),
+        r.id,
+        COALESCE(s.event_id, row_number() OVER (PARTITION BY s.run_id ORDER BY s.event_id) - 1),
+        r.client_id,
+        r.hostname,
+        s.severity,
+        s.file_path,
+        s.line_number,
+        s.column_number,
+        s.message,
+        s.error_code,
+        s.tool_name,
+        s.category,
+        s.fingerprint,
+        s.log_line_start,
+        s.log_line_end,
+        current_date
+    FROM {_SOURCE_TABLE} s
+    JOIN {_RUNS_TABLE} r ON s.run_id = r.run_id
+    WHERE s.severity IS NOT NULL
+"""
+
+
+def _load_parquet_source(conn: duckdb.DuckDBPyConnection, glob_pattern: str) -> None:
+    """Stage all parquet rows into a temp table with the full v1 schema.
+
+    Older parquet files may predate some columns, so any column from
+    PARQUET_SCHEMA that the files lack is added as NULL. This keeps the
+    migration SQL independent of which blq version wrote the data.
+    """
+    conn.execute(
+        f"""
+        CREATE OR REPLACE TEMP TABLE {_SOURCE_TABLE} AS
+        SELECT * FROM read_parquet(?, hive_partitioning=true, union_by_name=true)
+        """,
+        [glob_pattern],
+    )
+    existing = {row[0] for row in conn.execute(f"DESCRIBE {_SOURCE_TABLE}").fetchall()}
+    for col, sql_type in PARQUET_SCHEMA:
+        if col not in existing:
+            conn.execute(f"ALTER TABLE {_SOURCE_TABLE} ADD COLUMN {col} {sql_type}")
 
 
 def _migrate_parquet_to_bird(
@@ -35,6 +163,9 @@ def _migrate_parquet_to_bird(
 ) -> tuple[int, int]:
     """Migrate parquet data to BIRD storage.
 
+    The parquet files are scanned once and copied into the BIRD tables with
+    one INSERT ... SELECT per table, so no rows pass through Python.
+
     Args:
         config: BlqConfig instance
         dry_run: If True, don't actually write data
@@ -61,37 +192,33 @@ def _migrate_parquet_to_bird(
     if dry_run:
         print("Dry run mode - no data will be written")
 
-    # Read all data from parquet files
-    conn = duckdb.connect(":memory:")
-
     # Build glob pattern for parquet files
     glob_pattern = str(logs_dir / "**" / "*.parquet")
 
-    try:
-        # Load all parquet data
-        df = conn.execute(f"""
-            SELECT * FROM read_parquet('{glob_pattern}', hive_partitioning=true)
-            ORDER BY run_id, event_id
-        """).fetchdf()
-    except Exception as e:
-        print(f"Error reading parquet files: {e}", file=sys.stderr)
-        return 0, 0
-    finally:
-        conn.close()
-
-    if df.empty:
-        print("No data found in parquet files.")
-        return 0, 0
-
-    # Group by run_id to get unique runs
-    runs = df.groupby("run_id").first().reset_index()
-    print(f"Found {len(runs)} run(s) to migrate")
-
     if dry_run:
-        # Just count what would be migrated
-        total_events = len(df[df["severity"].notna()])
-        print(f"Would migrate {len(runs)} invocations and {total_events} events")
-        return len(runs), total_events
+        conn = duckdb.connect(":memory:")
+        try:
+            _load_parquet_source(conn, glob_pattern)
+            result = conn.execute(
+                f"""
+                SELECT COUNT(DISTINCT run_id), COUNT(severity)
+                FROM {_SOURCE_TABLE}
+                WHERE run_id IS NOT NULL
+                """
+            ).fetchone()
+        except duckdb.Error as e:
+            print(f"Error reading parquet files: {e}", file=sys.stderr)
+            return 0, 0
+        finally:
+            conn.close()
+
+        run_count, total_events = result if result else (0, 0)
+        if run_count == 0:
+            print("No data found in parquet files.")
+            return 0, 0
+        print(f"Found {run_count} run(s) to migrate")
+        print(f"Would migrate {run_count} invocations and {total_events} events")
+        return run_count, total_events
 
     # Initialize BIRD store
     # Create blobs directory if needed
@@ -99,127 +226,63 @@ def _migrate_parquet_to_bird(
 
     # Ensure BIRD schema exists
     store = BirdStore.open(lq_dir)
-
-    invocations_migrated = 0
-    events_migrated = 0
+    conn = store.connection
 
     try:
-        for _, run in runs.iterrows():
-            run_id = run["run_id"]
-            source_name = run.get("source_name") or "unknown"
-            source_type = run.get("source_type") or "run"
-
-            if verbose:
-                print(f"  Migrating run {run_id}: {source_name}")
-
-            # Create session if needed
-            session_id = source_name if source_type == "run" else f"{source_type}-migrated"
-            client_id = f"blq-{source_type}"
-
-            store.ensure_session(
-                session_id=session_id,
-                client_id=client_id,
-                invoker="blq-migrate",
-                invoker_type="import",
-                cwd=run.get("cwd"),
-            )
-
-            # Parse timestamps
-            started_at = _parse_timestamp(run.get("started_at"))
-            completed_at = _parse_timestamp(run.get("completed_at"))
-            duration_ms = None
-            if started_at and completed_at:
-                duration_ms = int((completed_at - started_at).total_seconds() * 1000)
-
-            # Parse environment and CI from MAP columns
-            environment = None
-            ci = None
-            if run.get("environment") is not None:
-                try:
-                    env_val = run["environment"]
-                    if isinstance(env_val, dict):
-                        environment = env_val
-                except Exception:
-                    pass
-            if run.get("ci") is not None:
-                try:
-                    ci_val = run["ci"]
-                    if isinstance(ci_val, dict):
-                        ci = ci_val
-                except Exception:
-                    pass
-
-            # Create invocation record
-            inv = InvocationRecord(
-                id=str(uuid.uuid4()),
-                session_id=session_id,
-                cmd=run.get("command") or "",
-                cwd=run.get("cwd") or "",
-                exit_code=int(run.get("exit_code") or 0),
-                client_id=client_id,
-                timestamp=started_at,
-                duration_ms=duration_ms,
-                executable=run.get("executable_path"),
-                format_hint=None,  # Not stored in v1
-                hostname=run.get("hostname"),
-                username=None,  # Not stored in v1
-                source_name=source_name,
-                source_type=source_type,
-                environment=environment,
-                platform=run.get("platform"),
-                arch=run.get("arch"),
-                git_commit=run.get("git_commit"),
-                git_branch=run.get("git_branch"),
-                git_dirty=run.get("git_dirty"),
-                ci=ci,
-            )
-
-            store.write_invocation(inv)
-            invocations_migrated += 1
-
-            # Get events for this run
-            run_events = df[
-                (df["run_id"] == run_id) & (df["severity"].notna())
-            ]
-
-            if len(run_events) > 0:
-                events = []
-                for _, event in run_events.iterrows():
-                    events.append({
-                        "event_id": event.get("event_id"),
-                        "severity": event.get("severity"),
-                        "file_path": event.get("file_path"),
-                        "line_number": event.get("line_number"),
-                        "column_number": event.get("column_number"),
-                        "message": event.get("message"),
-                        "error_code": event.get("error_code"),
-                        "tool_name": event.get("tool_name"),
-                        "category": event.get("category"),
-                        "fingerprint": event.get("fingerprint"),
-                        "log_line_start": event.get("log_line_start"),
-                        "log_line_end": event.get("log_line_end"),
-                    })
-
-                store.write_events(
-                    inv.id,
-                    events,
-                    client_id=client_id,
-                    hostname=run.get("hostname"),
-                )
-                events_migrated += len(events)
-
-                if verbose:
-                    print(f"    Migrated {len(events)} event(s)")
-
+        try:
+            _load_parquet_source(conn, glob_pattern)
+        except duckdb.Error as e:
+            print(f"Error reading parquet files: {e}", file=sys.stderr)
+            return 0, 0
+
+        conn.execute(_CREATE_RUNS_SQL)
+        result = conn.execute(f"SELECT COUNT(*) FROM {_RUNS_TABLE}").fetchone()
+        run_count = result[0] if result else 0
+        if run_count == 0:
+            print("No data found in parquet files.")
+            return 0, 0
+        print(f"Found {run_count} run(s) to migrate")
+
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            conn.execute(_INSERT_SESSIONS_SQL, [os.getpid()])
+            inserted = conn.execute(_INSERT_INVOCATIONS_SQL).fetchone()
+            run_count = inserted[0] if inserted else 0
+            inserted = conn.execute(_INSERT_EVENTS_SQL).fetchone()
+            events_migrated = inserted[0] if inserted else 0
+            conn.execute("COMMIT")
+        except duckdb.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+        # Report only what was committed
+        if verbose:
+            per_run = conn.execute(
+                f"""
+                SELECT r.run_id, r.source_name, COUNT(e.id)
+                FROM {_RUNS_TABLE} r
+                LEFT JOIN events e ON e.invocation_id = r.id
+                GROUP BY r.run_id, r.source_name
+                ORDER BY r.run_id
+                """
+            ).fetchall()
+            for run_id, source_name, event_count in per_run:
+                print(f"  Migrated run {run_id}: {source_name}")
+                if event_count:
+                    print(f"    Migrated {event_count} event(s)")
+
+        conn.execute(f"DROP TABLE IF EXISTS {_RUNS_TABLE}")
+        conn.execute(f"DROP TABLE IF EXISTS {_SOURCE_TABLE}")
     finally:
         store.close()
 
-    return invocations_migrated, events_migrated
+    return run_count, events_migrated
 
 
 def cmd_migrate(args: argparse.Namespace) -> None:
     """Migrate data between storage formats."""
-    config = BlqConfig.ensure()
+    cwd = getattr(args, "cwd", None)
+    config = BlqConfig.ensure(Path(cwd) if cwd else None)
 
     to_bird = getattr(args, "to_bird", False)
     dry_run = getattr(args, "dry_run", False)
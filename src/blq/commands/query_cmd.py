@@ -10,10 +10,11 @@ import argparse
 import subprocess
 import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import duckdb
-import pandas as pd  # type: ignore[import-untyped]
 
 from blq.commands.core import (
     BlqConfig,
@@ -21,6 +22,9 @@ from blq.commands.core import (
 )
 from blq.query import LogQuery, LogStore
 
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import-untyped]
+
 
 def format_query_output(
     df: pd.DataFrame,
@@ -73,6 +77,18 @@ def query_source(
     Returns:
         DataFrame with query results
     """
+    return _source_query(source, select, where, order, lq_dir, log_format).df()
+
+
+def _source_query(
+    source: str | Path | None,
+    select: str | None,
+    where: str | None,
+    order: str | None,
+    lq_dir: Path | None,
+    log_format: str,
+) -> LogQuery:
+    """Build the LogQuery behind query_source() without executing it."""
     if source:
         # Query file(s) directly using duck_hunt
         source_path = Path(source)
@@ -103,9 +119,10 @@ def query_source(
     if select:
         query = query.select(*[col.strip() for col in select.split(",")])
 
-    return query.df()
+    return query
 
 
+@lru_cache(maxsize=256)
 def parse_filter_expression(expr: str, ignore_case: bool = False) -> str:
     """Parse a simple filter expression into SQL WHERE clause.
 
@@ -117,7 +134,7 @@ def parse_filter_expression(expr: str, ignore_case: bool = False) -> str:
 
     Args:
         expr: Filter expression like "severity=error" or "file_path~main"
-        ignore_case: If True, use ILIKE for = comparisons too
+        ignore_case: If True, compare = values case-insensitively via LOWER()
 
     Returns:
         SQL WHERE clause fragment
@@ -244,7 +261,7 @@ def cmd_filter(args: argparse.Namespace) -> None:
         lq_dir = BlqConfig.ensure().lq_dir
 
     try:
-        df = query_source(
+        query = _source_query(
             source=source,
             select=None,  # filter always returns all columns
             where=where,
@@ -253,11 +270,13 @@ def cmd_filter(args: argparse.Namespace) -> None:
             log_format=args.log_format,
         )
 
-        # Count mode
+        # Count mode: let DuckDB count instead of materializing the rows
         if args.count:
-            print(len(df))
+            print(query.count())
             return
 
+        df = query.df()
+
         # Determine output format
         if args.json:
             output_format = "json"
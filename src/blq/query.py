@@ -31,15 +31,26 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import duckdb
-import pandas as pd  # type: ignore[import-untyped]
+
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import-untyped]
 
 # Directory name constant - must match blq.commands.core.LQ_DIR
 LQ_DIR = ".lq"
 
 
+def _enable_parquet_metadata_cache(conn: duckdb.DuckDBPyConnection) -> None:
+    """Keep parquet footers in memory for the life of conn.
+
+    events(), errors() and warnings() each rescan the same parquet files;
+    with the cache only the first scan reads every file's metadata.
+    """
+    conn.execute("SET parquet_metadata_cache = true")
+
+
 class LogQuery:
     """Fluent query builder for log data.
 
@@ -50,14 +61,24 @@ class LogQuery:
     (df(), count(), fetchall(), etc.) is called.
     """
 
-    def __init__(self, rel: duckdb.DuckDBPyRelation, conn: duckdb.DuckDBPyConnection):
+    def __init__(
+        self,
+        rel: duckdb.DuckDBPyRelation | None,
+        conn: duckdb.DuckDBPyConnection,
+        source_sql: str | None = None,
+    ):
         """Initialize with a DuckDB relation.
 
         Args:
-            rel: The underlying DuckDB relation
+            rel: The underlying DuckDB relation, or None to build it from
+                source_sql on first use
             conn: The connection (kept for potential future operations)
+            source_sql: SELECT statement producing the base rows. When given,
+                terminal methods run the whole query as one statement instead
+                of binding a chain of relations.
         """
-        self._rel = rel
+        self._base_rel = rel
+        self._source_sql = source_sql
         self._conn = conn
         self._filters: list[str] = []
         self._select_cols: list[str] | None = None
@@ -107,10 +128,9 @@ class LogQuery:
         Returns:
             LogQuery wrapping the table
         """
-        # Handle table-returning macros (contain parentheses)
-        if "(" in table_name:
-            return cls(conn.sql(f"SELECT * FROM {table_name}"), conn)
-        return cls(conn.table(table_name), conn)
+        # Deferred: the table (or macro, e.g. a parquet glob) is only bound
+        # once, as part of the final query
+        return cls(None, conn, source_sql=f"SELECT * FROM {table_name}")
 
     @classmethod
     def from_parquet(
@@ -326,8 +346,43 @@ class LogQuery:
     # Execution methods
     # -------------------------------------------------------------------------
 
+    @property
+    def _rel(self) -> duckdb.DuckDBPyRelation:
+        """The base relation, bound on first use for deferred sources."""
+        if self._base_rel is None:
+            assert self._source_sql is not None
+            self._base_rel = self._conn.sql(self._source_sql)
+        return self._base_rel
+
+    def _where_sql(self) -> str:
+        """WHERE clause for the current filters (empty if none)."""
+        if not self._filters:
+            return ""
+        return " WHERE " + " AND ".join(f"({f})" for f in self._filters)
+
+    def _filtered(self) -> duckdb.DuckDBPyRelation:
+        """Base relation with filters applied."""
+        if self._base_rel is None and self._source_sql is not None:
+            return self._conn.sql(f"SELECT * FROM ({self._source_sql}) _src{self._where_sql()}")
+        rel = self._rel
+        if self._filters:
+            combined = " AND ".join(f"({f})" for f in self._filters)
+            rel = rel.filter(combined)
+        return rel
+
     def _build(self) -> duckdb.DuckDBPyRelation:
         """Build the final relation with all deferred operations."""
+        if self._base_rel is None and self._source_sql is not None:
+            # One statement, so the source is bound once rather than once
+            # per filter/order/select/limit step
+            cols = ", ".join(self._select_cols) if self._select_cols else "*"
+            sql = f"SELECT {cols} FROM ({self._source_sql}) _src{self._where_sql()}"
+            if self._order_cols:
+                sql += " ORDER BY " + ", ".join(self._order_cols)
+            if self._limit_n is not None:
+                sql += f" LIMIT {int(self._limit_n)}"
+            return self._conn.sql(sql)
+
         rel = self._rel
 
         # Apply filters first
@@ -363,16 +418,20 @@ class LogQuery:
 
     def count(self) -> int:
         """Return count of matching rows."""
-        rel = self._rel
-        if self._filters:
-            combined = " AND ".join(f"({f})" for f in self._filters)
-            rel = rel.filter(combined)
-        result = rel.aggregate("COUNT(*) as cnt").fetchone()
+        if self._base_rel is None and self._source_sql is not None:
+            sql = f"SELECT COUNT(*) FROM ({self._source_sql}) _src{self._where_sql()}"
+            result = self._conn.execute(sql).fetchone()
+            return result[0] if result else 0
+        result = self._filtered().aggregate("COUNT(*) as cnt").fetchone()
         return result[0] if result else 0
 
     def exists(self) -> bool:
         """Check if any rows match the query."""
-        return self.count() > 0
+        # LIMIT 1 lets the scan stop at the first match instead of counting all
+        if self._base_rel is None and self._source_sql is not None:
+            sql = f"SELECT 1 FROM ({self._source_sql}) _src{self._where_sql()} LIMIT 1"
+            return self._conn.execute(sql).fetchone() is not None
+        return self._filtered().limit(1).fetchone() is not None
 
     # -------------------------------------------------------------------------
     # Inspection methods
@@ -424,11 +483,7 @@ class LogQuery:
         Returns:
             DataFrame with value counts
         """
-        rel = self._rel
-        if self._filters:
-            combined = " AND ".join(f"({f})" for f in self._filters)
-            rel = rel.filter(combined)
-        return rel.aggregate(f"{column}, COUNT(*) as count").order("count DESC").df()
+        return self._filtered().aggregate(f"{column}, COUNT(*) as count").order("count DESC").df()
 
 
 class LogQueryGrouped:
@@ -472,11 +527,7 @@ class LogQueryGrouped:
 
     def _aggregate(self, agg_expr: str) -> pd.DataFrame:
         """Execute aggregation."""
-        rel = self._query._rel
-        if self._query._filters:
-            combined = " AND ".join(f"({f})" for f in self._query._filters)
-            rel = rel.filter(combined)
-
+        rel = self._query._filtered()
         group_expr = ", ".join(self._group_cols)
         return rel.aggregate(f"{group_expr}, {agg_expr}").df()
 
@@ -511,6 +562,7 @@ class LogStore:
         """
         self._lq_dir = Path(lq_dir)
         self._logs_dir = self._lq_dir / "logs"
+        self._parquet_glob = str(self._logs_dir / "**" / "*.parquet")
 
         if conn is not None:
             # Use provided connection
@@ -528,20 +580,38 @@ class LogStore:
                 # Override blq_base_path to use actual absolute path
                 logs_path = self._logs_dir.resolve()
                 self._conn.execute(f"CREATE OR REPLACE MACRO blq_base_path() AS '{logs_path}'")
+                # Parquet-mode databases only hold macros over the parquet
+                # files; BIRD databases (with blq_metadata) hold native tables
+                if not self._has_table("blq_metadata"):
+                    _enable_parquet_metadata_cache(self._conn)
                 self._schema_loaded = True  # Schema already in database
                 self._using_db_file = True
             else:
                 # Fall back to in-memory + load schema (backward compatibility)
                 self._conn = duckdb.connect(":memory:")
+                _enable_parquet_metadata_cache(self._conn)
                 self._schema_loaded = False
                 self._using_db_file = False
 
+    def _has_table(self, name: str) -> bool:
+        """Check whether a table exists in the connected database."""
+        result = self._conn.execute(
+            "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ?", [name]
+        ).fetchone()
+        return bool(result and result[0])
+
     @classmethod
-    def open(cls, path: Path | str | None = None) -> LogStore:
+    def open(
+        cls,
+        path: Path | str | None = None,
+        start_dir: Path | str | None = None,
+    ) -> LogStore:
         """Open a LogStore, finding .lq directory if not specified.
 
         Args:
             path: Optional path to .lq directory
+            start_dir: Directory to search upward from when path is not
+                given (default: cwd)
 
         Returns:
             LogStore instance
@@ -552,7 +622,7 @@ class LogStore:
         if path is not None:
             lq_dir = Path(path)
         else:
-            lq_dir = cls._find_lq_dir()
+            lq_dir = cls._find_lq_dir(Path(start_dir) if start_dir is not None else None)
 
         if not lq_dir.exists():
             raise FileNotFoundError(f".lq directory not found: {lq_dir}")
@@ -581,6 +651,7 @@ class LogStore:
 
         # Create a connection with a view over the parquet files
         conn = duckdb.connect(":memory:")
+        _enable_parquet_metadata_cache(conn)
 
         # Create blq_events view from parquet files with hive partitioning
         # This makes hostname, namespace, project, date, source available as columns
@@ -609,15 +680,16 @@ class LogStore:
         instance = cls.__new__(cls)
         instance._lq_dir = parquet_root
         instance._logs_dir = parquet_root
+        instance._parquet_glob = parquet_glob
         instance._conn = conn
         instance._schema_loaded = True  # Skip schema loading
         return instance
 
     @classmethod
-    def _find_lq_dir(cls) -> Path:
-        """Find .lq directory in current or parent directories."""
-        cwd = Path.cwd()
-        for p in [cwd, *list(cwd.parents)]:
+    def _find_lq_dir(cls, start_dir: Path | None = None) -> Path:
+        """Find .lq directory in start_dir (default: cwd) or its parents."""
+        start = start_dir if start_dir is not None else Path.cwd()
+        for p in [start, *list(start.parents)]:
             lq_path = p / LQ_DIR
             if lq_path.exists():
                 return lq_path
@@ -763,19 +835,22 @@ class LogStore:
         Returns:
             Event as dict or None if not found
         """
-        result = self.events().filter(run_id=run_id, event_id=event_id).fetchone()
+        # One bound query supplies both the row and its column names; a miss
+        # costs no second scan of the event source
+        rel = self.events().filter(run_id=run_id, event_id=event_id).limit(1)._build()
+        result = rel.fetchone()
         if result is None:
             return None
-
-        columns = self.events().columns
-        return dict(zip(columns, result))
+        return dict(zip(rel.columns, result))
 
     def has_data(self) -> bool:
         """Check if the store has any data (excluding placeholder files)."""
         if not self._logs_dir.exists():
             return False
-        # Exclude placeholder files (source=_placeholder)
-        for p in self._logs_dir.rglob("*.parquet"):
-            if "_placeholder" not in str(p):
-                return True
-        return False
+        # Let DuckDB enumerate files natively; exclude placeholder files
+        # (source=_placeholder)
+        row = self._conn.execute(
+            "SELECT 1 FROM glob(?) WHERE NOT contains(file, '_placeholder') LIMIT 1",
+            [self._parquet_glob],
+        ).fetchone()
+        return row is not None
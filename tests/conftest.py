@@ -1,12 +1,17 @@
 """Shared fixtures for blq tests."""
 
-import os
+import importlib.util
 import shutil
 import tempfile
 from pathlib import Path
 
 import pytest
 
+# Skip the MCP tests without importing fastmcp when it is not installed
+collect_ignore = []
+if importlib.util.find_spec("fastmcp") is None:
+    collect_ignore.append("test_mcp_server.py")
+
 
 @pytest.fixture
 def temp_dir():
@@ -34,31 +39,46 @@ def lq_dir(temp_dir):
 
 
 @pytest.fixture
-def chdir_temp(temp_dir):
+def chdir_temp(temp_dir, monkeypatch):
     """Change to temp directory and restore after test."""
-    original = os.getcwd()
-    os.chdir(temp_dir)
-    yield temp_dir
-    os.chdir(original)
+    monkeypatch.chdir(temp_dir)
+    return temp_dir
 
 
-@pytest.fixture
-def initialized_project(chdir_temp):
-    """A project directory with blq initialized."""
+def _copy_template(template, dest):
+    """Copy a session/module template project into dest and return dest."""
+    # Plain copies, not hardlinks: tests write to the YAML files and blq.duckdb
+    shutil.copytree(template, dest, dirs_exist_ok=True)
+    return dest
+
+
+@pytest.fixture(scope="session")
+def copy_template():
+    """Fixture that provides a helper to copy a template project."""
+    return _copy_template
+
+
+@pytest.fixture(scope="session")
+def initialized_template(tmp_path_factory):
+    """A project with blq initialized, created once per session."""
     import argparse
 
     from blq.cli import cmd_init
 
-    args = argparse.Namespace()
-    cmd_init(args)
-
-    return chdir_temp
+    template = tmp_path_factory.mktemp("lq_template")
+    cmd_init(argparse.Namespace(cwd=template))
+    return template
 
 
 @pytest.fixture
-def sample_build_script(temp_dir):
-    """Create a sample build script that produces errors."""
-    script = temp_dir / "build.sh"
+def initialized_project(chdir_temp, initialized_template):
+    """A project directory with blq initialized (a copy of the session template)."""
+    return _copy_template(initialized_template, chdir_temp)
+
+
+def _write_sample_build_script(directory):
+    """Write a build script that produces errors into directory."""
+    script = directory / "build.sh"
     script.write_text("""#!/bin/bash
 echo "Building..."
 echo "src/main.c:15:5: error: undefined variable 'foo'"
@@ -72,9 +92,21 @@ exit 1
 
 
 @pytest.fixture
-def sample_success_script(temp_dir):
-    """Create a sample script that succeeds."""
-    script = temp_dir / "success.sh"
+def sample_build_script(temp_dir):
+    """Create a sample build script that produces errors."""
+    return _write_sample_build_script(temp_dir)
+
+
+@pytest.fixture(scope="session")
+def write_sample_build_script():
+    """Fixture that provides a helper to write the sample build script."""
+    return _write_sample_build_script
+
+
+@pytest.fixture(scope="session")
+def sample_success_script(tmp_path_factory):
+    """Create a sample script that succeeds (read-only, shared)."""
+    script = tmp_path_factory.mktemp("scripts") / "success.sh"
     script.write_text("""#!/bin/bash
 echo "All tests passed!"
 exit 0
@@ -83,11 +115,12 @@ exit 0
     return script
 
 
-def _run_adhoc_command(command, name=None, format="auto", quiet=True, json_output=False):
+def _run_adhoc_command(command, name=None, format="auto", quiet=True, json_output=False, cwd=None):
     """Helper to run an ad-hoc command using cmd_exec.
 
     Use this instead of cmd_run when you just need to generate test data
-    without registering the command.
+    without registering the command. cwd selects the project (default: the
+    current directory).
     """
     import argparse
 
@@ -106,6 +139,7 @@ def _run_adhoc_command(command, name=None, format="auto", quiet=True, json_outpu
         include_warnings=False,
         error_limit=20,
         no_capture=False,
+        cwd=cwd,
     )
     try:
         cmd_exec(args)
@@ -113,7 +147,61 @@ def _run_adhoc_command(command, name=None, format="auto", quiet=True, json_outpu
         pass
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def run_adhoc_command():
     """Fixture that provides a helper to run ad-hoc commands."""
     return _run_adhoc_command
+
+
+_REGISTER_ARGS = {
+    "name": None,
+    "cmd": [],
+    "description": "",
+    "timeout": 300,
+    "format": "auto",
+    "no_capture": False,
+    "force": False,
+}
+
+_RUN_ARGS = {
+    "command": [],
+    "name": None,
+    "format": "auto",
+    "keep_raw": False,
+    "json": True,
+    "markdown": False,
+    "quiet": False,
+    "summary": False,
+    "verbose": False,
+    "include_warnings": False,
+    "error_limit": 20,
+    "capture": None,
+    "register": False,
+    "positional_args": None,
+}
+
+
+def _make_register_args(**overrides):
+    """Build `blq register` args, overriding the CLI defaults as given."""
+    import argparse
+
+    return argparse.Namespace(**{**_REGISTER_ARGS, **overrides})
+
+
+def _make_run_args(**overrides):
+    """Build `blq run` args (JSON output by default), overriding as given."""
+    import argparse
+
+    return argparse.Namespace(**{**_RUN_ARGS, **overrides})
+
+
+@pytest.fixture(scope="session")
+def make_register_args():
+    """Fixture that provides a helper to build `blq register` args."""
+    return _make_register_args
+
+
+@pytest.fixture(scope="session")
+def make_run_args():
+    """Fixture that provides a helper to build `blq run` args."""
+    return _make_run_args
@@ -14,7 +14,10 @@ Tests the BIRD storage backend including:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import io
 import os
+import shutil
 import tempfile
 import uuid
 from datetime import datetime
@@ -25,15 +28,24 @@ import pytest
 
 from blq.bird import (
     BirdStore,
-    EventRecord,
     InvocationRecord,
-    OutputRecord,
-    SessionRecord,
+    compute_content_hash,
     write_bird_invocation,
 )
-from blq.commands.core import BlqConfig, RegisteredCommand, write_run_parquet
+from blq.commands.core import BlqConfig, write_run_parquet
 from blq.commands.init_cmd import cmd_init
-from blq.commands.migrate import cmd_migrate, _migrate_parquet_to_bird
+from blq.commands.migrate import _migrate_parquet_to_bird, cmd_migrate
+
+# DuckDB settings for throwaway test databases: tiny inputs gain nothing from
+# extra threads or ordered scans, and WAL checkpoints are never needed
+TEST_DB_CONFIG = {
+    "threads": 1,
+    "preserve_insertion_order": False,
+    "checkpoint_threshold": "1TB",
+}
+
+# Fixed timestamp for run metadata, so tests are deterministic
+_NOW_ISO = datetime(2024, 1, 15, 10, 0, 0).isoformat()
 
 
 @pytest.fixture
@@ -44,49 +56,63 @@ def temp_dir():
 
 
 @pytest.fixture
-def bird_store(temp_dir):
-    """Create a BirdStore in a temporary directory."""
+def empty_lq_dir(temp_dir):
+    """Create a bare .lq directory with blob storage but no schema."""
     lq_dir = temp_dir / ".lq"
-    lq_dir.mkdir()
     (lq_dir / "blobs" / "content").mkdir(parents=True)
+    return lq_dir
 
-    store = BirdStore.open(lq_dir)
+
+@pytest.fixture
+def bird_store(empty_lq_dir):
+    """Create a BirdStore in a temporary directory."""
+    store = BirdStore.open(empty_lq_dir, config=TEST_DB_CONFIG)
     yield store
     store.close()
 
 
+def _init_template(root: Path, bird: bool, project: str) -> Path:
+    """Run cmd_init once in root and return it for copying."""
+    args = argparse.Namespace()
+    args.cwd = str(root)
+    args.mcp = False
+    args.detect = False
+    args.detect_mode = "none"
+    args.yes = False
+    args.force = False
+    args.bird = bird
+    args.namespace = "test"
+    args.project = project
+
+    cmd_init(args)
+    return root
+
+
+@pytest.fixture(scope="session")
+def bird_template_dir(tmp_path_factory):
+    """A BIRD-mode project initialized once per session (do not modify)."""
+    return _init_template(tmp_path_factory.mktemp("bird_template"), True, "bird-test")
+
+
+@pytest.fixture(scope="session")
+def parquet_template_dir(tmp_path_factory):
+    """A parquet-mode project initialized once per session (do not modify)."""
+    return _init_template(tmp_path_factory.mktemp("parquet_template"), False, "parquet-test")
+
+
 @pytest.fixture
-def bird_initialized_dir(temp_dir):
+def bird_initialized_dir(temp_dir, bird_template_dir):
     """Initialize a directory with BIRD mode."""
-    original_cwd = os.getcwd()
-    os.chdir(temp_dir)
-    try:
-        args = argparse.Namespace()
-        args.mcp = False
-        args.detect = False
-        args.detect_mode = "none"
-        args.yes = False
-        args.force = False
-        args.bird = True
-        args.namespace = "test"
-        args.project = "bird-test"
-
-        cmd_init(args)
-        yield temp_dir
-    finally:
-        os.chdir(original_cwd)
+    shutil.copytree(bird_template_dir / ".lq", temp_dir / ".lq")
+    return temp_dir
 
 
 class TestBirdStoreInit:
     """Tests for BirdStore initialization."""
 
-    def test_open_creates_schema(self, temp_dir):
+    def test_open_creates_schema(self, empty_lq_dir):
         """Opening a BirdStore creates the schema."""
-        lq_dir = temp_dir / ".lq"
-        lq_dir.mkdir()
-        (lq_dir / "blobs" / "content").mkdir(parents=True)
-
-        store = BirdStore.open(lq_dir)
+        store = BirdStore.open(empty_lq_dir)
 
         # Check tables exist
         tables = store.connection.execute(
@@ -103,28 +129,48 @@ class TestBirdStoreInit:
 
         store.close()
 
-    def test_open_idempotent(self, temp_dir):
+    def test_open_idempotent(self, empty_lq_dir):
         """Opening a BirdStore multiple times doesn't fail."""
-        lq_dir = temp_dir / ".lq"
-        lq_dir.mkdir()
-        (lq_dir / "blobs" / "content").mkdir(parents=True)
-
         # First open
-        store1 = BirdStore.open(lq_dir)
+        store1 = BirdStore.open(empty_lq_dir)
         store1.close()
 
         # Second open should work
-        store2 = BirdStore.open(lq_dir)
+        store2 = BirdStore.open(empty_lq_dir)
         assert store2.invocation_count() == 0
         store2.close()
 
-    def test_context_manager(self, temp_dir):
-        """BirdStore works as context manager."""
-        lq_dir = temp_dir / ".lq"
-        lq_dir.mkdir()
-        (lq_dir / "blobs" / "content").mkdir(parents=True)
+    def test_open_read_only(self, empty_lq_dir):
+        """Read-only stores can query but not write."""
+        BirdStore.open(empty_lq_dir).close()
 
-        with BirdStore.open(lq_dir) as store:
+        with BirdStore.open(empty_lq_dir, read_only=True) as store:
+            assert store.invocation_count() == 0
+            with pytest.raises(duckdb.Error):
+                store.ensure_session("test", "blq-test", "blq", "cli")
+
+    def test_open_applies_config(self, empty_lq_dir):
+        """DuckDB settings passed to open() apply to the connection."""
+        with BirdStore.open(empty_lq_dir, config=TEST_DB_CONFIG) as store:
+            threads = store.connection.execute("SELECT current_setting('threads')").fetchone()[0]
+            assert threads == 1
+
+    def test_open_shares_database(self, empty_lq_dir):
+        """Concurrent stores on one database see each other's writes."""
+        store1 = BirdStore.open(empty_lq_dir)
+        store2 = BirdStore.open(empty_lq_dir)
+
+        store1.ensure_session("test", "blq-test", "blq", "cli")
+        result = store2.connection.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        assert result[0] == 1
+
+        store1.close()
+        assert store2.invocation_count() == 0
+        store2.close()
+
+    def test_context_manager(self, empty_lq_dir):
+        """BirdStore works as context manager."""
+        with BirdStore.open(empty_lq_dir) as store:
             assert store.invocation_count() == 0
 
 
@@ -295,13 +341,75 @@ class TestEventManagement:
             },
         ]
 
-        count = bird_store.write_events(
-            inv.id, events, client_id="blq-test", format_used="gcc"
-        )
+        count = bird_store.write_events(inv.id, events, client_id="blq-test", format_used="gcc")
 
         assert count == 2
         assert bird_store.event_count() == 2
 
+    def test_write_events_preserves_values(self, bird_store):
+        """write_events keeps NULLs, codes, and metadata intact."""
+        inv = InvocationRecord(
+            id=str(uuid.uuid4()),
+            session_id="test",
+            cmd="make",
+            cwd="/tmp",
+            exit_code=1,
+            client_id="blq-test",
+        )
+        bird_store.write_invocation(inv)
+
+        events = [
+            {
+                "severity": "error",
+                "file_path": "a.c",
+                "line_number": 3,
+                "message": "boom",
+                "error_code": "E1",
+                "metadata": {"k": "v"},
+            },
+            {"severity": "warning", "message": "no location"},
+        ]
+        bird_store.write_events(inv.id, events, client_id="blq-test", hostname="h")
+
+        rows = bird_store.connection.execute(
+            """
+            SELECT event_index, severity, line_number, code, metadata->>'k', hostname
+            FROM events ORDER BY event_index
+            """
+        ).fetchall()
+
+        assert rows == [
+            (0, "error", 3, "E1", "v", "h"),
+            (1, "warning", None, None, None, "h"),
+        ]
+
+    def test_write_events_late_optional_fields(self, bird_store):
+        """Fields first set in the last row of a large batch keep their values."""
+        inv = InvocationRecord(
+            id=str(uuid.uuid4()),
+            session_id="test",
+            cmd="make",
+            cwd="/tmp",
+            exit_code=1,
+            client_id="blq-test",
+        )
+        bird_store.write_invocation(inv)
+
+        # Numeric code up front, then NULLs well past DuckDB's type sample
+        events = [{"severity": "error", "message": "first", "code": 123}]
+        events += [{"severity": "error", "message": f"e{i}"} for i in range(5000)]
+        events.append({"severity": "error", "message": "last", "column_number": 7, "code": "E1"})
+        bird_store.write_events(inv.id, events, client_id="blq-test")
+
+        rows = bird_store.connection.execute(
+            """
+            SELECT column_number, code FROM events
+            WHERE event_index IN (0, 5001) ORDER BY event_index
+            """
+        ).fetchall()
+
+        assert rows == [(None, "123"), (7, "E1")]
+
     def test_write_events_empty(self, bird_store):
         """write_events handles empty event list."""
         inv = InvocationRecord(
@@ -366,6 +474,27 @@ class TestOutputManagement:
         blob_path = bird_store._blob_dir / output.storage_ref.replace("file:", "")
         assert blob_path.exists()
 
+    def test_write_output_stream(self, bird_store):
+        """File objects are streamed to blobs with the same hash as bytes."""
+        inv_id = str(uuid.uuid4())
+        content = os.urandom(200_000)
+        from_stream = bird_store.write_output(inv_id, "stdout", io.BytesIO(content))
+        from_view = bird_store.write_output(inv_id, "stderr", memoryview(content))
+
+        assert from_stream.storage_type == "blob"
+        assert from_stream.byte_length == len(content)
+        assert from_stream.content_hash == compute_content_hash(content)
+        assert from_stream.storage_ref == from_view.storage_ref
+
+        blob_path = bird_store._blob_dir / from_stream.storage_ref.replace("file:", "")
+        assert blob_path.read_bytes() == content
+        # Temp files are cleaned up
+        assert not list(bird_store._blob_dir.glob(".tmp.*"))
+
+        small = bird_store.write_output(inv_id, "combined", io.BytesIO(b"hello"))
+        assert small.storage_type == "inline"
+        assert small.byte_length == 5
+
     def test_blob_deduplication(self, bird_store):
         """Identical content is deduplicated."""
         inv = InvocationRecord(
@@ -387,15 +516,58 @@ class TestOutputManagement:
         # Same hash
         assert output1.content_hash == output2.content_hash
 
+    def test_blob_dedup_skips_rewrite(self, bird_store):
+        """A dedup hit leaves the existing blob file untouched."""
+        inv = InvocationRecord(
+            id=str(uuid.uuid4()),
+            session_id="test",
+            cmd="cat bigfile",
+            cwd="/tmp",
+            exit_code=0,
+            client_id="blq-test",
+        )
+        bird_store.write_invocation(inv)
+
+        content = b"z" * 5000
+        output = bird_store.write_output(inv.id, "stdout", content)
+        blob_path = bird_store._blob_dir / output.storage_ref.replace("file:", "")
+        inode = blob_path.stat().st_ino
+
+        bird_store.write_output(inv.id, "stderr", content)
+
+        assert blob_path.stat().st_ino == inode
+        ref_count = bird_store.connection.execute(
+            "SELECT ref_count FROM blob_registry WHERE content_hash = ?",
+            [output.content_hash],
+        ).fetchone()[0]
+        assert ref_count == 2
+
+    def test_content_hash_is_blake2b(self, bird_store):
+        """Output hashes are 256-bit BLAKE2b digests of the content."""
+        inv = InvocationRecord(
+            id=str(uuid.uuid4()),
+            session_id="test",
+            cmd="echo hello",
+            cwd="/tmp",
+            exit_code=0,
+            client_id="blq-test",
+        )
+        bird_store.write_invocation(inv)
+
+        content = b"hash me\n"
+        output = bird_store.write_output(inv.id, "combined", content)
+
+        expected = hashlib.blake2b(content, digest_size=32).hexdigest()
+        assert output.content_hash == expected
+        assert compute_content_hash(content) == expected
+
 
 class TestWriteBirdInvocation:
     """Tests for the write_bird_invocation helper function."""
 
-    def test_write_bird_invocation(self, temp_dir):
+    def test_write_bird_invocation(self, temp_dir, empty_lq_dir):
         """write_bird_invocation creates complete invocation."""
-        lq_dir = temp_dir / ".lq"
-        lq_dir.mkdir()
-        (lq_dir / "blobs" / "content").mkdir(parents=True)
+        lq_dir = empty_lq_dir
 
         # Initialize schema
         store = BirdStore.open(lq_dir)
@@ -408,8 +580,8 @@ class TestWriteBirdInvocation:
             "source_name": "test",
             "source_type": "run",
             "command": "pytest",
-            "started_at": datetime.now().isoformat(),
-            "completed_at": datetime.now().isoformat(),
+            "started_at": _NOW_ISO,
+            "completed_at": _NOW_ISO,
             "exit_code": 1,
             "cwd": str(temp_dir),
             "hostname": "testhost",
@@ -421,16 +593,14 @@ class TestWriteBirdInvocation:
         assert db_path.exists()
 
         # Verify data was written
-        store = BirdStore.open(lq_dir)
+        store = BirdStore.open(lq_dir, read_only=True)
         assert store.invocation_count() == 1
         assert store.event_count() == 1
         store.close()
 
-    def test_write_bird_invocation_with_output(self, temp_dir):
+    def test_write_bird_invocation_with_output(self, temp_dir, empty_lq_dir):
         """write_bird_invocation stores output when provided."""
-        lq_dir = temp_dir / ".lq"
-        lq_dir.mkdir()
-        (lq_dir / "blobs" / "content").mkdir(parents=True)
+        lq_dir = empty_lq_dir
 
         store = BirdStore.open(lq_dir)
         store.close()
@@ -439,8 +609,8 @@ class TestWriteBirdInvocation:
             "source_name": "test",
             "source_type": "run",
             "command": "echo hello",
-            "started_at": datetime.now().isoformat(),
-            "completed_at": datetime.now().isoformat(),
+            "started_at": _NOW_ISO,
+            "completed_at": _NOW_ISO,
             "exit_code": 0,
             "cwd": str(temp_dir),
         }
@@ -449,7 +619,7 @@ class TestWriteBirdInvocation:
         inv_id, _ = write_bird_invocation([], run_meta, lq_dir, output=output)
 
         # Verify output was written
-        store = BirdStore.open(lq_dir)
+        store = BirdStore.open(lq_dir, read_only=True)
         result = store.connection.execute(
             "SELECT COUNT(*) FROM outputs WHERE invocation_id = ?", [inv_id]
         ).fetchone()
@@ -470,6 +640,22 @@ class TestBirdInit:
         assert (lq_dir / "schema.sql").exists()
         assert (lq_dir / "config.yaml").exists()
 
+    def test_init_uses_explicit_cwd(self, temp_dir):
+        """cmd_init creates .lq in args.cwd without changing directory."""
+        original_cwd = os.getcwd()
+        args = argparse.Namespace(
+            cwd=str(temp_dir),
+            bird=True,
+            namespace="test",
+            project="cwd-test",
+        )
+
+        cmd_init(args)
+
+        assert os.getcwd() == original_cwd
+        assert (temp_dir / ".lq" / "blq.duckdb").exists()
+        assert BlqConfig.load(temp_dir / ".lq").project == "cwd-test"
+
     def test_init_bird_sets_storage_mode(self, bird_initialized_dir):
         """blq init --bird sets storage mode in config."""
         config = BlqConfig.load(bird_initialized_dir / ".lq")
@@ -554,9 +740,7 @@ class TestBirdCompatibilityViews:
         bird_store.write_invocation(inv)
 
         # Use the macro
-        result = bird_store.connection.execute(
-            "SELECT COUNT(*) FROM blq_load_events()"
-        ).fetchone()
+        result = bird_store.connection.execute("SELECT COUNT(*) FROM blq_load_events()").fetchone()
 
         # Should return 0 events (invocation exists but no events)
         assert result[0] == 0
@@ -601,79 +785,78 @@ class TestSQLSplitting:
         assert "CREATE MACRO" in statements[0]
         assert "SELECT 'done'" in statements[1]
 
+    def test_split_semicolon_in_string(self):
+        """Semicolons inside string literals don't split statements."""
+        sql = "SELECT 'a;b'; SELECT 2;"
+        statements = BirdStore._split_sql_statements(sql)
 
-@pytest.fixture
-def parquet_initialized_dir(temp_dir):
-    """Initialize a directory with parquet (v1) mode and some test data."""
-    original_cwd = os.getcwd()
-    os.chdir(temp_dir)
-    try:
-        # Initialize without BIRD mode (parquet)
-        args = argparse.Namespace()
-        args.mcp = False
-        args.detect = False
-        args.detect_mode = "none"
-        args.yes = False
-        args.force = False
-        args.bird = False
-        args.namespace = "test"
-        args.project = "parquet-test"
+        assert statements == ["SELECT 'a;b'", "SELECT 2"]
 
-        cmd_init(args)
+    def test_split_falls_back_on_parse_error(self):
+        """Unparseable scripts are still split by the Python fallback."""
+        sql = "SELEC 1; -- note; here\nSELECT 2;"
+        statements = BirdStore._split_sql_statements(sql)
 
-        # Write some test parquet data
-        lq_dir = temp_dir / ".lq"
-        events = [
-            {
-                "event_id": 0,
-                "severity": "error",
-                "file_path": "src/main.c",
-                "line_number": 10,
-                "message": "undefined reference",
-                "tool_name": "gcc",
-            },
-            {
-                "event_id": 1,
-                "severity": "warning",
-                "file_path": "src/util.c",
-                "line_number": 25,
-                "message": "unused variable",
-                "tool_name": "gcc",
-            },
-        ]
-        run_meta = {
-            "run_id": 1,
-            "source_name": "build",
-            "source_type": "run",
-            "command": "make build",
-            "started_at": "2024-01-15T10:00:00",
-            "completed_at": "2024-01-15T10:01:00",
-            "exit_code": 1,
-            "cwd": str(temp_dir),
-            "hostname": "testhost",
-            "platform": "Linux",
-            "arch": "x86_64",
-        }
+        assert len(statements) == 2
+        assert statements[0] == "SELEC 1"
 
-        write_run_parquet(events, run_meta, lq_dir)
 
-        # Write a second run with no events
-        run_meta2 = {
-            "run_id": 2,
-            "source_name": "test",
-            "source_type": "run",
-            "command": "pytest",
-            "started_at": "2024-01-15T11:00:00",
-            "completed_at": "2024-01-15T11:02:00",
-            "exit_code": 0,
-            "cwd": str(temp_dir),
-            "hostname": "testhost",
-        }
-        write_run_parquet([{}], run_meta2, lq_dir)
+@pytest.fixture
+def parquet_initialized_dir(temp_dir, parquet_template_dir):
+    """Initialize a directory with parquet (v1) mode and some test data."""
+    shutil.copytree(parquet_template_dir / ".lq", temp_dir / ".lq")
 
-        yield temp_dir
-    finally:
-        os.chdir(original_cwd)
+    # Write some test parquet data
+    lq_dir = temp_dir / ".lq"
+    events = [
+        {
+            "event_id": 0,
+            "severity": "error",
+            "file_path": "src/main.c",
+            "line_number": 10,
+            "message": "undefined reference",
+            "tool_name": "gcc",
+        },
+        {
+            "event_id": 1,
+            "severity": "warning",
+            "file_path": "src/util.c",
+            "line_number": 25,
+            "message": "unused variable",
+            "tool_name": "gcc",
+        },
+    ]
+    run_meta = {
+        "run_id": 1,
+        "source_name": "build",
+        "source_type": "run",
+        "command": "make build",
+        "started_at": "2024-01-15T10:00:00",
+        "completed_at": "2024-01-15T10:01:00",
+        "exit_code": 1,
+        "cwd": str(temp_dir),
+        "hostname": "testhost",
+        "platform": "Linux",
+        "arch": "x86_64",
+    }
+
+    write_run_parquet(events, run_meta, lq_dir)
+
+    # Write a second run with no events
+    run_meta2 = {
+        "run_id": 2,
+        "source_name": "test",
+        "source_type": "run",
+        "command": "pytest",
+        "started_at": "2024-01-15T11:00:00",
+        "completed_at": "2024-01-15T11:02:00",
+        "exit_code": 0,
+        "cwd": str(temp_dir),
+        "hostname": "testhost",
+    }
+    write_run_parquet([{}], run_meta2, lq_dir)
+
+    return temp_dir
 
 
 class TestMigration:
@@ -683,9 +866,7 @@ class TestMigration:
         """Dry run shows what would be migrated."""
         config = BlqConfig.load(parquet_initialized_dir / ".lq")
 
-        invocations, events = _migrate_parquet_to_bird(
-            config, dry_run=True, verbose=False
-        )
+        invocations, events = _migrate_parquet_to_bird(config, dry_run=True, verbose=False)
 
         assert invocations == 2  # Two runs
         assert events == 2  # Two events (error + warning)
@@ -693,20 +874,35 @@ class TestMigration:
         # Config should not be changed
         assert config.storage_mode == "parquet"
 
+    def test_migrate_skips_rows_without_run_id(self, parquet_initialized_dir):
+        """Rows with a NULL run_id don't become an extra invocation."""
+        lq_dir = parquet_initialized_dir / ".lq"
+        partition = next((lq_dir / "logs").rglob("*.parquet")).parent
+        orphan = partition / "orphan.parquet"
+        duckdb.sql(
+            "SELECT NULL::INTEGER AS run_id, 1 AS event_id, 'error' AS severity"
+        ).write_parquet(str(orphan))
+        config = BlqConfig.load(lq_dir)
+
+        assert _migrate_parquet_to_bird(config, dry_run=True) == (2, 2)
+        assert _migrate_parquet_to_bird(config, dry_run=False) == (2, 2)
+
+        with BirdStore.open(lq_dir, read_only=True) as store:
+            assert store.invocation_count() == 2
+            assert store.event_count() == 2
+
     def test_migrate_actual(self, parquet_initialized_dir):
         """Migration converts parquet data to BIRD."""
         config = BlqConfig.load(parquet_initialized_dir / ".lq")
         lq_dir = parquet_initialized_dir / ".lq"
 
-        invocations, events = _migrate_parquet_to_bird(
-            config, dry_run=False, verbose=False
-        )
+        invocations, events = _migrate_parquet_to_bird(config, dry_run=False, verbose=False)
 
         assert invocations == 2
         assert events == 2
 
         # Verify BIRD data
-        store = BirdStore.open(lq_dir)
+        store = BirdStore.open(lq_dir, read_only=True)
         assert store.invocation_count() == 2
         assert store.event_count() == 2
 
@@ -718,6 +914,32 @@ class TestMigration:
 
         store.close()
 
+    def test_migrate_verbose_reports_committed_rows(self, parquet_initialized_dir, capsys):
+        """Verbose progress is printed after the commit, from the stored rows."""
+        config = BlqConfig.load(parquet_initialized_dir / ".lq")
+
+        _migrate_parquet_to_bird(config, dry_run=False, verbose=True)
+
+        out = capsys.readouterr().out
+        assert "Migrated run 1: build\n    Migrated 2 event(s)" in out
+        assert "Migrated run 2: test" in out
+
+    def test_migrate_failure_reports_nothing_migrated(
+        self, parquet_initialized_dir, capsys, monkeypatch
+    ):
+        """A rolled-back migration prints no success lines."""
+        from blq.commands import migrate
+
+        monkeypatch.setattr(migrate, "_INSERT_EVENTS_SQL", "SELECT * FROM no_such_table")
+        config = BlqConfig.load(parquet_initialized_dir / ".lq")
+
+        with pytest.raises(duckdb.Error):
+            _migrate_parquet_to_bird(config, dry_run=False, verbose=True)
+
+        assert "Migrated" not in capsys.readouterr().out
+        with BirdStore.open(parquet_initialized_dir / ".lq", read_only=True) as store:
+            assert store.invocation_count() == 0
+
     def test_migrate_preserves_metadata(self, parquet_initialized_dir):
         """Migration preserves all metadata fields."""
         config = BlqConfig.load(parquet_initialized_dir / ".lq")
@@ -725,7 +947,7 @@ class TestMigration:
 
         _migrate_parquet_to_bird(config, dry_run=False, verbose=False)
 
-        store = BirdStore.open(lq_dir)
+        store = BirdStore.open(lq_dir, read_only=True)
 
         # Check that metadata was preserved
         result = store.connection.execute("""
@@ -738,13 +960,17 @@ class TestMigration:
         assert result[1] == "Linux"
         assert result[2] == "build"
 
+        # Migrated events are visible through the compatibility view
+        flat = store.connection.execute("SELECT COUNT(*) FROM blq_events_flat").fetchone()
+        events = store.connection.execute("SELECT COUNT(*) FROM events").fetchone()
+        assert flat[0] == events[0]
+
         store.close()
 
     def test_cmd_migrate_to_bird(self, parquet_initialized_dir):
         """blq migrate --to-bird command works."""
-        os.chdir(parquet_initialized_dir)
-
         args = argparse.Namespace()
+        args.cwd = str(parquet_initialized_dir)
         args.to_bird = True
         args.dry_run = False
         args.keep_parquet = True
@@ -757,31 +983,14 @@ class TestMigration:
         config = BlqConfig.load(parquet_initialized_dir / ".lq")
         assert config.storage_mode == "bird"
 
-    def test_migrate_no_data(self, temp_dir):
+    def test_migrate_no_data(self, temp_dir, parquet_template_dir):
         """Migration handles empty directory gracefully."""
-        original_cwd = os.getcwd()
-        os.chdir(temp_dir)
-        try:
-            # Initialize without BIRD mode but don't add data
-            args = argparse.Namespace()
-            args.mcp = False
-            args.detect = False
-            args.detect_mode = "none"
-            args.yes = False
-            args.force = False
-            args.bird = False
-            args.namespace = "test"
-            args.project = "empty-test"
-
-            cmd_init(args)
-
-            config = BlqConfig.load(temp_dir / ".lq")
-            invocations, events = _migrate_parquet_to_bird(
-                config, dry_run=False, verbose=False
-            )
+        # Initialized without BIRD mode and no data added
+        shutil.copytree(parquet_template_dir / ".lq", temp_dir / ".lq")
+
+        config = BlqConfig.load(temp_dir / ".lq")
+        invocations, events = _migrate_parquet_to_bird(config, dry_run=False, verbose=False)
 
-            # Should handle gracefully with no data
-            assert invocations == 0
-            assert events == 0
-        finally:
-            os.chdir(original_cwd)
+        # Should handle gracefully with no data
+        assert invocations == 0
+        assert events == 0
@@ -129,6 +129,17 @@ class TestExpandCommand:
         )
         assert result == "kubectl apply -f manifest.yaml -n staging"
 
+    def test_value_containing_placeholder_text(self):
+        """Substituted values are not re-scanned for placeholders."""
+        result = expand_command("echo {a:} {b:}", {}, ["{b:}", "x"])
+        assert result == "echo {b:} x"
+
+    def test_registered_command_template(self):
+        """A RegisteredCommand can be expanded directly."""
+        cmd = RegisteredCommand(name="test", cmd="pytest {path:=tests/}")
+        assert expand_command(cmd, {}, ["unit/"]) == "pytest unit/"
+        assert cmd.placeholders is cmd.placeholders
+
     def test_extra_args_appended(self):
         """Extra args are appended to command."""
         result = expand_command("pytest {path:=tests/}", {}, ["unit/"], ["--verbose", "-x"])
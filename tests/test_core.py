@@ -22,7 +22,7 @@ from blq.cli import (
     write_run_parquet,
 )
 from blq.commands import cmd_exec
-from blq.commands.core import BlqConfig, RegisteredCommand
+from blq.commands.core import BlqConfig, RegisteredCommand, write_runs_parquet
 
 
 class TestGetLqDir:
@@ -48,6 +48,17 @@ class TestGetLqDir:
         result = get_lq_dir()
         assert result == lq_path
 
+    def test_finds_lq_from_start_dir(self, chdir_temp, temp_dir):
+        """Search from an explicit start directory instead of cwd."""
+        lq_path = chdir_temp / ".lq"
+        lq_path.mkdir()
+        subdir = chdir_temp / "subdir"
+        subdir.mkdir()
+
+        # cwd is unrelated; the start directory decides
+        os.chdir(temp_dir.parent)
+        assert get_lq_dir(subdir) == lq_path
+
     def test_returns_none_when_not_found(self, temp_dir):
         """Return None when .lq not found."""
         # Create a clean subdirectory with no .lq anywhere in its hierarchy
@@ -114,6 +125,19 @@ class TestCmdInit:
         captured = capsys.readouterr()
         assert "Initialized .lq" in captured.out
 
+    def test_rerun_keeps_existing_files(self, chdir_temp, capsys):
+        """Re-running init leaves commands.yaml and .mcp.json alone."""
+        cmd_init(argparse.Namespace())
+        commands = chdir_temp / ".lq" / "commands.yaml"
+        commands.write_text("commands:\n  build:\n    cmd: make\n")
+        mcp = chdir_temp / ".mcp.json"
+        mcp.write_text("{}")
+
+        cmd_init(argparse.Namespace(mcp=True))
+
+        assert "cmd: make" in commands.read_text()
+        assert mcp.read_text() == "{}"
+
 
 class TestGetNextRunId:
     """Tests for get_next_run_id function."""
@@ -135,6 +159,17 @@ class TestGetNextRunId:
         result = get_next_run_id(lq_dir)
         assert result == 2
 
+    def test_ignores_non_run_files(self, lq_dir):
+        """Only files named with a numeric run prefix count."""
+        partition = lq_dir / "logs" / "date=2024-01-01" / "source=run"
+        partition.mkdir(parents=True)
+        (partition / "012_build_120000.parquet").touch()
+        (partition / "7.parquet").touch()
+        (partition / "notes_99.parquet").touch()
+        (partition / "100_build.log").touch()
+
+        assert get_next_run_id(lq_dir) == 13
+
 
 class TestGetConnection:
     """Tests for database connection setup."""
@@ -153,6 +188,14 @@ class TestGetConnection:
         result = conn.execute("SELECT blq_base_path()").fetchone()
         assert result[0] is not None
 
+    def test_loads_macros_calling_base_path(self, lq_dir):
+        """Macros that call blq_base_path() are loaded, not skipped."""
+        # Macros over parquet files only load once some data exists
+        write_run_parquet([{"severity": "error"}], {"run_id": 1}, lq_dir)
+
+        conn = get_connection(lq_dir)
+        assert conn.execute("SELECT COUNT(*) FROM blq_load_events()").fetchone()[0] == 1
+
     def test_creates_views(self, initialized_project, sample_build_script, run_adhoc_command):
         """Create macros that work with parquet files."""
         # Create some data first using ad-hoc execution
@@ -192,6 +235,33 @@ class TestWriteRunParquet:
         assert "date=" in str(filepath)
         assert "source=" in str(filepath)
 
+    def test_column_types_are_pinned(self, lq_dir):
+        """Nullable ints and single-entry maps keep their declared types."""
+        import duckdb
+
+        big = 2**60 + 1
+        events = [{"event_id": 1, "line_number": None}, {"event_id": 2, "line_number": big}]
+        run_meta = {"run_id": 1, "environment": {"PATH": "/bin"}, "ci": None}
+
+        filepath = write_run_parquet(events, run_meta, lq_dir)
+
+        rows = duckdb.sql(
+            f"SELECT line_number, environment, ci FROM '{filepath}' ORDER BY event_id"
+        ).fetchall()
+        assert rows == [(None, {"PATH": "/bin"}, None), (big, {"PATH": "/bin"}, None)]
+
+    def test_loose_values_are_cast_to_schema_types(self, lq_dir):
+        """Floats and string booleans are coerced, not rejected."""
+        import duckdb
+
+        events = [{"event_id": 1, "line_number": 3.5}]
+        run_meta = {"run_id": 1, "git_dirty": "true"}
+
+        filepath = write_run_parquet(events, run_meta, lq_dir)
+
+        rows = duckdb.sql(f"SELECT line_number, git_dirty FROM '{filepath}'").fetchall()
+        assert rows == [(4, True)]
+
     def test_parquet_contains_data(self, lq_dir):
         """Parquet file contains correct data."""
         import duckdb
@@ -226,6 +296,41 @@ class TestWriteRunParquet:
         assert row_dict["run_id"] == 42
         assert row_dict["severity"] == "error"
 
+    def test_write_runs_parquet_single_file(self, lq_dir):
+        """Runs sharing a partition are written to one file."""
+        import duckdb
+
+        runs = [
+            (
+                [{"severity": "error"}, {"severity": "warning"}],
+                {"run_id": 3, "source_name": "build"},
+            ),
+            ([], {"run_id": 4, "source_name": "test"}),
+        ]
+
+        paths = write_runs_parquet(runs, lq_dir)
+
+        assert len(paths) == 1
+        conn = duckdb.connect(":memory:")
+        result = conn.execute(
+            f"SELECT run_id, COUNT(*) FROM '{paths[0]}' GROUP BY run_id ORDER BY run_id"
+        ).fetchall()
+        assert result == [(3, 2), (4, 1)]
+        assert get_next_run_id(lq_dir) == 5
+        # Named like single-run files, listing each source
+        assert paths[0].name.startswith("004_build+test_")
+
+    def test_write_runs_parquet_single_source_name(self, lq_dir):
+        """A batch from one source is named after it, like a single run."""
+        runs = [
+            ([], {"run_id": 1, "source_name": "build"}),
+            ([], {"run_id": 2, "source_name": "build"}),
+        ]
+
+        paths = write_runs_parquet(runs, lq_dir)
+
+        assert paths[0].name.startswith("002_build_")
+
 
 class TestCmdExec:
     """Tests for blq exec command (ad-hoc execution)."""
@@ -313,6 +418,33 @@ class TestCmdExec:
         raw_files = list(Path(".lq/raw").glob("*.log"))
         assert len(raw_files) == 1
 
+    def test_raw_log_is_undecoded_output(self, initialized_project, capsys):
+        """Raw log keeps the exact bytes; stats use normalized lines."""
+        args = argparse.Namespace(
+            command=["printf 'a\\nb\\r\\nc'"],
+            name=None,
+            format="auto",
+            keep_raw=True,
+            json=True,
+            markdown=False,
+            quiet=True,
+            summary=False,
+            verbose=False,
+            include_warnings=False,
+            error_limit=20,
+            no_capture=False,
+        )
+
+        with pytest.raises(SystemExit):
+            cmd_exec(args)
+
+        data = json.loads(capsys.readouterr().out)
+        assert data["output_stats"]["lines"] == 3
+        assert data["output_stats"]["tail"] == ["a", "b", "c"]
+
+        raw_files = list(Path(".lq/raw").glob("*.log"))
+        assert raw_files[0].read_bytes() == b"a\nb\r\nc"
+
     def test_quiet_suppresses_output(self, initialized_project, sample_build_script, capsys):
         """Quiet mode suppresses streaming output."""
         args = argparse.Namespace(
@@ -368,6 +500,64 @@ Done
         parquet_files = list(Path(".lq/logs").rglob("*.parquet"))
         assert len(parquet_files) >= 1
 
+    def test_imports_several_files_together(self, initialized_project, temp_dir, capsys):
+        """Several files become separate runs in one parquet file."""
+        import duckdb
+
+        files = []
+        for name in ("a.log", "b.log"):
+            log_file = temp_dir / name
+            log_file.write_text("Building...\nDone\n")
+            files.append(str(log_file))
+
+        cmd_import(argparse.Namespace(file=files, name=None, format="auto"))
+
+        captured = capsys.readouterr()
+        assert captured.out.count("Imported") == 2
+
+        parquet_files = list(Path(".lq/logs").rglob("source=import/*.parquet"))
+        assert len(parquet_files) == 1
+        assert get_next_run_id(Path(".lq")) == 3
+        sql = f"SELECT DISTINCT run_id, source_name FROM '{parquet_files[0]}' ORDER BY run_id"
+        rows = duckdb.connect().execute(sql).fetchall()
+        assert rows == [(1, "a"), (2, "b")]
+
+    def test_failed_write_reports_nothing_imported(
+        self, initialized_project, temp_dir, capsys, monkeypatch
+    ):
+        """No "Imported" line is printed for runs that were never stored."""
+        from blq.commands import core
+
+        def fail_write(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(core, "write_runs_parquet", fail_write)
+        files = []
+        for name in ("a.log", "b.log"):
+            log_file = temp_dir / name
+            log_file.write_text("Building...\nDone\n")
+            files.append(str(log_file))
+
+        with pytest.raises(OSError):
+            cmd_import(argparse.Namespace(file=files, name=None, format="auto"))
+
+        assert "Imported" not in capsys.readouterr().out
+
+    def test_rejects_name_with_several_files(self, initialized_project, temp_dir, capsys):
+        """--name would give every imported run the same source name."""
+        files = []
+        for name in ("a.log", "b.log"):
+            log_file = temp_dir / name
+            log_file.write_text("Building...\nDone\n")
+            files.append(str(log_file))
+
+        with pytest.raises(SystemExit) as exc_info:
+            cmd_import(argparse.Namespace(file=files, name="build", format="auto"))
+
+        assert exc_info.value.code == 1
+        assert "--name" in capsys.readouterr().err
+        assert not list(Path(".lq/logs").rglob("source=import/*.parquet"))
+
 
 class TestCmdEvent:
     """Tests for blq event command."""
@@ -559,6 +749,15 @@ class TestCmdCompletions:
         assert "init:Initialize" in captured.out
         assert "errors:Show recent errors" in captured.out
 
+    def test_fish_includes_command_descriptions(self, capsys):
+        """Fish completion describes each subcommand, aliases included."""
+        args = argparse.Namespace(shell="fish")
+        cmd_completions(args)
+
+        captured = capsys.readouterr()
+        assert '-a errors -d "Show recent errors"' in captured.out
+        assert '-a q -d "Query log files or stored events"' in captured.out
+
     def test_completions_include_registered_command_lookup(self, capsys):
         """Completions include logic to complete registered commands."""
         args = argparse.Namespace(shell="bash")
@@ -630,6 +829,17 @@ class TestBlqConfigFind:
         assert config is not None
         assert config.lq_dir == lq_path
 
+    def test_find_sees_nested_lq_after_init(self, chdir_temp):
+        """A .lq created by init below an earlier lookup is found."""
+        (chdir_temp / ".lq").mkdir()
+        subdir = chdir_temp / "sub"
+        subdir.mkdir()
+        os.chdir(subdir)
+        assert BlqConfig.find().lq_dir == chdir_temp / ".lq"
+
+        cmd_init(argparse.Namespace())
+        assert BlqConfig.find().lq_dir == subdir / ".lq"
+
     def test_find_returns_none_when_not_found(self, temp_dir):
         """Return None when .lq not found."""
         subdir = temp_dir / "clean" / "subdir"
@@ -671,6 +881,32 @@ project:
         assert config.namespace == "test_ns"
         assert config.project == "test_proj"
 
+    def test_load_reuses_parse_until_file_changes(self, lq_dir, monkeypatch):
+        """Unchanged config.yaml is parsed once; edits are picked up."""
+        import yaml
+
+        config_path = lq_dir / "config.yaml"
+        config_path.write_text("capture_env:\n  - ONE\n")
+
+        parses = []
+        real_load = yaml.load
+
+        def counting_load(*args, **kwargs):
+            parses.append(1)
+            return real_load(*args, **kwargs)
+
+        monkeypatch.setattr(yaml, "load", counting_load)
+
+        first = BlqConfig.load(lq_dir)
+        first.capture_env.append("MUTATED")
+        second = BlqConfig.load(lq_dir)
+        assert second.capture_env == ["ONE"]
+        assert len(parses) == 1
+
+        config_path.write_text("capture_env:\n  - ONE\n  - TWO\n")
+        assert BlqConfig.load(lq_dir).capture_env == ["ONE", "TWO"]
+        assert len(parses) == 2
+
     def test_load_uses_defaults_when_no_config(self, lq_dir):
         """Load uses defaults when config.yaml doesn't exist."""
         # Ensure no config.yaml
@@ -791,3 +1027,29 @@ commands:
 
         config.reload_commands()
         assert config._commands is None
+
+
+class TestImportCost:
+    """Tests for CLI startup imports."""
+
+    def test_cli_import_defers_pandas(self):
+        """Importing the CLI does not pull in pandas."""
+        import subprocess
+        import sys
+
+        code = "import sys, blq.cli; print('pandas' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_cli_import_defers_yaml(self):
+        """Importing the CLI does not pull in PyYAML."""
+        import subprocess
+        import sys
+
+        code = "import sys, blq.cli; print('yaml' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
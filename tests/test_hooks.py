@@ -2,41 +2,87 @@
 
 import argparse
 import os
+import shutil
 import subprocess
 
 import pytest
 
-
-@pytest.fixture
-def git_repo(temp_dir):
-    """Create a git repository in temp_dir."""
-    subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=temp_dir,
-        capture_output=True,
-    )
+from blq.cli import cmd_init
+from blq.commands.core import BlqConfig
+from blq.commands.hooks_cmd import (
+    HOOK_MARKER,
+    cmd_hooks_add,
+    cmd_hooks_install,
+    cmd_hooks_list,
+    cmd_hooks_remove,
+    cmd_hooks_run,
+    cmd_hooks_status,
+)
+
+_MARKER_B = HOOK_MARKER.encode()
+_FOREIGN_HOOK = b"#!/bin/sh\necho 'foreign hook'\n"
+# Keep git from reading the user's global/system config during setup
+_GIT_ENV = {
+    **os.environ,
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_NOSYSTEM": "1",
+    "GIT_OPTIONAL_LOCKS": "0",
+}
+
+# Keep the module on one xdist worker so the git templates are built once
+pytestmark = pytest.mark.xdist_group("hooks")
+
+
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory):
+    """A pristine git repository, created once per session."""
+    template = tmp_path_factory.mktemp("git_template")
     subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=temp_dir,
-        capture_output=True,
+        ["git", "init", "-q"],
+        cwd=template,
+        env=_GIT_ENV,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
     )
-    return temp_dir
+    # Append the identity directly rather than launching `git config` twice
+    with open(template / ".git" / "config", "a") as f:
+        f.write("[user]\n\temail = test@test.com\n\tname = Test User\n")
+    # git only creates hooks/ from its template dir; make sure every copy has it
+    (template / ".git" / "hooks").mkdir(exist_ok=True)
+    return template
 
 
 @pytest.fixture
-def initialized_git_project(git_repo):
-    """A git repo with blq initialized."""
-    original = os.getcwd()
-    os.chdir(git_repo)
+def git_repo(temp_dir, git_template):
+    """Create a git repository in temp_dir (copied from the session template)."""
+    shutil.copytree(git_template / ".git", temp_dir / ".git")
+    return temp_dir
+
 
-    from blq.cli import cmd_init
+@pytest.fixture(scope="session")
+def initialized_git_template(git_template, tmp_path_factory):
+    """A git repo with blq initialized, created once per session."""
+    template = tmp_path_factory.mktemp("initialized_template")
+    shutil.copytree(git_template / ".git", template / ".git")
 
-    args = argparse.Namespace()
-    cmd_init(args)
+    cmd_init(argparse.Namespace(cwd=template))
+    return template
 
-    yield git_repo
-    os.chdir(original)
+
+@pytest.fixture
+def initialized_git_project(temp_dir, initialized_git_template, copy_template, monkeypatch):
+    """A git repo with blq initialized (a private copy of the session template)."""
+    copy_template(initialized_git_template, temp_dir)
+    monkeypatch.chdir(temp_dir)
+    return temp_dir
+
+
+@pytest.fixture
+def installed_hook(initialized_git_project):
+    """Path to the pre-commit hook after a plain hooks-install."""
+    cmd_hooks_install(argparse.Namespace(force=False))
+    return initialized_git_project / ".git" / "hooks" / "pre-commit"
 
 
 class TestHooksInstall:
@@ -44,62 +90,43 @@ class TestHooksInstall:
 
     def test_install_creates_hook(self, initialized_git_project):
         """Installing hooks creates pre-commit script."""
-        from blq.commands.hooks_cmd import cmd_hooks_install
-
         args = argparse.Namespace(force=False)
         cmd_hooks_install(args)
 
         hook_path = initialized_git_project / ".git" / "hooks" / "pre-commit"
-        assert hook_path.exists()
+        # stat() fails if the hook is missing, so one call checks both
         assert hook_path.stat().st_mode & 0o111  # Is executable
 
     def test_install_contains_marker(self, initialized_git_project):
         """Installed hook contains blq marker."""
-        from blq.commands.hooks_cmd import HOOK_MARKER, cmd_hooks_install
-
         args = argparse.Namespace(force=False)
         cmd_hooks_install(args)
 
         hook_path = initialized_git_project / ".git" / "hooks" / "pre-commit"
-        content = hook_path.read_text()
-        assert HOOK_MARKER in content
+        assert _MARKER_B in hook_path.read_bytes()
 
-    def test_install_idempotent(self, initialized_git_project, capsys):
+    def test_install_idempotent(self, installed_hook, capsys):
         """Installing twice without force shows message."""
-        from blq.commands.hooks_cmd import cmd_hooks_install
-
-        args = argparse.Namespace(force=False)
-        cmd_hooks_install(args)
-        cmd_hooks_install(args)
+        cmd_hooks_install(argparse.Namespace(force=False))
 
         captured = capsys.readouterr()
         assert "already installed" in captured.out
 
-    def test_install_force_overwrites(self, initialized_git_project):
+    def test_install_force_overwrites(self, installed_hook):
         """Installing with force overwrites existing hook."""
-        from blq.commands.hooks_cmd import cmd_hooks_install
-
-        hook_path = initialized_git_project / ".git" / "hooks" / "pre-commit"
-
-        # First install
-        args = argparse.Namespace(force=False)
-        cmd_hooks_install(args)
-        original_content = hook_path.read_text()
+        original_content = installed_hook.read_bytes()
 
         # Force reinstall
         args = argparse.Namespace(force=True)
         cmd_hooks_install(args)
 
-        assert hook_path.read_text() == original_content  # Same content
+        assert installed_hook.read_bytes() == original_content  # Same content
 
     def test_install_refuses_foreign_hook(self, initialized_git_project, capsys):
         """Installing refuses to overwrite non-blq hook."""
-        from blq.commands.hooks_cmd import cmd_hooks_install
-
         # Create a foreign hook
         hook_path = initialized_git_project / ".git" / "hooks" / "pre-commit"
-        hook_path.parent.mkdir(parents=True, exist_ok=True)
-        hook_path.write_text("#!/bin/sh\necho 'foreign hook'\n")
+        hook_path.write_bytes(_FOREIGN_HOOK)
 
         args = argparse.Namespace(force=False)
         with pytest.raises(SystemExit):
@@ -110,43 +137,30 @@ class TestHooksInstall:
 
     def test_install_force_overwrites_foreign(self, initialized_git_project, capsys):
         """Installing with force overwrites foreign hook."""
-        from blq.commands.hooks_cmd import HOOK_MARKER, cmd_hooks_install
-
         # Create a foreign hook
         hook_path = initialized_git_project / ".git" / "hooks" / "pre-commit"
-        hook_path.parent.mkdir(parents=True, exist_ok=True)
-        hook_path.write_text("#!/bin/sh\necho 'foreign hook'\n")
+        hook_path.write_bytes(_FOREIGN_HOOK)
 
         args = argparse.Namespace(force=True)
         cmd_hooks_install(args)
 
-        content = hook_path.read_text()
-        assert HOOK_MARKER in content
-        assert "foreign hook" not in content
+        content = hook_path.read_bytes()
+        assert _MARKER_B in content
+        assert b"foreign hook" not in content
 
 
 class TestHooksRemove:
     """Tests for hooks-remove command."""
 
-    def test_remove_deletes_hook(self, initialized_git_project):
+    def test_remove_deletes_hook(self, installed_hook):
         """Removing deletes the hook file."""
-        from blq.commands.hooks_cmd import cmd_hooks_install, cmd_hooks_remove
+        assert installed_hook.exists()
 
-        # Install first
-        args = argparse.Namespace(force=False)
-        cmd_hooks_install(args)
-
-        hook_path = initialized_git_project / ".git" / "hooks" / "pre-commit"
-        assert hook_path.exists()
-
-        # Remove
         cmd_hooks_remove(argparse.Namespace())
-        assert not hook_path.exists()
+        assert not installed_hook.exists()
 
     def test_remove_no_hook(self, initialized_git_project, capsys):
         """Removing when no hook installed shows message."""
-        from blq.commands.hooks_cmd import cmd_hooks_remove
-
         cmd_hooks_remove(argparse.Namespace())
 
         captured = capsys.readouterr()
@@ -154,12 +168,9 @@ class TestHooksRemove:
 
     def test_remove_refuses_foreign_hook(self, initialized_git_project, capsys):
         """Removing refuses to delete non-blq hook."""
-        from blq.commands.hooks_cmd import cmd_hooks_remove
-
         # Create a foreign hook
         hook_path = initialized_git_project / ".git" / "hooks" / "pre-commit"
-        hook_path.parent.mkdir(parents=True, exist_ok=True)
-        hook_path.write_text("#!/bin/sh\necho 'foreign hook'\n")
+        hook_path.write_bytes(_FOREIGN_HOOK)
 
         with pytest.raises(SystemExit):
             cmd_hooks_remove(argparse.Namespace())
@@ -173,25 +184,18 @@ class TestHooksStatus:
 
     def test_status_not_installed(self, initialized_git_project, capsys):
         """Status shows not installed when no hook."""
-        from blq.commands.hooks_cmd import cmd_hooks_status
-
         cmd_hooks_status(argparse.Namespace())
 
         captured = capsys.readouterr()
         assert "not installed" in captured.out
 
-    def test_status_installed(self, initialized_git_project, capsys):
+    def test_status_installed(self, installed_hook, capsys):
         """Status shows installed when hook exists."""
-        from blq.commands.hooks_cmd import cmd_hooks_install, cmd_hooks_status
-
-        args = argparse.Namespace(force=False)
-        cmd_hooks_install(args)
-
         cmd_hooks_status(argparse.Namespace())
 
-        captured = capsys.readouterr()
-        assert "installed" in captured.out
-        assert "blq-managed" in captured.out
+        out = capsys.readouterr().out
+        assert "installed" in out
+        assert "blq-managed" in out
 
 
 class TestHooksAdd:
@@ -199,20 +203,15 @@ class TestHooksAdd:
 
     def test_add_command(self, initialized_git_project, capsys):
         """Adding a command updates config."""
-        from blq.commands.core import BlqConfig
-        from blq.commands.hooks_cmd import cmd_hooks_add
-
         args = argparse.Namespace(command="lint")
         cmd_hooks_add(args)
 
-        # Reload config
-        config = BlqConfig.find()
+        # Reload config straight from the project, no upward search
+        config = BlqConfig.load(initialized_git_project / ".lq")
         assert "lint" in config.hooks_config.get("pre-commit", [])
 
     def test_add_duplicate(self, initialized_git_project, capsys):
         """Adding duplicate command shows message."""
-        from blq.commands.hooks_cmd import cmd_hooks_add
-
         args = argparse.Namespace(command="lint")
         cmd_hooks_add(args)
         cmd_hooks_add(args)
@@ -226,8 +225,6 @@ class TestHooksList:
 
     def test_list_empty(self, initialized_git_project, capsys):
         """Listing with no commands produces empty output."""
-        from blq.commands.hooks_cmd import cmd_hooks_list
-
         cmd_hooks_list(argparse.Namespace())
 
         captured = capsys.readouterr()
@@ -235,17 +232,15 @@ class TestHooksList:
 
     def test_list_commands(self, initialized_git_project, capsys):
         """Listing shows configured commands."""
-        from blq.commands.hooks_cmd import cmd_hooks_add, cmd_hooks_list
-
         # Add some commands
         cmd_hooks_add(argparse.Namespace(command="lint"))
         cmd_hooks_add(argparse.Namespace(command="test"))
 
         cmd_hooks_list(argparse.Namespace())
 
-        captured = capsys.readouterr()
-        assert "lint" in captured.out
-        assert "test" in captured.out
+        out = capsys.readouterr().out
+        assert "lint" in out
+        assert "test" in out
 
 
 class TestHooksRun:
@@ -253,8 +248,6 @@ class TestHooksRun:
 
     def test_run_no_commands(self, initialized_git_project, capsys):
         """Running with no commands does nothing."""
-        from blq.commands.hooks_cmd import cmd_hooks_run
-
         cmd_hooks_run(argparse.Namespace())
 
         captured = capsys.readouterr()
@@ -265,44 +258,30 @@ class TestHooksRun:
 class TestNotInGitRepo:
     """Tests for behavior outside git repo."""
 
-    def test_install_fails_not_initialized(self, temp_dir, capsys):
+    def test_install_fails_not_initialized(self, temp_dir, monkeypatch, capsys):
         """Install fails when blq not initialized."""
-        original = os.getcwd()
-        os.chdir(temp_dir)
-
-        try:
-            from blq.commands.hooks_cmd import cmd_hooks_install
+        monkeypatch.chdir(temp_dir)
 
-            with pytest.raises(SystemExit):
-                cmd_hooks_install(argparse.Namespace(force=False))
+        with pytest.raises(SystemExit):
+            cmd_hooks_install(argparse.Namespace(force=False))
 
-            captured = capsys.readouterr()
-            # blq needs to be initialized first
-            assert "not initialized" in captured.err
-        finally:
-            os.chdir(original)
+        captured = capsys.readouterr()
+        # blq needs to be initialized first
+        assert "not initialized" in captured.err
 
     def test_install_fails_not_git(self, initialized_project, capsys):
         """Install fails when in blq project but not git repo."""
-        from blq.commands.hooks_cmd import cmd_hooks_install
-
         with pytest.raises(SystemExit):
             cmd_hooks_install(argparse.Namespace(force=False))
 
         captured = capsys.readouterr()
         assert "Not in a git repository" in captured.err
 
-    def test_status_not_git(self, temp_dir, capsys):
+    def test_status_not_git(self, temp_dir, monkeypatch, capsys):
         """Status shows not in git repo."""
-        original = os.getcwd()
-        os.chdir(temp_dir)
+        monkeypatch.chdir(temp_dir)
 
-        try:
-            from blq.commands.hooks_cmd import cmd_hooks_status
-
-            cmd_hooks_status(argparse.Namespace())
+        cmd_hooks_status(argparse.Namespace())
 
-            captured = capsys.readouterr()
-            assert "Not in a git repository" in captured.out
-        finally:
-            os.chdir(original)
+        captured = capsys.readouterr()
+        assert "Not in a git repository" in captured.out
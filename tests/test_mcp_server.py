@@ -1,16 +1,27 @@
 """Tests for the blq MCP server.
 
 Uses FastMCP's in-memory transport for efficient testing without
-subprocess or network overhead.
+subprocess or network overhead. conftest skips collecting this module when
+fastmcp is not installed.
 """
 
+import argparse
+import asyncio
+
 import pytest
+import pytest_asyncio
+from fastmcp import Client
 
-# Skip all tests if fastmcp not installed
-fastmcp = pytest.importorskip("fastmcp")
+from blq.cli import cmd_init
+from blq.query import LogStore
+from blq.serve import _format_ref, mcp
 
-if fastmcp:
-    from fastmcp import Client
+pytestmark = [
+    # Tests share one client, so they must share its event loop too
+    pytest.mark.asyncio(loop_scope="module"),
+    # Keep the module on one xdist worker so the shared project is built once
+    pytest.mark.xdist_group("mcp"),
+]
 
 
 def get_data(result):
@@ -20,32 +31,92 @@ def get_data(result):
     return result
 
 
-@pytest.fixture
-def mcp_server(initialized_project, sample_build_script):
-    """Create MCP server with initialized project and sample data."""
-    # Run a build to generate some data
-    import subprocess
+@pytest.fixture(scope="module")
+def mcp_project(tmp_path_factory, write_sample_build_script, run_adhoc_command):
+    """An initialized project with sample data, built once per module.
 
-    # Import here to avoid errors if fastmcp not installed
-    from blq.serve import mcp
+    Tests using it only read, so the build is shared; tests that create
+    runs use mcp_server_writable instead.
+    """
+    project = tmp_path_factory.mktemp("mcp_project")
+    script = write_sample_build_script(project)
 
+    cmd_init(argparse.Namespace(cwd=project))
+    # Run a build to generate some data
     # Use exec for ad-hoc command execution (run is for registered commands only)
-    subprocess.run(
-        ["blq", "exec", "--quiet", str(sample_build_script)],
-        capture_output=True,
-    )
+    run_adhoc_command(str(script), cwd=project)
+    return project
+
+
+@pytest.fixture(scope="module")
+def mcp_empty_project(tmp_path_factory):
+    """An initialized project with no runs, shared by read-only tests."""
+    project = tmp_path_factory.mktemp("mcp_empty_project")
+    cmd_init(argparse.Namespace(cwd=project))
+    return project
+
 
+@pytest.fixture
+def mcp_server(mcp_project, monkeypatch):
+    """Create MCP server with initialized project and sample data."""
+    monkeypatch.chdir(mcp_project)
     return mcp
 
 
 @pytest.fixture
-def mcp_server_empty(initialized_project):
+def mcp_server_empty(mcp_empty_project, monkeypatch):
     """Create MCP server with initialized project but no data."""
-    from blq.serve import mcp
+    monkeypatch.chdir(mcp_empty_project)
+    return mcp
+
 
+@pytest.fixture
+def mcp_server_writable(initialized_project):
+    """Create MCP server with a fresh project of its own, for tests that add runs."""
     return mcp
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def mcp_client():
+    """A client connected to the MCP server, shared across the module.
+
+    Tools resolve the project from the working directory on each call, so
+    one connection serves every project the tests chdir into.
+    """
+    async with Client(mcp) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def sample_errors(mcp_project):
+    """First error of the sample build (if any was parsed), looked up once per module."""
+    store = LogStore.open(mcp_project / ".lq")
+    if not store.has_data():
+        return []
+    query = store.errors().order_by("run_id", desc=True).select("run_id", "event_id")
+    return [
+        {"ref": _format_ref(run_id, event_id)} for run_id, event_id in query.limit(1).fetchall()
+    ]
+
+
+@pytest.fixture
+def client(mcp_server, mcp_client):
+    """The shared client, pointed at the project with sample data."""
+    return mcp_client
+
+
+@pytest.fixture
+def empty_client(mcp_server_empty, mcp_client):
+    """The shared client, pointed at the project with no data."""
+    return mcp_client
+
+
+@pytest.fixture
+def writable_client(mcp_server_writable, mcp_client):
+    """The shared client, pointed at a fresh project this test may write to."""
+    return mcp_client
+
+
 # ============================================================================
 # Tool Tests
 # ============================================================================
@@ -54,313 +125,261 @@ def mcp_server_empty(initialized_project):
 class TestExecTool:
     """Tests for the exec tool (ad-hoc command execution)."""
 
-    @pytest.mark.asyncio
-    async def test_exec_command(self, mcp_server_empty, sample_build_script):
+    async def test_exec_command(self, writable_client, sample_build_script):
         """Execute an ad-hoc command and capture output."""
-        async with Client(mcp_server_empty) as client:
-            raw = await client.call_tool("exec", {"command": str(sample_build_script)})
-            result = get_data(raw)
+        raw = await writable_client.call_tool("exec", {"command": str(sample_build_script)})
+        result = get_data(raw)
 
-            assert "run_id" in result
-            assert "status" in result
-            assert result["status"] in ["OK", "FAIL"]
+        assert "run_id" in result
+        assert "status" in result
+        assert result["status"] in ["OK", "FAIL"]
 
-    @pytest.mark.asyncio
-    async def test_exec_with_args(self, mcp_server_empty):
+    async def test_exec_with_args(self, writable_client):
         """Execute a command with arguments."""
-        async with Client(mcp_server_empty) as client:
-            raw = await client.call_tool("exec", {"command": "echo", "args": ["hello", "world"]})
-            result = get_data(raw)
+        raw = await writable_client.call_tool(
+            "exec", {"command": "echo", "args": ["hello", "world"]}
+        )
+        result = get_data(raw)
 
-            assert result["status"] == "OK"
-            assert result["exit_code"] == 0
+        assert result["status"] == "OK"
+        assert result["exit_code"] == 0
 
-    @pytest.mark.asyncio
-    async def test_exec_failing_command(self, mcp_server_empty):
+    async def test_exec_failing_command(self, writable_client):
         """Execute a command that fails."""
-        async with Client(mcp_server_empty) as client:
-            raw = await client.call_tool(
-                "exec",
-                {"command": "false"},  # Always exits with 1
-            )
-            result = get_data(raw)
+        raw = await writable_client.call_tool(
+            "exec",
+            {"command": "false"},  # Always exits with 1
+        )
+        result = get_data(raw)
 
-            assert result["status"] == "FAIL"
-            assert result["exit_code"] != 0
+        assert result["status"] == "FAIL"
+        assert result["exit_code"] != 0
 
 
 class TestRunTool:
     """Tests for the run tool (registered commands)."""
 
-    @pytest.mark.asyncio
-    async def test_run_unregistered_command_fails(self, mcp_server_empty):
+    async def test_run_unregistered_command_fails(self, empty_client):
         """Run should fail for unregistered commands."""
-        async with Client(mcp_server_empty) as client:
-            raw = await client.call_tool("run", {"command": "nonexistent"})
-            result = get_data(raw)
+        raw = await empty_client.call_tool("run", {"command": "nonexistent"})
+        result = get_data(raw)
 
-            assert result["status"] == "FAIL"
-            assert "not registered" in result.get("error", "")
+        assert result["status"] == "FAIL"
+        assert "not registered" in result.get("error", "")
 
 
 class TestQueryTool:
     """Tests for the query tool."""
 
-    @pytest.mark.asyncio
-    async def test_query_simple(self, mcp_server):
+    async def test_query_simple(self, client):
         """Run a simple SQL query."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool(
-                "query", {"sql": "SELECT COUNT(*) as count FROM blq_load_events()"}
-            )
-            result = get_data(raw)
+        raw = await client.call_tool(
+            "query", {"sql": "SELECT COUNT(*) as count FROM blq_load_events()"}
+        )
+        result = get_data(raw)
 
-            assert "columns" in result
-            assert "rows" in result
-            assert result["row_count"] >= 0
+        assert "columns" in result
+        assert "rows" in result
+        assert result["row_count"] >= 0
 
-    @pytest.mark.asyncio
-    async def test_query_with_limit(self, mcp_server):
+    async def test_query_with_limit(self, client):
         """Query with limit parameter."""
-        async with Client(mcp_server) as client:
-            sql = "SELECT * FROM blq_load_events()"
-            raw = await client.call_tool("query", {"sql": sql, "limit": 5})
-            result = get_data(raw)
+        sql = "SELECT * FROM blq_load_events()"
+        raw = await client.call_tool("query", {"sql": sql, "limit": 5})
+        result = get_data(raw)
 
-            assert len(result["rows"]) <= 5
+        assert len(result["rows"]) <= 5
 
-    @pytest.mark.asyncio
-    async def test_query_errors_only(self, mcp_server):
+    async def test_query_errors_only(self, client):
         """Query filtering to errors only."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool(
-                "query", {"sql": "SELECT * FROM blq_load_events() WHERE severity = 'error'"}
-            )
-            result = get_data(raw)
+        raw = await client.call_tool(
+            "query", {"sql": "SELECT * FROM blq_load_events() WHERE severity = 'error'"}
+        )
+        result = get_data(raw)
 
-            # All returned rows should be errors
-            if result["rows"]:
-                severity_idx = result["columns"].index("severity")
-                for row in result["rows"]:
-                    assert row[severity_idx] == "error"
+        # All returned rows should be errors
+        if result["rows"]:
+            severity_idx = result["columns"].index("severity")
+            for row in result["rows"]:
+                assert row[severity_idx] == "error"
 
 
 class TestErrorsTool:
     """Tests for the errors convenience tool."""
 
-    @pytest.mark.asyncio
-    async def test_errors_default(self, mcp_server):
+    async def test_errors_default(self, client):
         """Get errors with default parameters."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool("errors", {})
-            result = get_data(raw)
+        raw = await client.call_tool("errors", {})
+        result = get_data(raw)
 
-            assert "errors" in result
-            assert "total_count" in result
-            assert isinstance(result["errors"], list)
+        assert "errors" in result
+        assert "total_count" in result
+        assert isinstance(result["errors"], list)
 
-    @pytest.mark.asyncio
-    async def test_errors_with_limit(self, mcp_server):
+    async def test_errors_with_limit(self, client):
         """Get errors with limit."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool("errors", {"limit": 5})
-            result = get_data(raw)
+        raw = await client.call_tool("errors", {"limit": 5})
+        result = get_data(raw)
 
-            assert len(result["errors"]) <= 5
+        assert len(result["errors"]) <= 5
 
-    @pytest.mark.asyncio
-    async def test_errors_with_file_pattern(self, mcp_server):
+    async def test_errors_with_file_pattern(self, client):
         """Get errors filtered by file pattern."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool("errors", {"file_pattern": "%main%"})
-            result = get_data(raw)
+        raw = await client.call_tool("errors", {"file_pattern": "%main%"})
+        result = get_data(raw)
 
-            for error in result["errors"]:
-                if error.get("file_path"):
-                    assert "main" in error["file_path"].lower()
+        for error in result["errors"]:
+            if error.get("file_path"):
+                assert "main" in error["file_path"].lower()
 
-    @pytest.mark.asyncio
-    async def test_errors_structure(self, mcp_server):
+    async def test_errors_structure(self, client):
         """Verify error structure."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool("errors", {"limit": 1})
-            result = get_data(raw)
+        raw = await client.call_tool("errors", {"limit": 1})
+        result = get_data(raw)
 
-            if result["errors"]:
-                error = result["errors"][0]
-                assert "ref" in error
-                assert "message" in error
-                # ref should be in format "run_id:event_id"
-                assert ":" in error["ref"]
+        if result["errors"]:
+            error = result["errors"][0]
+            assert "ref" in error
+            assert "message" in error
+            # ref should be in format "run_id:event_id"
+            assert ":" in error["ref"]
 
 
 class TestWarningsTool:
     """Tests for the warnings convenience tool."""
 
-    @pytest.mark.asyncio
-    async def test_warnings_default(self, mcp_server):
+    async def test_warnings_default(self, client):
         """Get warnings with default parameters."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool("warnings", {})
-            result = get_data(raw)
+        raw = await client.call_tool("warnings", {})
+        result = get_data(raw)
 
-            assert "warnings" in result
-            assert "total_count" in result
+        assert "warnings" in result
+        assert "total_count" in result
 
 
 class TestEventTool:
     """Tests for the event detail tool."""
 
-    @pytest.mark.asyncio
-    async def test_event_by_ref(self, mcp_server):
+    async def test_event_by_ref(self, client, sample_errors):
         """Get event details by reference."""
-        async with Client(mcp_server) as client:
-            # First get an error to find a valid ref
-            errors_raw = await client.call_tool("errors", {"limit": 1})
-            errors = get_data(errors_raw)
-
-            if errors["errors"]:
-                ref = errors["errors"][0]["ref"]
+        if sample_errors:
+            ref = sample_errors[0]["ref"]
 
-                raw = await client.call_tool("event", {"ref": ref})
-                result = get_data(raw)
+            raw = await client.call_tool("event", {"ref": ref})
+            result = get_data(raw)
 
-                assert result is not None
-                assert result["ref"] == ref
-                assert "message" in result
-                assert "severity" in result
+            assert result is not None
+            assert result["ref"] == ref
+            assert "message" in result
+            assert "severity" in result
 
-    @pytest.mark.asyncio
-    async def test_event_not_found(self, mcp_server):
+    async def test_event_not_found(self, client):
         """Event not found returns appropriate response."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool("event", {"ref": "99999:99999"})
-            result = get_data(raw)
+        raw = await client.call_tool("event", {"ref": "99999:99999"})
+        result = get_data(raw)
 
-            # Should return None
-            assert result is None
+        # Should return None
+        assert result is None
 
 
 class TestContextTool:
     """Tests for the context tool."""
 
-    @pytest.mark.asyncio
-    async def test_context_default_lines(self, mcp_server):
+    async def test_context_default_lines(self, client, sample_errors):
         """Get context with default line count."""
-        async with Client(mcp_server) as client:
-            errors_raw = await client.call_tool("errors", {"limit": 1})
-            errors = get_data(errors_raw)
+        if sample_errors:
+            ref = sample_errors[0]["ref"]
 
-            if errors["errors"]:
-                ref = errors["errors"][0]["ref"]
-
-                raw = await client.call_tool("context", {"ref": ref})
-                result = get_data(raw)
+            raw = await client.call_tool("context", {"ref": ref})
+            result = get_data(raw)
 
-                assert "context_lines" in result
-                assert isinstance(result["context_lines"], list)
+            assert "context_lines" in result
+            assert isinstance(result["context_lines"], list)
 
-    @pytest.mark.asyncio
-    async def test_context_custom_lines(self, mcp_server):
+    async def test_context_custom_lines(self, client, sample_errors):
         """Get context with custom line count."""
-        async with Client(mcp_server) as client:
-            errors_raw = await client.call_tool("errors", {"limit": 1})
-            errors = get_data(errors_raw)
-
-            if errors["errors"]:
-                ref = errors["errors"][0]["ref"]
+        if sample_errors:
+            ref = sample_errors[0]["ref"]
 
-                raw = await client.call_tool("context", {"ref": ref, "lines": 10})
-                result = get_data(raw)
+            raw = await client.call_tool("context", {"ref": ref, "lines": 10})
+            result = get_data(raw)
 
-                assert "context_lines" in result
+            assert "context_lines" in result
 
 
 class TestStatusTool:
     """Tests for the status tool."""
 
-    @pytest.mark.asyncio
-    async def test_status(self, mcp_server):
+    async def test_status(self, client):
         """Get status summary."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool("status", {})
-            result = get_data(raw)
+        raw = await client.call_tool("status", {})
+        result = get_data(raw)
 
-            assert "sources" in result
-            assert isinstance(result["sources"], list)
+        assert "sources" in result
+        assert isinstance(result["sources"], list)
 
-    @pytest.mark.asyncio
-    async def test_status_structure(self, mcp_server):
+    async def test_status_structure(self, client):
         """Verify status structure."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool("status", {})
-            result = get_data(raw)
+        raw = await client.call_tool("status", {})
+        result = get_data(raw)
 
-            if result["sources"]:
-                source = result["sources"][0]
-                assert "name" in source
-                assert "status" in source
-                assert source["status"] in ["OK", "FAIL", "WARN"]
+        if result["sources"]:
+            source = result["sources"][0]
+            assert "name" in source
+            assert "status" in source
+            assert source["status"] in ["OK", "FAIL", "WARN"]
 
 
 class TestHistoryTool:
     """Tests for the history tool."""
 
-    @pytest.mark.asyncio
-    async def test_history_default(self, mcp_server):
+    async def test_history_default(self, client):
         """Get run history with defaults."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool("history", {})
-            result = get_data(raw)
+        raw = await client.call_tool("history", {})
+        result = get_data(raw)
 
-            assert "runs" in result
-            assert isinstance(result["runs"], list)
+        assert "runs" in result
+        assert isinstance(result["runs"], list)
 
-    @pytest.mark.asyncio
-    async def test_history_with_limit(self, mcp_server):
+    async def test_history_with_limit(self, client):
         """Get history with limit."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool("history", {"limit": 5})
-            result = get_data(raw)
+        raw = await client.call_tool("history", {"limit": 5})
+        result = get_data(raw)
 
-            assert len(result["runs"]) <= 5
+        assert len(result["runs"]) <= 5
 
-    @pytest.mark.asyncio
-    async def test_history_structure(self, mcp_server):
+    async def test_history_structure(self, client):
         """Verify history entry structure."""
-        async with Client(mcp_server) as client:
-            raw = await client.call_tool("history", {"limit": 1})
-            result = get_data(raw)
+        raw = await client.call_tool("history", {"limit": 1})
+        result = get_data(raw)
 
-            if result["runs"]:
-                run = result["runs"][0]
-                assert "run_id" in run
-                assert "status" in run
+        if result["runs"]:
+            run = result["runs"][0]
+            assert "run_id" in run
+            assert "status" in run
 
 
 class TestDiffTool:
     """Tests for the diff tool."""
 
-    @pytest.mark.asyncio
-    async def test_diff_two_runs(self, mcp_server_empty, sample_build_script):
+    async def test_diff_two_runs(self, writable_client, sample_build_script):
         """Compare two runs."""
-        async with Client(mcp_server_empty) as client:
-            # Create two runs using exec (ad-hoc execution)
-            run1_raw = await client.call_tool("exec", {"command": str(sample_build_script)})
-            run1 = get_data(run1_raw)
+        # Create two runs using exec (ad-hoc execution)
+        run1_raw = await writable_client.call_tool("exec", {"command": str(sample_build_script)})
+        run1 = get_data(run1_raw)
 
-            run2_raw = await client.call_tool("exec", {"command": str(sample_build_script)})
-            run2 = get_data(run2_raw)
+        run2_raw = await writable_client.call_tool("exec", {"command": str(sample_build_script)})
+        run2 = get_data(run2_raw)
 
-            if run1.get("run_id") and run2.get("run_id"):
-                raw = await client.call_tool(
-                    "diff", {"run1": run1["run_id"], "run2": run2["run_id"]}
-                )
-                result = get_data(raw)
+        if run1.get("run_id") and run2.get("run_id"):
+            raw = await writable_client.call_tool(
+                "diff", {"run1": run1["run_id"], "run2": run2["run_id"]}
+            )
+            result = get_data(raw)
 
-                assert "summary" in result
-                assert "run1_errors" in result["summary"]
-                assert "run2_errors" in result["summary"]
+            assert "summary" in result
+            assert "run1_errors" in result["summary"]
+            assert "run2_errors" in result["summary"]
 
 
 # ============================================================================
@@ -371,30 +390,24 @@ class TestDiffTool:
 class TestResources:
     """Tests for MCP resources."""
 
-    @pytest.mark.asyncio
-    async def test_list_resources(self, mcp_server):
+    async def test_list_resources(self, client):
         """List available resources."""
-        async with Client(mcp_server) as client:
-            resources = await client.list_resources()
+        resources = await client.list_resources()
 
-            resource_uris = [str(r.uri) for r in resources]
-            assert any("status" in uri for uri in resource_uris)
+        resource_uris = [str(r.uri) for r in resources]
+        assert any("status" in uri for uri in resource_uris)
 
-    @pytest.mark.asyncio
-    async def test_read_status_resource(self, mcp_server):
+    async def test_read_status_resource(self, client):
         """Read the status resource."""
-        async with Client(mcp_server) as client:
-            content = await client.read_resource("lq://status")
+        content = await client.read_resource("lq://status")
 
-            assert content is not None
+        assert content is not None
 
-    @pytest.mark.asyncio
-    async def test_read_commands_resource(self, mcp_server):
+    async def test_read_commands_resource(self, client):
         """Read the commands resource."""
-        async with Client(mcp_server) as client:
-            content = await client.read_resource("lq://commands")
+        content = await client.read_resource("lq://commands")
 
-            assert content is not None
+        assert content is not None
 
 
 # ============================================================================
@@ -405,34 +418,28 @@ class TestResources:
 class TestPrompts:
     """Tests for MCP prompts."""
 
-    @pytest.mark.asyncio
-    async def test_list_prompts(self, mcp_server):
+    async def test_list_prompts(self, client):
         """List available prompts."""
-        async with Client(mcp_server) as client:
-            prompts = await client.list_prompts()
+        prompts = await client.list_prompts()
 
-            prompt_names = [p.name for p in prompts]
-            assert "fix-errors" in prompt_names
-            assert "analyze-regression" in prompt_names
-            assert "summarize-run" in prompt_names
+        prompt_names = [p.name for p in prompts]
+        assert "fix-errors" in prompt_names
+        assert "analyze-regression" in prompt_names
+        assert "summarize-run" in prompt_names
 
-    @pytest.mark.asyncio
-    async def test_get_fix_errors_prompt(self, mcp_server):
+    async def test_get_fix_errors_prompt(self, client):
         """Get the fix-errors prompt."""
-        async with Client(mcp_server) as client:
-            prompt = await client.get_prompt("fix-errors", {})
+        prompt = await client.get_prompt("fix-errors", {})
 
-            assert prompt is not None
-            assert len(prompt.messages) > 0
+        assert prompt is not None
+        assert len(prompt.messages) > 0
 
-    @pytest.mark.asyncio
-    async def test_get_summarize_run_prompt(self, mcp_server):
+    async def test_get_summarize_run_prompt(self, client):
         """Get the summarize-run prompt."""
-        async with Client(mcp_server) as client:
-            prompt = await client.get_prompt("summarize-run", {})
+        prompt = await client.get_prompt("summarize-run", {})
 
-            assert prompt is not None
-            assert len(prompt.messages) > 0
+        assert prompt is not None
+        assert len(prompt.messages) > 0
 
 
 # ============================================================================
@@ -443,44 +450,40 @@ class TestPrompts:
 class TestIntegration:
     """Integration tests for common workflows."""
 
-    @pytest.mark.asyncio
-    async def test_build_and_query_workflow(self, mcp_server_empty, sample_build_script):
+    async def test_build_and_query_workflow(self, writable_client, sample_build_script):
         """Test typical build -> query -> drill-down workflow."""
-        async with Client(mcp_server_empty) as client:
-            # 1. Run build using exec (ad-hoc execution)
-            run_raw = await client.call_tool("exec", {"command": str(sample_build_script)})
-            run_result = get_data(run_raw)
-            assert "run_id" in run_result
-
-            # 2. Get errors
-            errors_raw = await client.call_tool("errors", {})
-            errors_result = get_data(errors_raw)
-            assert "errors" in errors_result
-
-            # 3. If errors, drill down
-            if errors_result["errors"]:
-                ref = errors_result["errors"][0]["ref"]
-                event_raw = await client.call_tool("event", {"ref": ref})
-                event_result = get_data(event_raw)
-                assert event_result is not None
-
-    @pytest.mark.asyncio
-    async def test_status_check_workflow(self, mcp_server):
+        # 1. Run build using exec (ad-hoc execution)
+        run_raw = await writable_client.call_tool("exec", {"command": str(sample_build_script)})
+        run_result = get_data(run_raw)
+        assert "run_id" in run_result
+
+        # 2. Get errors
+        errors_raw = await writable_client.call_tool("errors", {})
+        errors_result = get_data(errors_raw)
+        assert "errors" in errors_result
+
+        # 3. If errors, drill down
+        if errors_result["errors"]:
+            ref = errors_result["errors"][0]["ref"]
+            event_raw = await writable_client.call_tool("event", {"ref": ref})
+            event_result = get_data(event_raw)
+            assert event_result is not None
+
+    async def test_status_check_workflow(self, client):
         """Test status check workflow."""
-        async with Client(mcp_server) as client:
-            # 1. Check status
-            status_raw = await client.call_tool("status", {})
-            status = get_data(status_raw)
-            assert "sources" in status
-
-            # 2. Get history
-            history_raw = await client.call_tool("history", {"limit": 5})
-            hist = get_data(history_raw)
-            assert "runs" in hist
-
-            # 3. Query specific run if available
-            if hist["runs"]:
-                run_id = hist["runs"][0]["run_id"]
-                errors_raw = await client.call_tool("errors", {"run_id": run_id})
-                errors = get_data(errors_raw)
-                assert "errors" in errors
+        # 1. Check status and history (independent, so issue them together)
+        status_raw, history_raw = await asyncio.gather(
+            client.call_tool("status", {}),
+            client.call_tool("history", {"limit": 5}),
+        )
+        status = get_data(status_raw)
+        assert "sources" in status
+        hist = get_data(history_raw)
+        assert "runs" in hist
+
+        # 2. Query specific run if available
+        if hist["runs"]:
+            run_id = hist["runs"][0]["run_id"]
+            errors_raw = await client.call_tool("errors", {"run_id": run_id})
+            errors = get_data(errors_raw)
+            assert "errors" in errors
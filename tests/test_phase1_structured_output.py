@@ -53,6 +53,13 @@ class TestEventRef:
         ref = EventRef.parse(original)
         assert str(ref) == original
 
+    def test_parse_reuses_immutable_instance(self):
+        """Repeated parses share one frozen instance."""
+        ref = EventRef.parse("7:8")
+        assert EventRef.parse("7:8") is ref
+        with pytest.raises(AttributeError):
+            ref.run_id = 9
+
 
 class TestEventSummary:
     """Tests for EventSummary class."""
@@ -121,9 +128,9 @@ class TestEventSummary:
 class TestRunResult:
     """Tests for RunResult class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_result(self):
-        """Create a sample run result with errors and warnings."""
+        """Sample run result with errors and warnings, built once per class."""
         return RunResult(
             run_id=5,
             command="make -j8",
@@ -201,6 +208,21 @@ class TestRunResult:
         assert len(data["warnings"]) == 1
         assert data["warnings"][0]["ref"] == "5:3"
 
+    def test_to_json_same_without_orjson(self, sample_result, monkeypatch):
+        """The stdlib fallback renders the same document."""
+        from blq.commands import core
+
+        fast = sample_result.to_json(include_warnings=True)
+        monkeypatch.setattr(core, "orjson", None)
+        slow = sample_result.to_json(include_warnings=True)
+
+        assert fast == slow
+
+    def test_to_json_bytes_matches_text(self, sample_result):
+        """The bytes form is the UTF-8 encoding of to_json()."""
+        text = sample_result.to_json(include_warnings=True)
+        assert sample_result.to_json_bytes(include_warnings=True) == text.encode()
+
     def test_to_markdown_header(self, sample_result):
         """Markdown output includes status header."""
         output = sample_result.to_markdown()
@@ -362,6 +384,31 @@ src/main.c:20:1: error: second error
             if event.get("log_line_end") is not None:
                 assert isinstance(event["log_line_end"], int)
 
+    def test_parse_skips_known_missing_extension(self, monkeypatch):
+        """No connection is opened once duck_hunt is known to be missing."""
+        from blq.commands import core
+
+        def fail_connect(*args, **kwargs):
+            raise AssertionError("connection opened")
+
+        monkeypatch.setattr(core.ConnectionFactory, "_duck_hunt_available", False)
+        monkeypatch.setattr(core.duckdb, "connect", fail_connect)
+
+        assert parse_log_content("src/main.c:1:1: error: x") == []
+
+    def test_parse_blank_content_skips_parser(self, monkeypatch):
+        """Whitespace-only output never reaches duck_hunt."""
+        from blq.commands import core
+
+        def fail_connect(*args, **kwargs):
+            raise AssertionError("connection opened")
+
+        monkeypatch.setattr(core, "_PARSE_CONN", None)
+        monkeypatch.setattr(core.ConnectionFactory, "_duck_hunt_available", None)
+        monkeypatch.setattr(core.duckdb, "connect", fail_connect)
+
+        assert parse_log_content(" \n\t\n") == []
+
     def test_parse_empty_content(self):
         """Empty content returns no events."""
         events = parse_log_content("")
@@ -1,10 +1,12 @@
 """Tests for Phase 2: Command registry support."""
 
+import argparse
 import json
 from pathlib import Path
 
 import pytest
 
+from blq.cli import cmd_commands, cmd_register, cmd_run, cmd_unregister
 from blq.commands.core import BlqConfig, RegisteredCommand
 
 
@@ -134,24 +136,28 @@ class TestLoadSaveCommands:
         config2 = BlqConfig.load(lq_dir)
         assert config2.commands == {}
 
+    def test_save_unchanged_skips_write(self, lq_dir):
+        """Saving identical commands leaves the file untouched."""
+        config = BlqConfig.load(lq_dir)
+        config._commands = {"build": RegisteredCommand(name="build", cmd="make")}
+        config.save_commands()
+
+        yaml_path = lq_dir / "commands.yaml"
+        before = yaml_path.stat()
+        config.save_commands()
+        after = yaml_path.stat()
+
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        assert [p.name for p in lq_dir.iterdir() if p.name.endswith(".tmp")] == []
+
 
 class TestCommandRegistryCLI:
     """Integration tests for command registry CLI commands."""
 
-    def test_register_command(self, initialized_project, capsys):
+    def test_register_command(self, initialized_project, make_register_args, capsys):
         """Register a new command."""
-        import argparse
-
-        from blq.cli import cmd_register
-
-        args = argparse.Namespace(
-            name="build",
-            cmd=["make", "-j8"],
-            description="Build the project",
-            timeout=300,
-            format="auto",
-            no_capture=False,
-            force=False,
+        args = make_register_args(
+            name="build", cmd=["make", "-j8"], description="Build the project"
         )
 
         cmd_register(args)
@@ -164,68 +170,30 @@ class TestCommandRegistryCLI:
         assert "build" in config.commands
         assert config.commands["build"].cmd == "make -j8"
 
-    def test_register_command_force_overwrite(self, initialized_project, capsys):
+    def test_register_command_force_overwrite(
+        self, initialized_project, make_register_args, capsys
+    ):
         """Force overwrite existing command."""
-        import argparse
-
-        from blq.cli import cmd_register
-
         # Register first time
-        args = argparse.Namespace(
-            name="build",
-            cmd=["make"],
-            description="v1",
-            timeout=300,
-            format="auto",
-            no_capture=False,
-            force=False,
-        )
+        args = make_register_args(name="build", cmd=["make"], description="v1")
         cmd_register(args)
 
         # Register again with force
-        args = argparse.Namespace(
-            name="build",
-            cmd=["make", "-j8"],
-            description="v2",
-            timeout=300,
-            format="auto",
-            no_capture=False,
-            force=True,
-        )
+        args = make_register_args(name="build", cmd=["make", "-j8"], description="v2", force=True)
         cmd_register(args)
 
         config = BlqConfig.load(Path(".lq"))
         assert config.commands["build"].cmd == "make -j8"
         assert config.commands["build"].description == "v2"
 
-    def test_register_command_no_force_fails(self, initialized_project, capsys):
+    def test_register_command_no_force_fails(self, initialized_project, make_register_args, capsys):
         """Refuse to overwrite without force flag."""
-        import argparse
-
-        from blq.cli import cmd_register
-
         # Register first time
-        args = argparse.Namespace(
-            name="build",
-            cmd=["make"],
-            description="v1",
-            timeout=300,
-            format="auto",
-            no_capture=False,
-            force=False,
-        )
+        args = make_register_args(name="build", cmd=["make"], description="v1")
         cmd_register(args)
 
         # Try to register again without force
-        args = argparse.Namespace(
-            name="build",
-            cmd=["make", "-j8"],
-            description="v2",
-            timeout=300,
-            format="auto",
-            no_capture=False,
-            force=False,
-        )
+        args = make_register_args(name="build", cmd=["make", "-j8"], description="v2")
 
         with pytest.raises(SystemExit) as exc_info:
             cmd_register(args)
@@ -234,22 +202,10 @@ class TestCommandRegistryCLI:
         captured = capsys.readouterr()
         assert "already exists" in captured.err
 
-    def test_unregister_command(self, initialized_project, capsys):
+    def test_unregister_command(self, initialized_project, make_register_args, capsys):
         """Unregister an existing command."""
-        import argparse
-
-        from blq.cli import cmd_register, cmd_unregister
-
         # Register first
-        args = argparse.Namespace(
-            name="build",
-            cmd=["make"],
-            description="",
-            timeout=300,
-            format="auto",
-            no_capture=False,
-            force=False,
-        )
+        args = make_register_args(name="build", cmd=["make"])
         cmd_register(args)
 
         # Unregister
@@ -264,10 +220,6 @@ class TestCommandRegistryCLI:
 
     def test_unregister_nonexistent_fails(self, initialized_project, capsys):
         """Unregister nonexistent command fails."""
-        import argparse
-
-        from blq.cli import cmd_unregister
-
         args = argparse.Namespace(name="nonexistent")
 
         with pytest.raises(SystemExit) as exc_info:
@@ -279,36 +231,20 @@ class TestCommandRegistryCLI:
 
     def test_list_commands_empty(self, initialized_project, capsys):
         """List commands when none registered."""
-        import argparse
-
-        from blq.cli import cmd_commands
-
         args = argparse.Namespace(json=False)
         cmd_commands(args)
 
         captured = capsys.readouterr()
         assert "No commands registered" in captured.out
 
-    def test_list_commands(self, initialized_project, capsys):
+    def test_list_commands(self, initialized_project, make_register_args, capsys):
         """List registered commands."""
-        import argparse
-
-        from blq.cli import cmd_commands, cmd_register
-
         # Register some commands
         for name, cmd, desc in [
             ("build", ["make", "-j8"], "Build project"),
             ("test", ["pytest"], "Run tests"),
         ]:
-            args = argparse.Namespace(
-                name=name,
-                cmd=cmd,
-                description=desc,
-                timeout=300,
-                format="auto",
-                no_capture=False,
-                force=False,
-            )
+            args = make_register_args(name=name, cmd=cmd, description=desc)
             cmd_register(args)
             capsys.readouterr()  # Clear output
 
@@ -323,21 +259,9 @@ class TestCommandRegistryCLI:
         assert "test" in captured.out
         assert "pytest" in captured.out
 
-    def test_list_commands_json(self, initialized_project, capsys):
+    def test_list_commands_json(self, initialized_project, make_register_args, capsys):
         """List commands in JSON format."""
-        import argparse
-
-        from blq.cli import cmd_commands, cmd_register
-
-        args = argparse.Namespace(
-            name="build",
-            cmd=["make"],
-            description="Build",
-            timeout=300,
-            format="auto",
-            no_capture=False,
-            force=False,
-        )
+        args = make_register_args(name="build", cmd=["make"], description="Build")
         cmd_register(args)
         capsys.readouterr()
 
@@ -355,38 +279,19 @@ class TestCommandRegistryCLI:
 class TestRunRegisteredCommand:
     """Tests for running registered commands."""
 
-    def test_run_by_name(self, initialized_project, sample_success_script, capsys):
+    def test_run_by_name(
+        self, initialized_project, sample_success_script, make_register_args, make_run_args, capsys
+    ):
         """Run a command by its registered name."""
-        import argparse
-
-        from blq.cli import cmd_register, cmd_run
-
         # Register the command
-        args = argparse.Namespace(
-            name="success",
-            cmd=[str(sample_success_script)],
-            description="Run success script",
-            timeout=300,
-            format="auto",
-            no_capture=False,
-            force=False,
+        args = make_register_args(
+            name="success", cmd=[str(sample_success_script)], description="Run success script"
         )
         cmd_register(args)
         capsys.readouterr()
 
         # Run by name
-        args = argparse.Namespace(
-            command=["success"],
-            name=None,
-            format="auto",
-            keep_raw=False,
-            json=True,
-            markdown=False,
-            quiet=False,
-            include_warnings=False,
-            error_limit=20,
-            capture=None,
-        )
+        args = make_run_args(command=["success"])
 
         # Should not raise (exit code 0)
         try:
@@ -401,26 +306,10 @@ class TestRunRegisteredCommand:
         assert data["exit_code"] == 0
 
     def test_run_fails_for_unregistered_command(
-        self, initialized_project, sample_success_script, capsys
+        self, initialized_project, sample_success_script, make_run_args, capsys
     ):
         """Run should fail for unregistered commands (use exec for ad-hoc)."""
-        import argparse
-
-        from blq.cli import cmd_run
-
-        args = argparse.Namespace(
-            command=[str(sample_success_script)],
-            name=None,
-            format="auto",
-            keep_raw=False,
-            json=True,
-            markdown=False,
-            quiet=False,
-            include_warnings=False,
-            error_limit=20,
-            capture=None,
-            register=False,
-        )
+        args = make_run_args(command=[str(sample_success_script)])
 
         # cmd_run should exit with error for unregistered commands
         with pytest.raises(SystemExit) as exc_info:
@@ -431,63 +320,30 @@ class TestRunRegisteredCommand:
         captured = capsys.readouterr()
         assert "not a registered command" in captured.err
 
-    def test_run_registered_uses_stored_format(self, initialized_project, capsys):
+    def test_run_registered_uses_stored_format(
+        self, initialized_project, make_register_args, capsys
+    ):
         """Running registered command uses its stored format hint."""
-        import argparse
-
-        from blq.cli import cmd_register
-
         # Register with specific format
-        args = argparse.Namespace(
-            name="lint",
-            cmd=["echo", "test"],
-            description="Run linter",
-            timeout=300,
-            format="eslint_json",
-            no_capture=False,
-            force=False,
+        args = make_register_args(
+            name="lint", cmd=["echo", "test"], description="Run linter", format="eslint_json"
         )
         cmd_register(args)
 
         config = BlqConfig.load(Path(".lq"))
         assert config.commands["lint"].format == "eslint_json"
 
-    def test_run_with_extra_args_passes_them_through(self, initialized_project, capsys):
+    def test_run_with_extra_args_passes_them_through(
+        self, initialized_project, make_register_args, make_run_args, capsys
+    ):
         """Extra args after registered command name are passed through."""
-        import argparse
-
-        from blq.cli import cmd_register, cmd_run
-
         # Register 'build' command
-        args = argparse.Namespace(
-            name="build",
-            cmd=["echo build"],
-            description="",
-            timeout=300,
-            format="auto",
-            no_capture=False,
-            force=False,
-        )
+        args = make_register_args(name="build", cmd=["echo build"])
         cmd_register(args)
         capsys.readouterr()
 
         # Run 'build extra args' - extra args are now passed through to the command
-        args = argparse.Namespace(
-            command=["build", "extra", "args"],
-            name=None,
-            format="auto",
-            keep_raw=False,
-            json=True,
-            markdown=False,
-            quiet=False,
-            summary=False,
-            verbose=False,
-            include_warnings=False,
-            error_limit=20,
-            capture=None,
-            register=False,
-            positional_args=None,
-        )
+        args = make_run_args(command=["build", "extra", "args"])
 
         # cmd_run should succeed - extra args become passthrough
         # The expanded command will be "echo build extra args"
@@ -501,29 +357,10 @@ class TestRunRegisteredCommand:
         assert "run_id" in captured.out
         assert '"command": "echo build extra args"' in captured.out
 
-    def test_run_unregistered_command_fails(self, initialized_project, capsys):
+    def test_run_unregistered_command_fails(self, initialized_project, make_run_args, capsys):
         """Unregistered command name fails with helpful error."""
-        import argparse
-
-        from blq.cli import cmd_run
-
         # Try to run 'notregistered' - should fail
-        args = argparse.Namespace(
-            command=["notregistered"],
-            name=None,
-            format="auto",
-            keep_raw=False,
-            json=True,
-            markdown=False,
-            quiet=False,
-            summary=False,
-            verbose=False,
-            include_warnings=False,
-            error_limit=20,
-            capture=None,
-            register=False,
-            positional_args=None,
-        )
+        args = make_run_args(command=["notregistered"])
 
         with pytest.raises(SystemExit) as exc_info:
             cmd_run(args)
@@ -1,6 +1,5 @@
 """Tests for the LogQuery and LogStore API."""
 
-import os
 from pathlib import Path
 
 import duckdb
@@ -13,24 +12,56 @@ from blq.query import LogQuery, LogStore
 # ============================================================================
 
 
+@pytest.fixture(scope="module")
+def events_db():
+    """One in-memory database holding every sample table, built once per module.
+
+    The LogQuery tests only read, so each test gets its own cursor on this
+    connection instead of rebuilding the tables.
+    """
+    conn = duckdb.connect(":memory:")
+    conn.execute("""
+        CREATE TABLE events AS
+        SELECT * FROM (VALUES
+            (1, 'error', 'main.c', 10, 'undefined var foo'),
+            (2, 'warning', 'utils.c', 20, 'unused var bar'),
+            (3, 'error', 'main.c', 30, 'missing semicolon'),
+            (4, 'info', 'test.c', 40, 'test passed'),
+            (5, 'warning', 'main.c', 50, 'deprecated function')
+        ) AS t(event_id, severity, file_path, line_number, message);
+
+        CREATE TABLE projection_events AS
+        SELECT * FROM (VALUES
+            (1, 'error', 'main.c', 10, 'msg1'),
+            (2, 'warning', 'utils.c', 20, 'msg2'),
+            (3, 'error', 'test.c', 30, 'msg3')
+        ) AS t(event_id, severity, file_path, line_number, message);
+
+        CREATE TABLE aggregation_events AS
+        SELECT * FROM (VALUES
+            (1, 'error', 'main.c', 10),
+            (2, 'warning', 'main.c', 20),
+            (3, 'error', 'utils.c', 30),
+            (4, 'error', 'main.c', 40)
+        ) AS t(event_id, severity, file_path, line_number);
+
+        CREATE TABLE execution_events AS
+        SELECT * FROM (VALUES
+            (1, 'error', 'msg1'),
+            (2, 'warning', 'msg2')
+        ) AS t(event_id, severity, message);
+    """)
+    yield conn
+    conn.close()
+
+
 class TestLogQueryBasic:
     """Basic LogQuery functionality tests."""
 
     @pytest.fixture
-    def conn_with_data(self):
+    def conn_with_data(self, events_db):
         """Create a connection with sample data."""
-        conn = duckdb.connect(":memory:")
-        conn.execute("""
-            CREATE TABLE events AS
-            SELECT * FROM (VALUES
-                (1, 'error', 'main.c', 10, 'undefined var foo'),
-                (2, 'warning', 'utils.c', 20, 'unused var bar'),
-                (3, 'error', 'main.c', 30, 'missing semicolon'),
-                (4, 'info', 'test.c', 40, 'test passed'),
-                (5, 'warning', 'main.c', 50, 'deprecated function')
-            ) AS t(event_id, severity, file_path, line_number, message)
-        """)
-        return conn
+        return events_db.cursor()
 
     def test_from_table(self, conn_with_data):
         """Create LogQuery from table."""
@@ -45,6 +76,19 @@ class TestLogQueryBasic:
         df = query.df()
         assert len(df) == 2
 
+    def test_chained_query_runs_as_one_statement(self, conn_with_data):
+        """Filter/order/select/limit on a table compose into one query."""
+        query = (
+            LogQuery.from_table(conn_with_data, "events")
+            .filter(severity="error")
+            .order_by("line_number", desc=True)
+            .select("event_id", "message")
+            .limit(1)
+        )
+        assert query.fetchall() == [(3, "missing semicolon")]
+        # The base table was never bound as a separate relation
+        assert query._base_rel is None
+
     def test_columns_property(self, conn_with_data):
         """Access column names."""
         query = LogQuery.from_table(conn_with_data, "events")
@@ -55,6 +99,7 @@ class TestLogQueryBasic:
         """Count rows."""
         query = LogQuery.from_table(conn_with_data, "events")
         assert query.count() == 5
+        assert query.filter(severity="error").count() == 2
 
     def test_exists(self, conn_with_data):
         """Check if rows exist."""
@@ -62,25 +107,20 @@ class TestLogQueryBasic:
         assert query.filter(severity="error").exists() is True
         assert query.filter(severity="critical").exists() is False
 
+    def test_exists_on_relation(self, conn_with_data):
+        """exists() also works on relation-backed queries."""
+        query = LogQuery.from_sql(conn_with_data, "SELECT * FROM events")
+        assert query.filter(severity="warning").exists() is True
+        assert query.filter(line_number=999).exists() is False
+
 
 class TestLogQueryFilter:
     """LogQuery filter functionality tests."""
 
     @pytest.fixture
-    def query(self):
+    def query(self, events_db):
         """Create a LogQuery with sample data."""
-        conn = duckdb.connect(":memory:")
-        conn.execute("""
-            CREATE TABLE events AS
-            SELECT * FROM (VALUES
-                (1, 'error', 'main.c', 10, 'undefined var foo'),
-                (2, 'warning', 'utils.c', 20, 'unused var bar'),
-                (3, 'error', 'main.c', 30, 'missing semicolon'),
-                (4, 'info', 'test.c', 40, 'test passed'),
-                (5, 'warning', 'main.c', 50, 'deprecated function')
-            ) AS t(event_id, severity, file_path, line_number, message)
-        """)
-        return LogQuery.from_table(conn, "events")
+        return LogQuery.from_table(events_db.cursor(), "events")
 
     def test_filter_exact_match(self, query):
         """Filter by exact value."""
@@ -132,18 +172,9 @@ class TestLogQueryProjection:
     """LogQuery select/order/limit tests."""
 
     @pytest.fixture
-    def query(self):
+    def query(self, events_db):
         """Create a LogQuery with sample data."""
-        conn = duckdb.connect(":memory:")
-        conn.execute("""
-            CREATE TABLE events AS
-            SELECT * FROM (VALUES
-                (1, 'error', 'main.c', 10, 'msg1'),
-                (2, 'warning', 'utils.c', 20, 'msg2'),
-                (3, 'error', 'test.c', 30, 'msg3')
-            ) AS t(event_id, severity, file_path, line_number, message)
-        """)
-        return LogQuery.from_table(conn, "events")
+        return LogQuery.from_table(events_db.cursor(), "projection_events")
 
     def test_select_columns(self, query):
         """Select specific columns."""
@@ -182,19 +213,9 @@ class TestLogQueryAggregation:
     """LogQuery aggregation tests."""
 
     @pytest.fixture
-    def query(self):
+    def query(self, events_db):
         """Create a LogQuery with sample data."""
-        conn = duckdb.connect(":memory:")
-        conn.execute("""
-            CREATE TABLE events AS
-            SELECT * FROM (VALUES
-                (1, 'error', 'main.c', 10),
-                (2, 'warning', 'main.c', 20),
-                (3, 'error', 'utils.c', 30),
-                (4, 'error', 'main.c', 40)
-            ) AS t(event_id, severity, file_path, line_number)
-        """)
-        return LogQuery.from_table(conn, "events")
+        return LogQuery.from_table(events_db.cursor(), "aggregation_events")
 
     def test_value_counts(self, query):
         """Count value occurrences."""
@@ -220,17 +241,9 @@ class TestLogQueryExecution:
     """LogQuery execution method tests."""
 
     @pytest.fixture
-    def query(self):
+    def query(self, events_db):
         """Create a LogQuery with sample data."""
-        conn = duckdb.connect(":memory:")
-        conn.execute("""
-            CREATE TABLE events AS
-            SELECT * FROM (VALUES
-                (1, 'error', 'msg1'),
-                (2, 'warning', 'msg2')
-            ) AS t(event_id, severity, message)
-        """)
-        return LogQuery.from_table(conn, "events")
+        return LogQuery.from_table(events_db.cursor(), "execution_events")
 
     def test_fetchall(self, query):
         """Fetch all as tuples."""
@@ -269,15 +282,27 @@ class TestLogStore:
         store = LogStore.open(Path(".lq"))
         assert store.path.exists()
 
+    def test_parquet_store_caches_metadata(self, lq_dir):
+        """Stores reading parquet keep footers cached across scans."""
+        store = LogStore(lq_dir)
+        setting = store.connection.execute(
+            "SELECT current_setting('parquet_metadata_cache')"
+        ).fetchone()
+        assert setting == (True,)
+
+    def test_initialized_project_caches_metadata(self, initialized_project):
+        """Parquet-mode projects read parquet through blq.duckdb, so cache footers."""
+        assert (initialized_project / ".lq" / "blq.duckdb").exists()
+        store = LogStore.open()
+        setting = store.connection.execute(
+            "SELECT current_setting('parquet_metadata_cache')"
+        ).fetchone()
+        assert setting == (True,)
+
     def test_open_not_found(self, temp_dir):
         """Open raises when .lq not found."""
-        original = os.getcwd()
-        try:
-            os.chdir(temp_dir)
-            with pytest.raises(FileNotFoundError):
-                LogStore.open()
-        finally:
-            os.chdir(original)
+        with pytest.raises(FileNotFoundError):
+            LogStore.open(start_dir=temp_dir)
 
     def test_events_returns_query(
         self, initialized_project, sample_build_script, run_adhoc_command
@@ -334,6 +359,19 @@ class TestLogStore:
 
         assert store.has_data() is True
 
+    def test_event_lookup(self, initialized_project):
+        """event() returns the row as a dict, or None on a miss."""
+        from blq.commands.core import write_run_parquet
+
+        events = [{"event_id": 1, "severity": "error", "message": "boom"}]
+        write_run_parquet(events, {"run_id": 1, "source_name": "build"}, Path(".lq"))
+
+        store = LogStore.open()
+        event = store.event(1, 1)
+        assert event["message"] == "boom"
+        assert event["source_name"] == "build"
+        assert store.event(1, 2) is None
+
     def test_connection_property(self, initialized_project):
         """connection property returns DuckDB connection."""
         store = LogStore.open()
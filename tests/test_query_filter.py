@@ -17,6 +17,62 @@ from blq.cli import (
     query_source,
 )
 
+_QUERY_ARGS = {
+    "files": [],
+    "select": None,
+    "filter": None,
+    "order": None,
+    "limit": None,
+    "json": False,
+    "csv": False,
+    "markdown": False,
+    "log_format": "auto",
+}
+
+_FILTER_ARGS = {
+    "args": [],
+    "invert": False,
+    "count": False,
+    "ignore_case": False,
+    "limit": None,
+    "json": False,
+    "csv": False,
+    "markdown": False,
+    "log_format": "auto",
+}
+
+
+def _query_args(**overrides):
+    """Build `blq query` args, overriding the CLI defaults as given."""
+    return argparse.Namespace(**{**_QUERY_ARGS, **overrides})
+
+
+def _filter_args(**overrides):
+    """Build `blq filter` args, overriding the CLI defaults as given."""
+    return argparse.Namespace(**{**_FILTER_ARGS, **overrides})
+
+
+@pytest.fixture(scope="module")
+def seeded_template(
+    tmp_path_factory,
+    initialized_template,
+    copy_template,
+    write_sample_build_script,
+    run_adhoc_command,
+):
+    """An initialized project holding one sample build, created once per module."""
+    template = copy_template(initialized_template, tmp_path_factory.mktemp("seeded_template"))
+    script = write_sample_build_script(template)
+    run_adhoc_command([str(script)], cwd=template)
+    return template
+
+
+@pytest.fixture
+def seeded_project(chdir_temp, seeded_template, copy_template):
+    """A project with sample build data (a copy of the module template)."""
+    return copy_template(seeded_template, chdir_temp)
+
+
 # ============================================================================
 # ConnectionFactory Tests
 # ============================================================================
@@ -68,6 +124,37 @@ class TestConnectionFactory:
         # Same result both times
         assert result1 == result2
 
+    def test_known_missing_duck_hunt_skips_load(self, monkeypatch):
+        """A failed probe is not repeated on later connections."""
+
+        class NoLoadConnection:
+            def execute(self, sql):
+                raise AssertionError(f"unexpected {sql!r}")
+
+        monkeypatch.setattr(ConnectionFactory, "_duck_hunt_available", False)
+        assert ConnectionFactory._load_duck_hunt(NoLoadConnection()) is False
+        assert ConnectionFactory.check_duck_hunt(NoLoadConnection()) is False
+
+    def test_only_failed_install_marks_duck_hunt_missing(self, monkeypatch):
+        """A failed LOAD is retried later; a failed INSTALL is remembered."""
+
+        class MissingExtensionConnection:
+            def __init__(self):
+                self.statements = []
+
+            def execute(self, sql):
+                self.statements.append(sql)
+                raise duckdb.Error("extension not found")
+
+        monkeypatch.setattr(ConnectionFactory, "_duck_hunt_available", None)
+        conn = MissingExtensionConnection()
+
+        assert ConnectionFactory._load_duck_hunt(conn) is False
+        assert ConnectionFactory._duck_hunt_available is None
+        assert ConnectionFactory.install_duck_hunt(conn) is False
+        assert ConnectionFactory._load_duck_hunt(conn) is False
+        assert conn.statements == ["LOAD duck_hunt", "INSTALL duck_hunt FROM community"]
+
 
 # ============================================================================
 # parse_filter_expression Tests
@@ -109,6 +196,11 @@ class TestParseFilterExpression:
         assert "severity" in result
         assert "Error" in result
 
+    def test_repeated_expression_is_cached(self):
+        """Repeated expressions reuse the translated clause."""
+        first = parse_filter_expression("severity=error,warning")
+        assert parse_filter_expression("severity=error,warning") is first
+
     def test_invalid_expression_raises(self):
         """Invalid expression raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
@@ -152,19 +244,15 @@ class TestFormatQueryOutput:
     def test_csv_format(self, sample_df):
         """Format as CSV."""
         result = format_query_output(sample_df, output_format="csv")
-        lines = result.strip().split("\n")
-        assert "severity" in lines[0]  # Header
-        assert "error" in lines[1]
+        header, first_row, _ = result.split("\n", 2)
+        assert "severity" in header
+        assert "error" in first_row
 
     def test_markdown_format(self, sample_df):
         """Format as Markdown."""
-        try:
-            result = format_query_output(sample_df, output_format="markdown")
-            assert "|" in result  # Markdown tables use pipes
-            assert "severity" in result
-        except ImportError:
-            # tabulate package not installed - skip
-            pytest.skip("tabulate not installed")
+        result = format_query_output(sample_df, output_format="markdown")
+        assert "|" in result  # Markdown tables use pipes
+        assert "severity" in result
 
     def test_limit_rows(self, sample_df):
         """Limit number of rows in output."""
@@ -181,13 +269,8 @@ class TestFormatQueryOutput:
 class TestQuerySource:
     """Tests for query_source function."""
 
-    def test_query_stored_events(
-        self, initialized_project, sample_build_script, run_adhoc_command, capsys
-    ):
+    def test_query_stored_events(self, seeded_project, capsys):
         """Query stored events without specifying a file."""
-        # First create some data
-        run_adhoc_command([str(sample_build_script)])
-
         lq_dir = Path(".lq")
         df = query_source(source=None, lq_dir=lq_dir)
 
@@ -195,22 +278,16 @@ class TestQuerySource:
         assert len(df) > 0
         assert "severity" in df.columns
 
-    def test_query_with_where(self, initialized_project, sample_build_script, run_adhoc_command):
+    def test_query_with_where(self, seeded_project):
         """Query with WHERE clause."""
-        # First create some data
-        run_adhoc_command([str(sample_build_script)])
-
         lq_dir = Path(".lq")
         df = query_source(source=None, where="severity = 'error'", lq_dir=lq_dir)
 
         # Should return only errors
         assert all(df["severity"] == "error")
 
-    def test_query_with_select(self, initialized_project, sample_build_script, run_adhoc_command):
+    def test_query_with_select(self, seeded_project):
         """Query with column selection."""
-        # First create some data
-        run_adhoc_command([str(sample_build_script)])
-
         lq_dir = Path(".lq")
         df = query_source(source=None, select="severity, message", lq_dir=lq_dir)
 
@@ -231,112 +308,45 @@ class TestQuerySource:
 class TestCmdQuery:
     """Tests for cmd_query command."""
 
-    def test_query_stored_data(
-        self, initialized_project, sample_build_script, run_adhoc_command, capsys
-    ):
+    def test_query_stored_data(self, seeded_project, capsys):
         """Query stored data without file argument."""
-        # Create some data first
-        run_adhoc_command([str(sample_build_script)])
-
-        capsys.readouterr()  # Clear
-
         # Query stored data
-        import argparse
-
-        args = argparse.Namespace(
-            files=[],
-            select=None,
-            filter=None,
-            order=None,
-            limit=None,
-            json=False,
-            csv=False,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _query_args()
         cmd_query(args)
 
         captured = capsys.readouterr()
         assert "severity" in captured.out
 
-    def test_query_with_json_output(
-        self, initialized_project, sample_build_script, run_adhoc_command, capsys
-    ):
+    def test_query_with_json_output(self, seeded_project, capsys):
         """Query with JSON output format."""
-        # Create some data
-        run_adhoc_command([str(sample_build_script)])
-
-        capsys.readouterr()
-
         # Query with JSON
-        import argparse
-
-        args = argparse.Namespace(
-            files=[],
-            select=None,
-            filter="severity='error'",
-            order=None,
-            limit=None,
-            json=True,
-            csv=False,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _query_args(filter="severity='error'", json=True)
         cmd_query(args)
 
         captured = capsys.readouterr()
         data = json.loads(captured.out)
         assert isinstance(data, list)
 
-    def test_query_with_csv_output(
-        self, initialized_project, sample_build_script, run_adhoc_command, capsys
-    ):
+    def test_query_with_csv_output(self, seeded_project, capsys):
         """Query with CSV output format."""
-        # Create some data
-        run_adhoc_command([str(sample_build_script)])
-
-        capsys.readouterr()
-
         # Query with CSV
-        import argparse
-
-        args = argparse.Namespace(
-            files=[],
-            select="severity,message",
-            filter=None,
-            order=None,
-            limit=None,
-            json=False,
-            csv=True,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _query_args(select="severity,message", csv=True)
         cmd_query(args)
 
         captured = capsys.readouterr()
-        lines = captured.out.strip().split("\n")
-        assert "severity" in lines[0]
+        header = captured.out.partition("\n")[0]
+        assert "severity" in header
 
     def test_query_file_not_found_exits(self, initialized_project, capsys):
         """Query non-existent file exits with error."""
-        args = argparse.Namespace(
-            files=["/nonexistent/file.log"],
-            select=None,
-            filter=None,
-            order=None,
-            limit=None,
-            json=False,
-            csv=False,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _query_args(files=["/nonexistent/file.log"])
 
         with pytest.raises(SystemExit) as exc_info:
             cmd_query(args)
 
         assert exc_info.value.code == 1
         captured = capsys.readouterr()
-        assert "not found" in captured.err.lower()
+        assert "not found" in captured.err
 
 
 # ============================================================================
@@ -347,53 +357,32 @@ class TestCmdQuery:
 class TestCmdFilter:
     """Tests for cmd_filter command."""
 
-    def test_filter_stored_data(
-        self, initialized_project, sample_build_script, run_adhoc_command, capsys
-    ):
+    def test_filter_stored_data(self, seeded_project, capsys):
         """Filter stored data."""
-        # Create some data
-        run_adhoc_command([str(sample_build_script)])
-
-        capsys.readouterr()
-
         # Filter errors only
-        args = argparse.Namespace(
-            args=["severity=error"],
-            invert=False,
-            count=False,
-            ignore_case=False,
-            limit=None,
-            json=False,
-            csv=False,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _filter_args(args=["severity=error"])
         cmd_filter(args)
 
         captured = capsys.readouterr()
-        assert "error" in captured.out.lower()
+        assert "error" in captured.out
 
-    def test_filter_count_mode(
-        self, initialized_project, sample_build_script, run_adhoc_command, capsys
-    ):
-        """Filter with count mode returns only count."""
-        # Create some data
-        run_adhoc_command([str(sample_build_script)])
+    def test_filter_count_mode_skips_dataframe(self, initialized_project, monkeypatch, capsys):
+        """Count mode counts in DuckDB without building a DataFrame."""
+        from blq.query import LogQuery
+
+        def fail_df(self):
+            raise AssertionError("DataFrame built")
+
+        monkeypatch.setattr(LogQuery, "df", fail_df)
+        args = _filter_args(args=["severity=error"], count=True)
+        cmd_filter(args)
 
-        capsys.readouterr()
+        assert capsys.readouterr().out.strip() == "0"
 
+    def test_filter_count_mode(self, seeded_project, capsys):
+        """Filter with count mode returns only count."""
         # Count errors
-        args = argparse.Namespace(
-            args=["severity=error"],
-            invert=False,
-            count=True,
-            ignore_case=False,
-            limit=None,
-            json=False,
-            csv=False,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _filter_args(args=["severity=error"], count=True)
         cmd_filter(args)
 
         captured = capsys.readouterr()
@@ -401,54 +390,20 @@ class TestCmdFilter:
         count = int(captured.out.strip())
         assert count > 0
 
-    def test_filter_invert(
-        self, initialized_project, sample_build_script, run_adhoc_command, capsys
-    ):
+    def test_filter_invert(self, seeded_project, capsys):
         """Filter with invert flag."""
-        # Create some data
-        run_adhoc_command([str(sample_build_script)])
-
-        capsys.readouterr()
-
         # Filter NOT errors (invert)
-        args = argparse.Namespace(
-            args=["severity=error"],
-            invert=True,
-            count=False,
-            ignore_case=False,
-            limit=None,
-            json=False,
-            csv=False,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _filter_args(args=["severity=error"], invert=True)
         cmd_filter(args)
 
         captured = capsys.readouterr()
         # Should not contain "error" as severity (may contain in message though)
-        assert "warning" in captured.out.lower()
+        assert "warning" in captured.out
 
-    def test_filter_multiple_expressions(
-        self, initialized_project, sample_build_script, run_adhoc_command, capsys
-    ):
+    def test_filter_multiple_expressions(self, seeded_project, capsys):
         """Filter with multiple expressions (AND)."""
-        # Create some data
-        run_adhoc_command([str(sample_build_script)])
-
-        capsys.readouterr()
-
         # Filter by severity AND file_path
-        args = argparse.Namespace(
-            args=["severity=error", "file_path~main"],
-            invert=False,
-            count=False,
-            ignore_case=False,
-            limit=None,
-            json=False,
-            csv=False,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _filter_args(args=["severity=error", "file_path~main"])
         cmd_filter(args)
 
         captured = capsys.readouterr()
@@ -456,27 +411,10 @@ class TestCmdFilter:
         # Just check it doesn't crash
         assert captured.out is not None
 
-    def test_filter_json_output(
-        self, initialized_project, sample_build_script, run_adhoc_command, capsys
-    ):
+    def test_filter_json_output(self, seeded_project, capsys):
         """Filter with JSON output."""
-        # Create some data
-        run_adhoc_command([str(sample_build_script)])
-
-        capsys.readouterr()
-
         # Filter with JSON output
-        args = argparse.Namespace(
-            args=["severity=error"],
-            invert=False,
-            count=False,
-            ignore_case=False,
-            limit=None,
-            json=True,
-            csv=False,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _filter_args(args=["severity=error"], json=True)
         cmd_filter(args)
 
         captured = capsys.readouterr()
@@ -485,46 +423,19 @@ class TestCmdFilter:
 
     def test_filter_file_not_found_exits(self, initialized_project, capsys):
         """Filter non-existent file exits with error."""
-        args = argparse.Namespace(
-            args=["severity=error", "/nonexistent/file.log"],
-            invert=False,
-            count=False,
-            ignore_case=False,
-            limit=None,
-            json=False,
-            csv=False,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _filter_args(args=["severity=error", "/nonexistent/file.log"])
 
         with pytest.raises(SystemExit) as exc_info:
             cmd_filter(args)
 
         assert exc_info.value.code == 1
         captured = capsys.readouterr()
-        assert "not found" in captured.err.lower()
+        assert "not found" in captured.err
 
-    def test_filter_or_values(
-        self, initialized_project, sample_build_script, run_adhoc_command, capsys
-    ):
+    def test_filter_or_values(self, seeded_project, capsys):
         """Filter with OR values (comma-separated)."""
-        # Create some data
-        run_adhoc_command([str(sample_build_script)])
-
-        capsys.readouterr()
-
         # Filter for errors OR warnings
-        args = argparse.Namespace(
-            args=["severity=error,warning"],
-            invert=False,
-            count=True,
-            ignore_case=False,
-            limit=None,
-            json=False,
-            csv=False,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _filter_args(args=["severity=error,warning"], count=True)
         cmd_filter(args)
 
         captured = capsys.readouterr()
@@ -532,27 +443,10 @@ class TestCmdFilter:
         # Should have both errors and warnings
         assert count >= 2
 
-    def test_filter_contains_pattern(
-        self, initialized_project, sample_build_script, run_adhoc_command, capsys
-    ):
+    def test_filter_contains_pattern(self, seeded_project, capsys):
         """Filter with contains pattern (~)."""
-        # Create some data
-        run_adhoc_command([str(sample_build_script)])
-
-        capsys.readouterr()
-
         # Filter by file path containing "main"
-        args = argparse.Namespace(
-            args=["file_path~main"],
-            invert=False,
-            count=True,
-            ignore_case=False,
-            limit=None,
-            json=False,
-            csv=False,
-            markdown=False,
-            log_format="auto",
-        )
+        args = _filter_args(args=["file_path~main"], count=True)
         cmd_filter(args)
 
         captured = capsys.readouterr()